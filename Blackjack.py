@@ -1,8 +1,18 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import os
 import random
 from typing import List, Tuple
 
+from Jetons import PilesMise, PlateauJetons
+from Planificateur import (CompteurImages, PlanificateurAnimation, PlanificateurRafraichissement,
+                           activer_mesures_si_demande, journal_mesures)
+from Portefeuille import Portefeuille
+from Rendu import Pixels
+
+VALEURS_CARTES = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
+COULEURS_CARTES = ['♠', '♥', '♦', '♣']
+
 class Carte:
     """Représente une carte à jouer"""
     def __init__(self, valeur: str, couleur: str):
@@ -45,7 +55,7 @@ class Carte:
 class JeuBlackjack:
     """Classe principale du jeu de blackjack"""
     
-    def __init__(self):
+    def __init__(self, portefeuille: Portefeuille = None):
         self.nombre_paquets = 6  # 6 paquets comme dans la plupart des casinos
         self.jeu_cartes = self.creer_jeu()
         self.main_joueur = []
@@ -53,22 +63,26 @@ class JeuBlackjack:
         self.points_joueur = 0
         self.points_croupier = 0
         self.jeu_termine = False
-        self.solde_joueur = 1000  # Solde initial de 1000 jetons
+        # Solde initial de 1000 jetons, ou portefeuille partagé avec d'autres jeux
+        self.portefeuille = portefeuille if portefeuille is not None else Portefeuille()
         self.mise_actuelle = 0
         self.mise_placee = False
         self.double_effectue = False  # Indique si le joueur a doublé
         self.point_coupure = int(len(self.jeu_cartes) * 0.1)  # Coupure à 10% du jeu
     
+    @property
+    def solde_joueur(self) -> int:
+        """Solde disponible du joueur, lu dans le portefeuille"""
+        return self.portefeuille.solde
+    
     def creer_jeu(self) -> List[Carte]:
         """Crée un jeu avec plusieurs paquets de 52 cartes"""
-        valeurs = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
-        couleurs = ['♠', '♥', '♦', '♣']
         jeu = []
         
         # Créer plusieurs paquets de cartes
         for _ in range(self.nombre_paquets):
-            for couleur in couleurs:
-                for valeur in valeurs:
+            for couleur in COULEURS_CARTES:
+                for valeur in VALEURS_CARTES:
                     jeu.append(Carte(valeur, couleur))
         
         return jeu
@@ -131,11 +145,10 @@ class JeuBlackjack:
     
     def placer_mise(self, montant: int) -> bool:
         """Place une mise. Retourne True si la mise est valide"""
-        if montant <= 0 or montant > self.solde_joueur:
+        if montant <= 0 or not self.portefeuille.debiter(montant):
             return False
         
         self.mise_actuelle = montant
-        self.solde_joueur -= montant
         self.mise_placee = True
         return True
     
@@ -169,7 +182,7 @@ class JeuBlackjack:
         """Finalise la partie et met à jour le solde"""
         if self.mise_placee:
             gains = self.calculer_gains()
-            self.solde_joueur += gains
+            self.portefeuille.crediter(gains)
             self.mise_actuelle = 0
             self.mise_placee = False
             return gains
@@ -194,12 +207,9 @@ class JeuBlackjack:
         if self.jeu_termine or self.double_effectue or len(self.main_joueur) != 2:
             return False
         
-        # Vérifier si le joueur a assez de jetons pour doubler
-        if self.solde_joueur < self.mise_actuelle:
+        # Doubler la mise, si le joueur a assez de jetons
+        if not self.portefeuille.debiter(self.mise_actuelle):
             return False
-        
-        # Doubler la mise
-        self.solde_joueur -= self.mise_actuelle
         self.mise_actuelle *= 2
         self.double_effectue = True
         
@@ -241,6 +251,293 @@ class JeuBlackjack:
         else:
             return "Égalité"
 
+class AtlasCartes:
+    """Images des 52 faces et du dos des cartes
+    
+    Toutes les cartes sont dessinées pixel par pixel sur une seule planche, enregistrée en
+    PNG dans le dossier .cache : les lancements suivants relisent simplement ce fichier.
+    Chaque carte est ensuite découpée une fois dans la planche.
+    """
+    
+    LARGEUR = 64
+    HAUTEUR = 88
+    VERSION = 1  # À incrémenter quand le dessin des cartes change
+    DOSSIER_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+    
+    _atlas = {}
+    
+    @classmethod
+    def pour(cls, widget) -> 'AtlasCartes':
+        """Retourne l'atlas de la fenêtre qui contient le widget"""
+        racine = widget._root()
+        atlas = cls._atlas.get(racine)
+        if atlas is None:
+            atlas = cls._atlas[racine] = cls(racine)
+        return atlas
+    
+    def __init__(self, racine):
+        self.racine = racine
+        self.images = {}  # (valeur, couleur) ou 'dos' -> PhotoImage
+        
+        planche = self.charger_planche()
+        if planche is None:
+            planche = self.generer_planche()
+        
+        for cle, (x, y) in self.positions().items():
+            image = tk.PhotoImage(master=racine, width=self.LARGEUR, height=self.HAUTEUR)
+            image.tk.call(image, 'copy', planche, '-from', x, y, x + self.LARGEUR, y + self.HAUTEUR)
+            self.images[cle] = image
+    
+    @classmethod
+    def positions(cls):
+        """Position de chaque carte sur la planche : une ligne par couleur, le dos en dernier"""
+        positions = {}
+        for ligne, couleur in enumerate(COULEURS_CARTES):
+            for colonne, valeur in enumerate(VALEURS_CARTES):
+                positions[(valeur, couleur)] = (colonne * cls.LARGEUR, ligne * cls.HAUTEUR)
+        positions['dos'] = (0, len(COULEURS_CARTES) * cls.HAUTEUR)
+        return positions
+    
+    @classmethod
+    def chemin_cache(cls) -> str:
+        return os.path.join(cls.DOSSIER_CACHE, f"cartes_v{cls.VERSION}_{cls.LARGEUR}x{cls.HAUTEUR}.png")
+    
+    def charger_planche(self):
+        """Relit la planche enregistrée, ou retourne None si elle n'existe pas ou est illisible"""
+        try:
+            return tk.PhotoImage(master=self.racine, file=self.chemin_cache())
+        except tk.TclError:
+            return None
+    
+    def generer_planche(self) -> tk.PhotoImage:
+        """Dessine toutes les cartes et enregistre la planche si possible"""
+        pixels = Pixels(len(VALEURS_CARTES) * self.LARGEUR, (len(COULEURS_CARTES) + 1) * self.HAUTEUR)
+        for cle, (x, y) in self.positions().items():
+            if cle == 'dos':
+                self.dessiner_dos(pixels, x, y)
+            else:
+                self.dessiner_face(pixels, x, y, *cle)
+        
+        planche = pixels.vers_photo(self.racine)
+        try:
+            os.makedirs(self.DOSSIER_CACHE, exist_ok=True)
+            planche.write(self.chemin_cache(), format='png')
+        except (OSError, tk.TclError):
+            pass  # Pas de cache disque : la planche sera redessinée au prochain lancement
+        return planche
+    
+    def dessiner_face(self, pixels: Pixels, x: int, y: int, valeur: str, couleur: str):
+        """Dessine une face : valeur dans les coins et grand symbole au centre"""
+        encre = '#E74C3C' if couleur in ['♥', '♦'] else '#2C3E50'
+        l, h = self.LARGEUR, self.HAUTEUR
+        pixels.rectangle_arrondi(x + 1, y + 1, x + l - 1, y + h - 1, 5, '#2C3E50')
+        pixels.rectangle_arrondi(x + 2, y + 2, x + l - 2, y + h - 2, 4, '#FFFFFF')
+        
+        pixels.texte(x + 13, y + 12, valeur, encre, 2)
+        pixels.texte(x + 13, y + 25, couleur, encre, 2)
+        pixels.texte(x + l / 2, y + h / 2, couleur, encre, 5)
+        pixels.texte(x + l - 13, y + h - 25, couleur, encre, 2)
+        pixels.texte(x + l - 13, y + h - 12, valeur, encre, 2)
+    
+    def dessiner_dos(self, pixels: Pixels, x: int, y: int):
+        """Dessine le dos des cartes (motif hachuré)"""
+        l, h = self.LARGEUR, self.HAUTEUR
+        pixels.rectangle_arrondi(x + 1, y + 1, x + l - 1, y + h - 1, 5, '#2C3E50')
+        pixels.rectangle_arrondi(x + 2, y + 2, x + l - 2, y + h - 2, 4, '#ECF0F1')
+        for j in range(7, h - 7):
+            ligne = pixels.lignes[y + j]
+            for i in range(7, l - 7):
+                if (i + j) % 6 < 2 or (i - j) % 6 < 2:
+                    ligne[x + i] = '#2C3E50'
+    
+    def image(self, cle) -> tk.PhotoImage:
+        """Image d'une carte : (valeur, couleur) ou 'dos'"""
+        return self.images[cle]
+
+# Contenu affiché pour une carte face cachée : clé dans l'atlas et marque de triche
+CONTENU_CARTE_CACHEE = ('dos', False)
+
+def placer_carte(canvas, elements, x: float, y: float):
+    """Place une carte (image et cadre de triche) avec son coin haut gauche en (x, y)"""
+    image, cadre = elements
+    canvas.coords(image, x, y)
+    canvas.coords(cadre, x, y, x + AtlasCartes.LARGEUR, y + AtlasCartes.HAUTEUR)
+
+class AnimationCartes:
+    """Distribution animée des cartes sur le canvas de la table
+    
+    Les déplacements demandés pendant un même tour de boucle Tk forment un lot : une seule
+    animation (PlanificateurAnimation) déplace toutes les cartes du lot à chaque image, chacune
+    le long d'un trajet calculé à l'avance. Les cartes sortent du sabot l'une après l'autre.
+    Un clic sur la table termine immédiatement la distribution.
+    """
+    
+    DUREE_TRAJET = 0.3  # Durée du trajet d'une carte (secondes)
+    DECALAGE = 0.12  # Écart entre deux cartes sorties du sabot (secondes)
+    FPS = 60
+    
+    def __init__(self, canvas, sabot: Tuple[float, float]):
+        self.canvas = canvas
+        self.sabot = sabot  # Coin haut gauche des cartes avant leur distribution
+        self.active = True  # Sans animation, les cartes sont posées directement
+        
+        self.trajets = {}  # éléments de la carte -> (points, début, fin, index du dernier point affiché)
+        self.nb_sorties = 0  # Cartes sorties du sabot dans le lot
+        self.animation = None
+        self.compteur = CompteurImages(self.FPS)
+        self.dernier_rapport = None  # Mesures du dernier lot (cadence et temps de rendu)
+        self._rappel = None
+    
+    def deplacer(self, elements, arrivee: Tuple[float, float], depuis_sabot: bool = False):
+        """Ajoute au lot le déplacement d'une carte vers arrivee (depuis le sabot ou sa place actuelle)"""
+        if not self.active:
+            placer_carte(self.canvas, elements, *arrivee)
+            return
+        
+        # Un nouveau lot termine d'abord la distribution en cours
+        if self.animation is not None and self.animation.en_cours:
+            self.animation.arreter()
+        
+        if elements in self.trajets:
+            # Déjà en attente dans ce lot : on garde son départ et son décalage
+            points, debut, _, _ = self.trajets[elements]
+            depart = points[0]
+        elif depuis_sabot:
+            depart = self.sabot
+            placer_carte(self.canvas, elements, *depart)
+            debut = self.nb_sorties * self.DECALAGE
+            self.nb_sorties += 1
+        else:
+            depart = tuple(self.canvas.coords(elements[0])[:2])
+            debut = 0.0
+        
+        points = self.calculer_trajet(depart, arrivee)
+        self.trajets[elements] = (points, debut, debut + self.DUREE_TRAJET, 0)
+        
+        if self._rappel is None:
+            self._rappel = self.canvas.after_idle(self.lancer)
+    
+    def calculer_trajet(self, depart: Tuple[float, float], arrivee: Tuple[float, float]) -> List[Tuple[float, float]]:
+        """Positions successives d'une carte, une par image, avec un ralentissement à l'arrivée"""
+        nb_points = max(2, int(self.DUREE_TRAJET * self.FPS) + 1)
+        (x1, y1), (x2, y2) = depart, arrivee
+        points = []
+        for i in range(nb_points):
+            t = i / (nb_points - 1)
+            t = 1 - (1 - t) ** 3
+            points.append((x1 + (x2 - x1) * t, y1 + (y2 - y1) * t))
+        return points
+    
+    def lancer(self):
+        """Démarre l'animation du lot en attente"""
+        self._rappel = None
+        if not self.trajets:
+            return
+        duree = max(fin for _, _, fin, _ in self.trajets.values())
+        self.animation = PlanificateurAnimation(self.canvas, duree, self.dessiner, self.terminer_lot,
+                                                fps=self.FPS, compteur=self.compteur)
+        self.animation.demarrer()
+    
+    def dessiner(self, progression: float):
+        """Affiche une image : toutes les cartes du lot sont déplacées dans le même passage"""
+        temps = progression * self.animation.duree
+        for elements, (points, debut, fin, dernier) in self.trajets.items():
+            if temps <= debut:
+                continue
+            index = min(len(points) - 1, int((temps - debut) / (fin - debut) * (len(points) - 1)))
+            if index != dernier:
+                placer_carte(self.canvas, elements, *points[index])
+                self.trajets[elements] = (points, debut, fin, index)
+    
+    def terminer_lot(self):
+        """Fin du lot : les mesures restent consultables et sont journalisées si demandé"""
+        self.trajets = {}
+        self.nb_sorties = 0
+        self.dernier_rapport = self.compteur.rapport()
+        journal_mesures.info("Distribution des cartes : %s", self.dernier_rapport)
+    
+    def passer(self, event=None):
+        """Termine immédiatement la distribution : toutes les cartes rejoignent leur place"""
+        if self._rappel is not None:
+            # Lot pas encore démarré
+            self.canvas.after_cancel(self._rappel)
+            self._rappel = None
+            for elements, (points, _, _, _) in self.trajets.items():
+                placer_carte(self.canvas, elements, *points[-1])
+            self.trajets = {}
+            self.nb_sorties = 0
+        elif self.animation is not None:
+            self.animation.arreter()
+
+class EmplacementsCartes:
+    """Emplacements réutilisables pour afficher les cartes d'une main sur la table
+    
+    Chaque position a son image sur le canvas de la table, créée quand une carte y est
+    distribuée pour la première fois puis seulement modifiée si la carte affichée change.
+    Les emplacements en trop sont masqués et resservent à la main suivante. La main
+    reste centrée : quand le nombre de cartes change, les cartes sont simplement déplacées,
+    par l'animation de distribution si elle est fournie.
+    """
+    
+    ECART = 8  # Espace entre deux cartes
+    
+    def __init__(self, canvas, y: int, largeur_table: int, animation: AnimationCartes = None):
+        self.canvas = canvas
+        self.y = y
+        self.largeur_table = largeur_table
+        self.animation = animation
+        self.atlas = AtlasCartes.pour(canvas)
+        self.elements = []  # (image, cadre de triche) par emplacement
+        self.contenus = []  # (clé dans l'atlas, révélée par la triche) affiché par emplacement
+        self.nb_affiches = 0
+    
+    def position(self, index: int, nombre: int) -> Tuple[float, float]:
+        """Coin haut gauche de la carte d'index donné dans une main de nombre cartes"""
+        pas = AtlasCartes.LARGEUR + self.ECART
+        debut = (self.largeur_table - (nombre * pas - self.ECART)) / 2
+        return debut + index * pas, self.y
+    
+    def afficher(self, contenus: List[Tuple[object, bool]]):
+        """Affiche une carte par contenu, en ne touchant que les emplacements qui changent"""
+        nombre = len(contenus)
+        for i, contenu in enumerate(contenus):
+            if i == len(self.elements):
+                image = self.canvas.create_image(0, 0, anchor='nw', state='hidden', tags="carte")
+                cadre = self.canvas.create_rectangle(0, 0, AtlasCartes.LARGEUR, AtlasCartes.HAUTEUR,
+                                                     outline='#F39C12', width=3, state='hidden', tags="carte")
+                self.elements.append((image, cadre))
+                self.contenus.append(None)
+            
+            image, cadre = self.elements[i]
+            if self.contenus[i] != contenu:
+                cle, revelee = contenu
+                self.canvas.itemconfig(image, image=self.atlas.image(cle))
+                self.canvas.itemconfig(cadre, state='normal' if revelee else 'hidden')
+                self.contenus[i] = contenu
+            
+            # Recentrer la main seulement quand le nombre de cartes change
+            if i >= self.nb_affiches or nombre != self.nb_affiches:
+                arrivee = self.position(i, nombre)
+                if self.animation is not None:
+                    # Les nouvelles cartes partent du sabot, les autres glissent vers leur place
+                    self.animation.deplacer(self.elements[i], arrivee, depuis_sabot=i >= self.nb_affiches)
+                else:
+                    placer_carte(self.canvas, self.elements[i], *arrivee)
+            if i >= self.nb_affiches:
+                self.canvas.itemconfig(image, state='normal')
+                if self.contenus[i][1]:
+                    self.canvas.itemconfig(cadre, state='normal')
+        
+        for i in range(nombre, self.nb_affiches):
+            image, cadre = self.elements[i]
+            self.canvas.itemconfig(image, state='hidden')
+            self.canvas.itemconfig(cadre, state='hidden')
+        self.nb_affiches = nombre
+    
+    def vider(self):
+        """Retire toutes les cartes de la table : les prochaines repartiront du sabot"""
+        self.afficher([])
+
 class InterfaceBlackjack:
     """Interface graphique du jeu de blackjack"""
     
@@ -252,9 +549,17 @@ class InterfaceBlackjack:
         self.root.configure(bg='#0d5016')
         self.root.minsize(900, 700)  # Taille minimale pour s'assurer que tout est visible
         
+        self.creer_rafraichissement()
         self.creer_interface()
         self.nouvelle_partie()
     
+    def creer_rafraichissement(self):
+        """Prépare le rafraîchissement différé de la zone de mise, des jetons et des cartes"""
+        self.rafraichissement = PlanificateurRafraichissement(self.root)
+        self.rafraichissement.enregistrer('mise', self.mettre_a_jour_affichage_mise)
+        self.rafraichissement.enregistrer('jetons', self.creer_jetons_disponibles)
+        self.rafraichissement.enregistrer('cartes', self.afficher_cartes)
+    
     def creer_interface(self):
         """Crée l'interface utilisateur"""
         # Titre avec fonction de triche
@@ -295,42 +600,8 @@ class InterfaceBlackjack:
                                              fg='#87CEEB', bg='#0d5016')
         self.label_cartes_restantes.pack(side=tk.LEFT, padx=20)
         
-        # Frame pour les cartes du croupier
-        frame_croupier = tk.Frame(self.root, bg='#0d5016')
-        frame_croupier.pack(pady=5)
-        
-        tk.Label(frame_croupier, text="Croupier", 
-                font=('Arial', 16, 'bold'), 
-                fg='white', bg='#0d5016').pack()
-        
-        self.frame_cartes_croupier = tk.Frame(frame_croupier, bg='#0d5016')
-        self.frame_cartes_croupier.pack()
-        
-        self.label_points_croupier = tk.Label(frame_croupier, 
-                                            font=('Arial', 12), 
-                                            fg='yellow', bg='#0d5016')
-        self.label_points_croupier.pack()
-        
-        # Séparateur
-        tk.Label(self.root, text="─" * 50, 
-                font=('Courier', 14), 
-                fg='white', bg='#0d5016').pack(pady=5)
-        
-        # Frame pour les cartes du joueur
-        frame_joueur = tk.Frame(self.root, bg='#0d5016')
-        frame_joueur.pack(pady=5)
-        
-        tk.Label(frame_joueur, text="Vos cartes", 
-                font=('Arial', 16, 'bold'), 
-                fg='white', bg='#0d5016').pack()
-        
-        self.frame_cartes_joueur = tk.Frame(frame_joueur, bg='#0d5016')
-        self.frame_cartes_joueur.pack()
-        
-        self.label_points_joueur = tk.Label(frame_joueur, 
-                                          font=('Arial', 12), 
-                                          fg='yellow', bg='#0d5016')
-        self.label_points_joueur.pack()
+        # Table des cartes (croupier et joueur)
+        self.creer_table_cartes(self.root)
         
         # Zone de mise avec jetons
         frame_zone_mise = tk.Frame(self.root, bg='#0d5016')
@@ -343,6 +614,7 @@ class InterfaceBlackjack:
                                  relief='solid', bd=3)
         self.zone_mise.pack(pady=3)
         self.zone_mise.pack_propagate(False)
+        self.piles_mise = PilesMise(self.zone_mise, self.retirer_jeton_de_la_mise)
         
         # Label d'instruction (en dehors de la zone de mise)
         tk.Label(frame_zone_mise, text="Zone de mise (glissez-déposez les jetons)", 
@@ -377,9 +649,11 @@ class InterfaceBlackjack:
         
         self.frame_jetons_disponibles = tk.Frame(frame_jetons, bg='#0d5016')
         self.frame_jetons_disponibles.pack(pady=3)
+        self.plateau_jetons = PlateauJetons(self.frame_jetons_disponibles, self.commencer_deplacement,
+                                            self.deplacer_jeton, self.terminer_deplacement)
         
         # Variables pour le drag & drop
-        self.jetons_places = []  # Liste des jetons placés dans la zone de mise
+        self.jetons_places = {}  # Nombre de jetons placés dans la zone de mise, par valeur
         self.mise_totale = 0
         self.jeton_en_cours_deplacement = None
         
@@ -436,6 +710,38 @@ class InterfaceBlackjack:
                                     fg='#ffd700', bg='#0d5016')
         self.label_message.pack(pady=5)
     
+    def creer_table_cartes(self, parent):
+        """Crée le canvas unique sur lequel sont posées les cartes du croupier et du joueur"""
+        largeur, hauteur = 800, 330
+        self.table_cartes = tk.Canvas(parent, width=largeur, height=hauteur,
+                                      bg='#0d5016', highlightthickness=0)
+        self.table_cartes.pack(pady=5)
+        
+        # Sabot à droite de la table, d'où partent les cartes distribuées ; un clic passe l'animation
+        sabot = (largeur - AtlasCartes.LARGEUR - 20, 120)
+        self.table_cartes.create_image(*sabot, anchor='nw', image=AtlasCartes.pour(parent).image('dos'))
+        self.animation_cartes = AnimationCartes(self.table_cartes, sabot)
+        self.table_cartes.bind('<Button-1>', self.animation_cartes.passer)
+        
+        # Croupier en haut, joueur en bas, séparés par un trait
+        self.table_cartes.create_text(largeur / 2, 15, text="Croupier", 
+                                      font=('Arial', 16, 'bold'), fill='white')
+        self.emplacements_croupier = EmplacementsCartes(self.table_cartes, 32, largeur, self.animation_cartes)
+        self.label_points_croupier = tk.Label(self.table_cartes, 
+                                            font=('Arial', 12), 
+                                            fg='yellow', bg='#0d5016')
+        self.table_cartes.create_window(largeur / 2, 135, window=self.label_points_croupier)
+        
+        self.table_cartes.create_line(largeur / 2 - 250, 160, largeur / 2 + 250, 160, fill='white')
+        
+        self.table_cartes.create_text(largeur / 2, 180, text="Vos cartes", 
+                                      font=('Arial', 16, 'bold'), fill='white')
+        self.emplacements_joueur = EmplacementsCartes(self.table_cartes, 197, largeur, self.animation_cartes)
+        self.label_points_joueur = tk.Label(self.table_cartes, 
+                                          font=('Arial', 12), 
+                                          fg='yellow', bg='#0d5016')
+        self.table_cartes.create_window(largeur / 2, 305, window=self.label_points_joueur)
+    
     def afficher_cartes(self):
         """Affiche les cartes des deux joueurs"""
         # Mettre à jour l'affichage du solde et de la mise
@@ -462,7 +768,7 @@ class InterfaceBlackjack:
         
         # Cartes du croupier
         if self.jeu.main_croupier:
-            self.afficher_cartes_avec_couleurs(self.jeu.main_croupier, self.frame_cartes_croupier)
+            self.afficher_cartes_avec_couleurs(self.jeu.main_croupier, self.emplacements_croupier)
             # Afficher les points du croupier seulement si toutes ses cartes sont visibles ou si on triche
             if not any(carte.face_cachee for carte in self.jeu.main_croupier) or self.triche_activee:
                 self.label_points_croupier.config(text=f"Points: {self.jeu.points_croupier}")
@@ -474,7 +780,7 @@ class InterfaceBlackjack:
         
         # Cartes du joueur
         if self.jeu.main_joueur:
-            self.afficher_cartes_avec_couleurs(self.jeu.main_joueur, self.frame_cartes_joueur)
+            self.afficher_cartes_avec_couleurs(self.jeu.main_joueur, self.emplacements_joueur)
             self.label_points_joueur.config(text=f"Points: {self.jeu.points_joueur}")
     
     def afficher_cartes_vides(self):
@@ -501,47 +807,13 @@ class InterfaceBlackjack:
         
         self.label_cartes_restantes.config(text=f"🃏 Cartes: {cartes_restantes}/{total_cartes} ({pourcentage:.1f}%)", fg=couleur)
         
-        # Afficher des cartes vides pour le croupier
-        for widget in self.frame_cartes_croupier.winfo_children():
-            widget.destroy()
-        
-        frame_cartes_vides_croupier = tk.Frame(self.frame_cartes_croupier, bg='#0d5016')
-        frame_cartes_vides_croupier.pack()
-        
         # Afficher 2 cartes face cachée pour le croupier
-        for i in range(2):
-            carte_vide = tk.Label(frame_cartes_vides_croupier, 
-                                text="┌─────┐\n│ ░░░ │\n│░░░░░│\n│ ░░░ │\n└─────┘",
-                                font=('Courier New', 12, 'bold'),
-                                fg='#2C3E50', bg='#ECF0F1',
-                                justify=tk.LEFT,
-                                relief='flat',
-                                bd=0,
-                                padx=0,
-                                pady=0)
-            carte_vide.pack(side=tk.LEFT, padx=(0, 8))
+        self.emplacements_croupier.afficher([CONTENU_CARTE_CACHEE] * 2)
         
         self.label_points_croupier.config(text="Points: ?")
         
-        # Afficher des cartes vides pour le joueur
-        for widget in self.frame_cartes_joueur.winfo_children():
-            widget.destroy()
-        
-        frame_cartes_vides_joueur = tk.Frame(self.frame_cartes_joueur, bg='#0d5016')
-        frame_cartes_vides_joueur.pack()
-        
         # Afficher 2 cartes face cachée pour le joueur
-        for i in range(2):
-            carte_vide = tk.Label(frame_cartes_vides_joueur, 
-                                text="┌─────┐\n│ ░░░ │\n│░░░░░│\n│ ░░░ │\n└─────┘",
-                                font=('Courier New', 12, 'bold'),
-                                fg='#2C3E50', bg='#ECF0F1',
-                                justify=tk.LEFT,
-                                relief='flat',
-                                bd=0,
-                                padx=0,
-                                pady=0)
-            carte_vide.pack(side=tk.LEFT, padx=(0, 8))
+        self.emplacements_joueur.afficher([CONTENU_CARTE_CACHEE] * 2)
         
         self.label_points_joueur.config(text="Points: ?")
     
@@ -580,11 +852,9 @@ class InterfaceBlackjack:
             cartes_croupier[0].face_cachee = True  # Première carte du croupier cachée
         
         # Afficher les cartes du croupier
-        for widget in self.frame_cartes_croupier.winfo_children():
-            widget.destroy()
+        self.emplacements_croupier.afficher([self.contenu_carte(carte) for carte in cartes_croupier])
         
         if cartes_croupier:
-            self.afficher_cartes_avec_couleurs(cartes_croupier, self.frame_cartes_croupier)
             # Calculer les points du croupier
             points_croupier = self.jeu.calculer_points(cartes_croupier)
             if cartes_croupier[0].face_cachee:
@@ -596,11 +866,9 @@ class InterfaceBlackjack:
             self.label_points_croupier.config(text="Points: ?")
         
         # Afficher les cartes du joueur
-        for widget in self.frame_cartes_joueur.winfo_children():
-            widget.destroy()
+        self.emplacements_joueur.afficher([self.contenu_carte(carte) for carte in cartes_joueur])
         
         if cartes_joueur:
-            self.afficher_cartes_avec_couleurs(cartes_joueur, self.frame_cartes_joueur)
             # Calculer les points du joueur
             points_joueur = self.jeu.calculer_points(cartes_joueur)
             self.label_points_joueur.config(text=f"Points: {points_joueur}")
@@ -608,124 +876,8 @@ class InterfaceBlackjack:
             self.label_points_joueur.config(text="Points: ?")
     
     def creer_jetons_disponibles(self):
-        """Crée les jetons disponibles pour le drag & drop"""
-        # Effacer les jetons existants
-        for widget in self.frame_jetons_disponibles.winfo_children():
-            widget.destroy()
-        
-        # Créer des jetons de différentes valeurs avec design réaliste de casino
-        valeurs_jetons = [5, 10, 25, 50, 100, 500]
-        
-        # Couleurs authentiques des jetons de casino (inspirées de la photo)
-        designs_jetons = {
-            5: {
-                'couleur_centre': '#FFFFFF',
-                'couleur_inner': '#4A90E2',  # Bleu
-                'couleur_outer': '#E8F4FD',
-                'couleur_texte': '#000000',
-                'couleur_texte_inner': '#FFFFFF',
-                'symbole': '●'
-            },
-            10: {
-                'couleur_centre': '#FFD700',  # Jaune
-                'couleur_inner': '#DC143C',  # Rouge
-                'couleur_outer': '#FFF8DC',
-                'couleur_texte': '#000000',
-                'couleur_texte_inner': '#FFFFFF',
-                'symbole': '●'
-            },
-            25: {
-                'couleur_centre': '#32CD32',  # Vert
-                'couleur_inner': '#87CEEB',  # Bleu clair
-                'couleur_outer': '#F0FFF0',
-                'couleur_texte': '#000000',
-                'couleur_texte_inner': '#000000',
-                'symbole': '●'
-            },
-            50: {
-                'couleur_centre': '#4169E1',  # Bleu royal
-                'couleur_inner': '#DC143C',  # Rouge
-                'couleur_outer': '#E6F3FF',
-                'couleur_texte': '#FFFFFF',
-                'couleur_texte_inner': '#FFFFFF',
-                'symbole': '●'
-            },
-            100: {
-                'couleur_centre': '#000000',  # Noir
-                'couleur_inner': '#FFD700',  # Jaune
-                'couleur_outer': '#F5F5F5',
-                'couleur_texte': '#FFFFFF',
-                'couleur_texte_inner': '#000000',
-                'symbole': '●'
-            },
-            500: {
-                'couleur_centre': '#191970',  # Bleu marine
-                'couleur_inner': '#FFFFFF',  # Blanc
-                'couleur_outer': '#E6F3FF',
-                'couleur_texte': '#FFFFFF',
-                'couleur_texte_inner': '#000000',
-                'symbole': '●'
-            }
-        }
-        
-        for valeur in valeurs_jetons:
-            if self.jeu.solde_joueur >= valeur:  # Seulement si on peut se permettre au moins un jeton
-                # Calculer combien de jetons de cette valeur on peut se permettre
-                quantite_max = self.jeu.solde_joueur // valeur
-                
-                design = designs_jetons[valeur]
-                
-                # Créer un canvas pour dessiner le jeton réaliste
-                canvas = tk.Canvas(self.frame_jetons_disponibles, 
-                                 width=60, height=60,
-                                 bg='#0d5016', highlightthickness=0)
-                canvas.pack(side=tk.LEFT, padx=3, pady=3)
-                
-                # Dessiner le jeton avec des cercles concentriques
-                self.dessiner_jeton_realiste(canvas, valeur, design, quantite_max)
-                
-                # Lier les événements de drag & drop
-                canvas.bind('<Button-1>', lambda e, v=valeur: self.commencer_deplacement(e, v))
-                canvas.bind('<B1-Motion>', self.deplacer_jeton)
-                canvas.bind('<ButtonRelease-1>', self.terminer_deplacement)
-    
-    def dessiner_jeton_realiste(self, canvas, valeur, design, quantite_max):
-        """Dessine un jeton réaliste avec des cercles concentriques"""
-        # Cercle extérieur (bordure)
-        canvas.create_oval(5, 5, 55, 55, 
-                          fill=design['couleur_outer'], 
-                          outline='#C0C0C0', width=2)
-        
-        # Cercle intérieur (bande avec texte)
-        canvas.create_oval(10, 10, 50, 50, 
-                          fill=design['couleur_inner'], 
-                          outline='#A0A0A0', width=1)
-        
-        # Cercle central (valeur)
-        canvas.create_oval(18, 18, 42, 42, 
-                          fill=design['couleur_centre'], 
-                          outline='#808080', width=1)
-        
-        # Texte de la valeur au centre
-        canvas.create_text(30, 30, text=f"${valeur}", 
-                          font=('Arial', 8, 'bold'),
-                          fill=design['couleur_texte'])
-        
-        # Texte "CASINO" dans la bande intérieure
-        canvas.create_text(30, 20, text="CASINO", 
-                          font=('Arial', 4, 'bold'),
-                          fill=design['couleur_texte_inner'])
-        
-        # Texte "POKER" dans la bande intérieure
-        canvas.create_text(30, 40, text="POKER", 
-                          font=('Arial', 4, 'bold'),
-                          fill=design['couleur_texte_inner'])
-        
-        # Indicateur de quantité si plus d'un jeton possible
-        if quantite_max > 1:
-            canvas.create_text(30, 50, text=f"max {quantite_max}", 
-                              font=('Arial', 3),
-                              fill='#666666')
+        """Met à jour le plateau de jetons disponibles selon le solde"""
+        self.plateau_jetons.mettre_a_jour(self.jeu.solde_joueur)
     
     def commencer_deplacement(self, event, valeur):
         """Commence le déplacement d'un jeton"""
@@ -769,208 +921,38 @@ class InterfaceBlackjack:
     
     def ajouter_jeton_a_la_mise(self, valeur):
         """Ajoute un jeton à la mise"""
-        if self.jeu.solde_joueur >= valeur:  # Vérifier qu'on peut encore se permettre ce jeton
-            self.jetons_places.append(valeur)
+        # Le jeton est mis de côté dans le portefeuille jusqu'à la confirmation de la mise
+        if self.jeu.portefeuille.reserver(valeur):
+            self.jetons_places[valeur] = self.jetons_places.get(valeur, 0) + 1
             self.mise_totale += valeur
-            self.jeu.solde_joueur -= valeur
-            self.mettre_a_jour_affichage_mise()
-            self.creer_jetons_disponibles()  # Recréer les jetons avec le nouveau solde
+            # Redessiner la mise et les jetons une seule fois, même en cas de clics rapides
+            self.rafraichissement.marquer('mise', 'jetons')
         else:
             self.label_message.config(text="❌ Pas assez de jetons pour cette valeur !")
     
     def retirer_jeton_de_la_mise(self, valeur):
         """Retire un jeton de la mise"""
-        if valeur in self.jetons_places:
-            self.jetons_places.remove(valeur)
+        if self.jetons_places.get(valeur):
+            self.jetons_places[valeur] -= 1
+            if not self.jetons_places[valeur]:
+                del self.jetons_places[valeur]
             self.mise_totale -= valeur
-            self.jeu.solde_joueur += valeur
-            self.mettre_a_jour_affichage_mise()
-            self.creer_jetons_disponibles()
-            self.afficher_cartes()  # Mettre à jour l'affichage du solde
+            self.jeu.portefeuille.liberer(valeur)
+            self.rafraichissement.marquer('mise', 'jetons', 'cartes')  # Les cartes affichent le solde
             self.label_message.config(text=f"Jeton de {valeur} retiré de la mise")
     
     def mettre_a_jour_affichage_mise(self):
-        """Met à jour l'affichage de la mise"""
+        """Met à jour l'affichage de la mise (seules les piles modifiées sont redessinées)"""
         self.label_mise_totale.config(text=f"Mise: {self.mise_totale} jetons")
-        
-        # Afficher les jetons placés
-        # Détruire tous les widgets de la zone de mise
-        for widget in self.zone_mise.winfo_children():
-            widget.destroy()
-        
-        if self.jetons_places:
-            # Compter les jetons par valeur
-            compteur_jetons = {}
-            for valeur in self.jetons_places:
-                compteur_jetons[valeur] = compteur_jetons.get(valeur, 0) + 1
-            
-            # Afficher les piles de jetons
-            frame_jetons_places = tk.Frame(self.zone_mise, bg='#2E7D32')
-            frame_jetons_places.pack(pady=5)
-            
-            # Ajouter un label d'instruction
-            tk.Label(frame_jetons_places, text="Cliquez sur un jeton pour le retirer:", 
-                    font=('Arial', 8, 'bold'), 
-                    fg='white', bg='#2E7D32').pack(pady=2)
-            
-            # Designs des jetons (même que pour les jetons disponibles)
-            designs_jetons = {
-                5: {
-                    'couleur_centre': '#FFFFFF',
-                    'couleur_inner': '#4A90E2',  # Bleu
-                    'couleur_outer': '#E8F4FD',
-                    'couleur_texte': '#000000',
-                    'couleur_texte_inner': '#FFFFFF',
-                    'symbole': '●'
-                },
-                10: {
-                    'couleur_centre': '#FFD700',  # Jaune
-                    'couleur_inner': '#DC143C',  # Rouge
-                    'couleur_outer': '#FFF8DC',
-                    'couleur_texte': '#000000',
-                    'couleur_texte_inner': '#FFFFFF',
-                    'symbole': '●'
-                },
-                25: {
-                    'couleur_centre': '#32CD32',  # Vert
-                    'couleur_inner': '#87CEEB',  # Bleu clair
-                    'couleur_outer': '#F0FFF0',
-                    'couleur_texte': '#000000',
-                    'couleur_texte_inner': '#000000',
-                    'symbole': '●'
-                },
-                50: {
-                    'couleur_centre': '#4169E1',  # Bleu royal
-                    'couleur_inner': '#DC143C',  # Rouge
-                    'couleur_outer': '#E6F3FF',
-                    'couleur_texte': '#FFFFFF',
-                    'couleur_texte_inner': '#FFFFFF',
-                    'symbole': '●'
-                },
-                100: {
-                    'couleur_centre': '#000000',  # Noir
-                    'couleur_inner': '#FFD700',  # Jaune
-                    'couleur_outer': '#F5F5F5',
-                    'couleur_texte': '#FFFFFF',
-                    'couleur_texte_inner': '#000000',
-                    'symbole': '●'
-                },
-                500: {
-                    'couleur_centre': '#191970',  # Bleu marine
-                    'couleur_inner': '#FFFFFF',  # Blanc
-                    'couleur_outer': '#E6F3FF',
-                    'couleur_texte': '#FFFFFF',
-                    'couleur_texte_inner': '#000000',
-                    'symbole': '●'
-                }
-            }
-            
-            for valeur, quantite in compteur_jetons.items():
-                design = designs_jetons.get(valeur, designs_jetons[5])  # Fallback au jeton de 5
-                
-                # Créer un canvas rond pour chaque jeton (comme les vrais jetons de casino)
-                canvas_jeton = tk.Canvas(frame_jetons_places, 
-                                       width=40, height=40,
-                                       bg='#2E7D32', highlightthickness=0)
-                canvas_jeton.pack(side=tk.LEFT, padx=2, pady=2)
-                
-                # Dessiner le jeton rond avec des cercles concentriques
-                self.dessiner_jeton_place_ronde(canvas_jeton, valeur, design, quantite)
-                
-                # Lier l'événement de clic pour retirer le jeton
-                canvas_jeton.bind('<Button-1>', lambda e, v=valeur: self.retirer_jeton_de_la_mise(v))
-                canvas_jeton.bind('<Enter>', lambda e: e.widget.configure(cursor='hand2'))
-                canvas_jeton.bind('<Leave>', lambda e: e.widget.configure(cursor=''))
-    
-    def dessiner_jeton_place_ronde(self, canvas, valeur, design, quantite):
-        """Dessine un jeton rond placé dans la zone de mise"""
-        # Cercle extérieur (bordure)
-        canvas.create_oval(2, 2, 38, 38, 
-                          fill=design['couleur_outer'], 
-                          outline='#C0C0C0', width=1)
-        
-        # Cercle intérieur (bande avec texte)
-        canvas.create_oval(6, 6, 34, 34, 
-                          fill=design['couleur_inner'], 
-                          outline='#A0A0A0', width=1)
-        
-        # Cercle central (valeur)
-        canvas.create_oval(12, 12, 28, 28, 
-                          fill=design['couleur_centre'], 
-                          outline='#808080', width=1)
-        
-        # Texte de la valeur au centre
-        canvas.create_text(20, 20, text=f"${valeur}", 
-                          font=('Arial', 6, 'bold'),
-                          fill=design['couleur_texte'])
-        
-        # Texte "CASINO" dans la bande intérieure
-        canvas.create_text(20, 15, text="CASINO", 
-                          font=('Arial', 2, 'bold'),
-                          fill=design['couleur_texte_inner'])
-        
-        # Texte "POKER" dans la bande intérieure
-        canvas.create_text(20, 25, text="POKER", 
-                          font=('Arial', 2, 'bold'),
-                          fill=design['couleur_texte_inner'])
-        
-        # Indicateur de quantité si plus d'un jeton
-        if quantite > 1:
-            canvas.create_text(20, 32, text=f"×{quantite}", 
-                              font=('Arial', 3, 'bold'),
-                              fill='#FF0000')  # Rouge pour indiquer qu'on peut cliquer
-        
-        # Ajouter un indicateur de clic
-        canvas.create_text(20, 35, text="CLIC", 
-                          font=('Arial', 2, 'bold'),
-                          fill='#FF0000')
-    
-    def dessiner_jeton_place(self, canvas, valeur, design, quantite):
-        """Dessine un jeton placé dans la zone de mise (ancienne version)"""
-        # Cercle extérieur (bordure)
-        canvas.create_oval(3, 3, 47, 47, 
-                          fill=design['couleur_outer'], 
-                          outline='#C0C0C0', width=2)
-        
-        # Cercle intérieur (bande avec texte)
-        canvas.create_oval(8, 8, 42, 42, 
-                          fill=design['couleur_inner'], 
-                          outline='#A0A0A0', width=1)
-        
-        # Cercle central (valeur)
-        canvas.create_oval(15, 15, 35, 35, 
-                          fill=design['couleur_centre'], 
-                          outline='#808080', width=1)
-        
-        # Texte de la valeur au centre
-        canvas.create_text(25, 25, text=f"${valeur}", 
-                          font=('Arial', 7, 'bold'),
-                          fill=design['couleur_texte'])
-        
-        # Texte "CASINO" dans la bande intérieure
-        canvas.create_text(25, 18, text="CASINO", 
-                          font=('Arial', 3, 'bold'),
-                          fill=design['couleur_texte_inner'])
-        
-        # Texte "POKER" dans la bande intérieure
-        canvas.create_text(25, 32, text="POKER", 
-                          font=('Arial', 3, 'bold'),
-                          fill=design['couleur_texte_inner'])
-        
-        # Indicateur de quantité si plus d'un jeton
-        if quantite > 1:
-            canvas.create_text(25, 40, text=f"×{quantite}", 
-                              font=('Arial', 4, 'bold'),
-                              fill='#FF0000')  # Rouge pour indiquer qu'on peut cliquer
-        
-        # Ajouter un indicateur de clic
-        canvas.create_text(25, 45, text="CLIC", 
-                          font=('Arial', 2, 'bold'),
-                          fill='#FF0000')
+        self.piles_mise.afficher(self.jetons_places)
     
     def confirmer_mise(self):
         """Confirme la mise et commence le jeu"""
+        # Les jetons en attente de redessin seraient recréés actifs après leur désactivation
+        self.rafraichissement.executer()
+        
         if self.mise_totale > 0:
+            self.jeu.portefeuille.engager(self.mise_totale)
             self.jeu.mise_actuelle = self.mise_totale
             self.jeu.mise_placee = True
             
@@ -983,7 +965,9 @@ class InterfaceBlackjack:
             self.jeu.points_joueur = self.jeu.calculer_points(self.jeu.main_joueur)
             self.jeu.points_croupier = self.jeu.calculer_points(self.jeu.main_croupier)
             
-            # Afficher les cartes distribuées
+            # Afficher les cartes distribuées, qui partent du sabot à la place des cartes vides
+            self.emplacements_croupier.vider()
+            self.emplacements_joueur.vider()
             self.afficher_cartes()
             
             if self.triche_activee:
@@ -995,8 +979,7 @@ class InterfaceBlackjack:
             self.btn_doubler.config(state=tk.NORMAL)
             self.btn_confirmer_mise.config(state=tk.DISABLED)
             # Désactiver les jetons
-            for widget in self.frame_jetons_disponibles.winfo_children():
-                widget.config(state=tk.DISABLED)
+            self.plateau_jetons.activer(False)
         else:
             self.label_message.config(text="❌ Placez au moins un jeton avant de confirmer !")
     
@@ -1018,54 +1001,21 @@ class InterfaceBlackjack:
         
         return '\n'.join(resultat)
     
-    def afficher_cartes_avec_couleurs(self, main: List[Carte], label_widget):
+    def contenu_carte(self, carte: Carte) -> Tuple[object, bool]:
+        """Retourne l'image à afficher pour une carte et si elle est révélée par la triche"""
+        # Si la triche est activée, montrer toutes les cartes
+        if carte.face_cachee and not self.triche_activee:
+            return CONTENU_CARTE_CACHEE
+        
+        # Une carte cachée révélée par la triche est encadrée en orange
+        return (carte.valeur, carte.couleur), carte.face_cachee
+    
+    def afficher_cartes_avec_couleurs(self, main: List[Carte], emplacements: EmplacementsCartes):
         """Affiche les cartes avec des couleurs appropriées"""
         if not main:
             return
         
-        # Effacer le contenu précédent
-        for widget in label_widget.winfo_children():
-            widget.destroy()
-        
-        # Créer un frame pour contenir les cartes
-        frame_cartes = tk.Frame(label_widget, bg='#0d5016')
-        frame_cartes.pack()
-        
-        for carte in main:
-            # Si la triche est activée, montrer toutes les cartes
-            if carte.face_cachee and not self.triche_activee:
-                # Carte cachée avec design réaliste
-                carte_label = tk.Label(frame_cartes, 
-                                     text=carte.afficher_carte(),
-                                     font=('Courier New', 12, 'bold'),
-                                     fg='#2C3E50', bg='#ECF0F1',
-                                     justify=tk.LEFT,
-                                     relief='flat',
-                                     bd=0,
-                                     padx=0,
-                                     pady=0)
-                carte_label.pack(side=tk.LEFT, padx=(0, 8))
-            else:
-                # Carte visible - déterminer la couleur
-                couleur_rouge = carte.couleur in ['♥', '♦']
-                couleur_texte = '#E74C3C' if couleur_rouge else '#2C3E50'
-                couleur_fond = '#FFFFFF'
-                
-                # Si c'est une carte cachée révélée par la triche, la marquer
-                if carte.face_cachee and self.triche_activee:
-                    couleur_texte = '#F39C12'  # Couleur spéciale pour les cartes triché
-                    couleur_fond = '#FFF3CD'
-                
-                carte_label = tk.Label(frame_cartes, 
-                                     text=carte.afficher_carte(),
-                                     font=('Courier New', 12, 'bold'),
-                                     fg=couleur_texte, bg=couleur_fond,
-                                     justify=tk.LEFT,
-                                     relief='flat',
-                                     bd=0,
-                                     padx=0,
-                                     pady=0)
-                carte_label.pack(side=tk.LEFT, padx=(0, 8))
+        emplacements.afficher([self.contenu_carte(carte) for carte in main])
     
     def nouvelle_partie(self):
         """Commence une nouvelle partie"""
@@ -1074,10 +1024,13 @@ class InterfaceBlackjack:
             self._message_fin_ajoute.destroy()
             delattr(self, '_message_fin_ajoute')
         
+        self.rendre_mise_non_confirmee()
+        
         if self.jeu.solde_joueur <= 0:
             self.label_message.config(text="💸 Vous n'avez plus de jetons ! Cliquez sur 'Nouvelle partie' pour recommencer avec 1000 jetons.")
-            self.jeu.solde_joueur = 1000  # Redonner 1000 jetons
+            self.jeu.portefeuille.reinitialiser()  # Redonner 1000 jetons
             self.afficher_cartes()
+            self.plateau_jetons.activer(True)
             self.creer_jetons_disponibles()
             return
         
@@ -1094,12 +1047,13 @@ class InterfaceBlackjack:
         self.jeu.double_effectue = False
         
         # Réinitialiser les jetons
-        self.jetons_places = []
+        self.jetons_places = {}
         self.mise_totale = 0
         self.mettre_a_jour_affichage_mise()
         
         # Afficher des cartes vides
         self.afficher_cartes_vides()
+        self.plateau_jetons.activer(True)
         self.creer_jetons_disponibles()
         self.label_message.config(text="Glissez-déposez vos jetons dans la zone de mise, puis confirmez !")
         self.btn_tirer.config(state=tk.DISABLED)
@@ -1107,6 +1061,15 @@ class InterfaceBlackjack:
         self.btn_doubler.config(state=tk.DISABLED)
         self.btn_confirmer_mise.config(state=tk.NORMAL)
     
+    def rendre_mise_non_confirmee(self):
+        """Rend au portefeuille les jetons posés dans la zone de mise mais jamais joués"""
+        # Aucune carte distribuée : la mise n'a pas été confirmée
+        if self.mise_totale and not self.jeu.main_joueur:
+            self.jeu.portefeuille.liberer(self.mise_totale)
+            self.jetons_places = {}
+            self.mise_totale = 0
+            self.mettre_a_jour_affichage_mise()
+    
     def tirer_carte(self):
         """Le joueur tire une carte"""
         if self.jeu.joueur_tire():
@@ -1181,8 +1144,7 @@ class InterfaceBlackjack:
         self.btn_confirmer_mise.config(state=tk.DISABLED)
         
         # Désactiver tous les jetons
-        for widget in self.frame_jetons_disponibles.winfo_children():
-            widget.config(state=tk.DISABLED)
+        self.plateau_jetons.activer(False)
         
         # Vérifier si la partie n'est pas déjà terminée pour éviter le double calcul
         if not self.jeu.jeu_termine:
@@ -1329,5 +1291,6 @@ class InterfaceBlackjack:
         self.root.mainloop()
 
 if __name__ == "__main__":
+    activer_mesures_si_demande()
     jeu = InterfaceBlackjack()
     jeu.lancer()
@@ -0,0 +1,287 @@
+import tkinter as tk
+
+from Blackjack import InterfaceBlackjack, JeuBlackjack
+from Jetons import PilesMise, PlateauJetons
+from Planificateur import ConstructionDifferee
+
+class InterfaceBlackjackAvecSolde(InterfaceBlackjack):
+    """Interface Blackjack modifiée pour utiliser un solde partagé dans le hub"""
+    
+    def __init__(self, portefeuille, hub_parent, parent_frame, construire=True):
+        # Initialiser le jeu avec le portefeuille partagé
+        self.jeu = JeuBlackjackAvecSolde(portefeuille)
+        self.hub_parent = hub_parent
+        self.root = hub_parent.root  # Utiliser la même fenêtre que le hub
+        
+        # Créer le frame du jeu dans le parent_frame
+        self.frame_jeu = tk.Frame(parent_frame, bg='#0d5016')
+        
+        # Variables pour l'interface (copiées de l'original)
+        self.triche_activee = False
+        self.jetons_places = {}
+        self.mise_totale = 0
+        self.jeton_en_cours_deplacement = None
+        
+        # Créer l'interface, tout de suite ou étape par étape si le hub s'en charge (construire=False)
+        self.construction = ConstructionDifferee(self.root, "Blackjack", self.etapes_construction())
+        if construire:
+            self.construction.terminer()
+    
+    def etapes_construction(self):
+        """Construit l'écran du jeu par étapes ; chaque yield rend la main à la boucle Tk"""
+        self.creer_rafraichissement()
+        yield from self.etapes_interface()
+        self.nouvelle_partie()
+        yield "nouvelle partie"
+    
+    def creer_interface(self):
+        """Crée l'interface utilisateur (version modifiée pour le hub)"""
+        for _ in self.etapes_interface():
+            pass
+    
+    def etapes_interface(self):
+        """Crée l'interface utilisateur par étapes (version modifiée pour le hub)"""
+        # Titre avec bouton retour
+        frame_titre = tk.Frame(self.frame_jeu, bg='#0d5016')
+        frame_titre.pack(fill='x', pady=5)
+        
+        # Bouton retour au hub
+        btn_retour = tk.Button(frame_titre, text="🏠 Retour au Hub", 
+                             command=self.retour_au_hub,
+                             font=('Arial', 12, 'bold'),
+                             bg='#FF9800', fg='#000000',
+                             padx=15, pady=5,
+                             relief='raised', bd=3,
+                             activebackground='#FFB74D',
+                             activeforeground='#000000')
+        btn_retour.pack(side=tk.LEFT, padx=10)
+        
+        # Titre du jeu
+        self.titre = tk.Label(frame_titre, text="🂡 BLACKJACK 🂡", 
+                        font=('Arial', 20, 'bold'), 
+                        fg='white', bg='#0d5016',
+                        cursor='hand2')
+        self.titre.pack(side=tk.LEFT, padx=20)
+        self.titre.bind('<Button-1>', self.tricher)
+        
+        # Sous-titre avec info sur les paquets (cliquable pour changer)
+        self.sous_titre = tk.Label(self.frame_jeu, text=f"🎰 {self.jeu.nombre_paquets} paquets mélangés (cliquez pour changer)", 
+                                  font=('Arial', 10), 
+                                  fg='#87CEEB', bg='#0d5016',
+                                  cursor='hand2')
+        self.sous_titre.pack(pady=2)
+        self.sous_titre.bind('<Button-1>', self.changer_nombre_paquets)
+        
+        # Affichage du solde et de la mise
+        frame_info = tk.Frame(self.frame_jeu, bg='#0d5016')
+        frame_info.pack(pady=5)
+        
+        self.label_solde = tk.Label(frame_info, 
+                                  font=('Arial', 14, 'bold'), 
+                                  fg='#ffd700', bg='#0d5016')
+        self.label_solde.pack(side=tk.LEFT, padx=20)
+        
+        self.label_mise = tk.Label(frame_info, 
+                                 font=('Arial', 14, 'bold'), 
+                                 fg='#ff6b6b', bg='#0d5016')
+        self.label_mise.pack(side=tk.LEFT, padx=20)
+        
+        self.label_cartes_restantes = tk.Label(frame_info, 
+                                             font=('Arial', 12), 
+                                             fg='#87CEEB', bg='#0d5016')
+        self.label_cartes_restantes.pack(side=tk.LEFT, padx=20)
+        yield "en-tête"
+        
+        # Table des cartes (croupier et joueur)
+        self.creer_table_cartes(self.frame_jeu)
+        yield "table des cartes"
+        
+        # Zone de mise avec jetons
+        frame_zone_mise = tk.Frame(self.frame_jeu, bg='#0d5016')
+        frame_zone_mise.pack(pady=5)
+        
+        # Zone de mise (où déposer les jetons)
+        self.zone_mise = tk.Frame(frame_zone_mise, 
+                                 bg='#2E7D32', 
+                                 width=400, height=80,
+                                 relief='solid', bd=3)
+        self.zone_mise.pack(pady=3)
+        self.zone_mise.pack_propagate(False)
+        self.piles_mise = PilesMise(self.zone_mise, self.retirer_jeton_de_la_mise)
+        
+        # Label d'instruction (en dehors de la zone de mise)
+        tk.Label(frame_zone_mise, text="Zone de mise (glissez-déposez les jetons)", 
+                font=('Arial', 9, 'bold'), 
+                fg='white', bg='#0d5016').pack(pady=2)
+        
+        # Label de la mise totale (en dehors de la zone de mise)
+        self.label_mise_totale = tk.Label(frame_zone_mise, 
+                                         text="Mise: 0 jetons", 
+                                         font=('Arial', 12, 'bold'), 
+                                         fg='#ffd700', bg='#0d5016')
+        self.label_mise_totale.pack()
+        
+        # Bouton pour confirmer la mise
+        self.btn_confirmer_mise = tk.Button(frame_zone_mise, text="Confirmer la mise", 
+                                          command=self.confirmer_mise,
+                                          font=('Arial', 12, 'bold'),
+                                          bg='#FF9800', fg='#000000',
+                                          padx=20, pady=8,
+                                          relief='raised', bd=3,
+                                          activebackground='#FFB74D',
+                                          activeforeground='#000000')
+        self.btn_confirmer_mise.pack(pady=5)
+        
+        # Zone des jetons disponibles
+        frame_jetons = tk.Frame(self.frame_jeu, bg='#0d5016')
+        frame_jetons.pack(pady=3)
+        
+        tk.Label(frame_jetons, text="Vos jetons (glissez-déposez dans la zone de mise):", 
+                font=('Arial', 10, 'bold'), 
+                fg='white', bg='#0d5016').pack()
+        
+        self.frame_jetons_disponibles = tk.Frame(frame_jetons, bg='#0d5016')
+        self.frame_jetons_disponibles.pack(pady=3)
+        self.plateau_jetons = PlateauJetons(self.frame_jetons_disponibles, self.commencer_deplacement,
+                                            self.deplacer_jeton, self.terminer_deplacement)
+        
+        # Variables pour le drag & drop
+        self.jetons_places = {}  # Nombre de jetons placés dans la zone de mise, par valeur
+        self.mise_totale = 0
+        self.jeton_en_cours_deplacement = None
+        
+        # Créer les jetons disponibles
+        self.creer_jetons_disponibles()
+        yield "mise et jetons"
+        
+        # Frame pour les boutons
+        frame_boutons = tk.Frame(self.frame_jeu, bg='#0d5016')
+        frame_boutons.pack(pady=5)
+        
+        self.btn_tirer = tk.Button(frame_boutons, text="Tirer une carte", 
+                                 command=self.tirer_carte,
+                                 font=('Arial', 14, 'bold'),
+                                 bg='#4CAF50', fg='#000000',
+                                 padx=20, pady=10,
+                                 relief='raised', bd=3,
+                                 activebackground='#66BB6A',
+                                 activeforeground='#000000')
+        self.btn_tirer.pack(side=tk.LEFT, padx=8)
+        
+        self.btn_rester = tk.Button(frame_boutons, text="Rester", 
+                                  command=self.rester,
+                                  font=('Arial', 14, 'bold'),
+                                  bg='#FF9800', fg='#000000',
+                                  padx=20, pady=10,
+                                  relief='raised', bd=3,
+                                  activebackground='#FFB74D',
+                                  activeforeground='#000000')
+        self.btn_rester.pack(side=tk.LEFT, padx=8)
+        
+        self.btn_doubler = tk.Button(frame_boutons, text="Doubler", 
+                                   command=self.doubler,
+                                   font=('Arial', 14, 'bold'),
+                                   bg='#2196F3', fg='#000000',
+                                   padx=20, pady=10,
+                                   relief='raised', bd=3,
+                                   activebackground='#42A5F5',
+                                   activeforeground='#000000')
+        self.btn_doubler.pack(side=tk.LEFT, padx=8)
+        
+        self.btn_nouvelle_partie = tk.Button(frame_boutons, text="Nouvelle partie", 
+                                           command=self.nouvelle_partie,
+                                           font=('Arial', 14, 'bold'),
+                                           bg='#FFCDD2', fg='#000000',
+                                           padx=20, pady=10,
+                                           relief='raised', bd=3,
+                                           activebackground='#FFE0E0',
+                                           activeforeground='#000000')
+        self.btn_nouvelle_partie.pack(side=tk.LEFT, padx=8)
+        
+        # Label pour les messages avec plus d'espace
+        self.label_message = tk.Label(self.frame_jeu, 
+                                    font=('Arial', 12, 'bold'), 
+                                    fg='#ffd700', bg='#0d5016',
+                                    wraplength=800,
+                                    justify='center')
+        self.label_message.pack(pady=10, fill='x')
+        yield "boutons"
+    
+    def retour_au_hub(self):
+        """Retourne au hub principal"""
+        # Nettoyer les messages de fin de partie
+        if hasattr(self, '_message_fin_ajoute'):
+            try:
+                self._message_fin_ajoute.destroy()
+                delattr(self, '_message_fin_ajoute')
+            except:
+                pass
+        
+        # Réinitialiser le message principal
+        if hasattr(self, 'label_message'):
+            self.label_message.config(text="Glissez-déposez vos jetons dans la zone de mise, puis confirmez !")
+        
+        # Le portefeuille est partagé : le hub n'a qu'à afficher le nouveau solde
+        self.hub_parent.mettre_a_jour_affichage_solde()
+        self.hub_parent.retour_au_hub()
+    
+    def reprendre(self):
+        """Reprend la partie telle qu'elle a été laissée (sabot compris)"""
+        # Le solde a pu changer dans un autre jeu : réafficher ce qui en dépend
+        self.rafraichissement.marquer('jetons', 'cartes')  # Les cartes affichent le solde
+    
+    def nouvelle_partie(self):
+        """Commence une nouvelle partie (version modifiée)"""
+        # Supprimer le message de fin s'il existe
+        if hasattr(self, '_message_fin_ajoute'):
+            self._message_fin_ajoute.destroy()
+            delattr(self, '_message_fin_ajoute')
+        
+        self.rendre_mise_non_confirmee()
+        
+        if self.jeu.solde_joueur <= 0:
+            self.label_message.config(text="💸 Vous n'avez plus de jetons ! Retournez au hub pour réinitialiser votre solde.")
+            return
+        
+        # Réinitialiser le jeu sans distribuer les cartes
+        self.jeu.main_joueur = []
+        self.jeu.main_croupier = []
+        self.jeu.points_joueur = 0
+        self.jeu.points_croupier = 0
+        self.jeu.jeu_termine = False
+        self.jeu.mise_actuelle = 0
+        self.jeu.mise_placee = False
+        self.jeu.double_effectue = False
+        
+        # Réinitialiser les jetons
+        self.jetons_places = {}
+        self.mise_totale = 0
+        self.mettre_a_jour_affichage_mise()
+        
+        # Afficher des cartes vides
+        self.afficher_cartes_vides()
+        self.plateau_jetons.activer(True)
+        self.creer_jetons_disponibles()
+        self.label_message.config(text="Glissez-déposez vos jetons dans la zone de mise, puis confirmez !")
+        self.btn_tirer.config(state=tk.DISABLED)
+        self.btn_rester.config(state=tk.DISABLED)
+        self.btn_doubler.config(state=tk.DISABLED)
+        self.btn_confirmer_mise.config(state=tk.NORMAL)
+
+class JeuBlackjackAvecSolde(JeuBlackjack):
+    """Jeu Blackjack modifié pour utiliser le portefeuille du hub"""
+    
+    def __init__(self, portefeuille):
+        # Initialiser avec le portefeuille fourni
+        self.nombre_paquets = 6
+        self.jeu_cartes = self.creer_jeu()
+        self.main_joueur = []
+        self.main_croupier = []
+        self.points_joueur = 0
+        self.points_croupier = 0
+        self.jeu_termine = False
+        self.portefeuille = portefeuille  # Utiliser le portefeuille partagé
+        self.mise_actuelle = 0
+        self.mise_placee = False
+        self.double_effectue = False
+        self.point_coupure = int(len(self.jeu_cartes) * 0.1)
@@ -0,0 +1,286 @@
+import tkinter as tk
+
+from Roulette import InterfaceRoulette, Roulette, StatistiquesRoulette  # StatistiquesRoulette sert aussi au hub
+from Planificateur import CompteurImages, ConstructionDifferee
+from Jetons import PlateauJetons
+
+class InterfaceRouletteAvecSolde(InterfaceRoulette):
+    """Interface Roulette modifiée pour utiliser un solde partagé dans le hub"""
+    
+    def __init__(self, portefeuille, hub_parent, parent_frame, statistiques=None, construire=True):
+        # Initialiser le jeu avec le portefeuille partagé
+        self.jeu = RouletteAvecSolde(portefeuille, statistiques)
+        self.hub_parent = hub_parent
+        self.root = hub_parent.root  # Utiliser la même fenêtre que le hub
+        
+        # Créer le frame du jeu dans le parent_frame
+        self.frame_jeu = tk.Frame(parent_frame, bg='#0d5016')
+        
+        # Variables pour l'animation
+        self.animation_en_cours = False
+        self.angle_rotation = 0
+        self.angle_final = 0
+        self.animation = None
+        self.compteur_images = CompteurImages(self.FPS_ANIMATION)
+        self.rapport_images = None  # Mesures de la dernière animation de la roue
+        
+        # Variables pour les jetons
+        self.jetons_places = []
+        self.jeton_en_cours_deplacement = None
+        self.jeton_selectionne = None
+        self.piles_jetons = {}
+        
+        # Créer l'interface, tout de suite ou étape par étape si le hub s'en charge (construire=False)
+        self.construction = ConstructionDifferee(self.root, "Roulette", self.etapes_construction())
+        if construire:
+            self.construction.terminer()
+    
+    def etapes_construction(self):
+        """Construit l'écran du jeu par étapes ; chaque yield rend la main à la boucle Tk"""
+        self.creer_rafraichissement()
+        yield from self.etapes_interface()
+        self.nouvelle_partie()
+        yield "nouvelle partie"
+    
+    def creer_interface(self):
+        """Crée l'interface utilisateur (version modifiée pour le hub)"""
+        for _ in self.etapes_interface():
+            pass
+    
+    def etapes_interface(self):
+        """Crée l'interface utilisateur par étapes (version modifiée pour le hub)"""
+        # Titre avec bouton retour
+        frame_titre = tk.Frame(self.frame_jeu, bg='#0d5016')
+        frame_titre.pack(fill='x', pady=5)
+        
+        # Bouton retour au hub
+        btn_retour = tk.Button(frame_titre, text="🏠 Retour au Hub", 
+                             command=self.retour_au_hub,
+                             font=('Arial', 12, 'bold'),
+                             bg='#FF9800', fg='#000000',
+                             padx=15, pady=5,
+                             relief='raised', bd=3,
+                             activebackground='#FFB74D',
+                             activeforeground='#000000')
+        btn_retour.pack(side=tk.LEFT, padx=10)
+        
+        # Titre du jeu
+        self.titre = tk.Label(frame_titre, text="🎰 ROULETTE CASINO 🎰", 
+                        font=('Arial', 18, 'bold'), 
+                        fg='white', bg='#0d5016')
+        self.titre.pack(side=tk.LEFT, padx=20)
+        
+        # Frame principal
+        frame_principal = tk.Frame(self.frame_jeu, bg='#0d5016')
+        frame_principal.pack(expand=True, fill='both', padx=5, pady=2)
+        
+        # Frame gauche - Roue de roulette et infos joueur
+        frame_gauche = tk.Frame(frame_principal, bg='#0d5016')
+        frame_gauche.pack(side=tk.LEFT, fill='y', padx=(0, 5))
+        
+        # Titre et infos joueur
+        frame_info = tk.Frame(frame_gauche, bg='#0d5016')
+        frame_info.pack(pady=2)
+        
+        self.label_solde = tk.Label(frame_info, 
+                                  text=f"Solde: {self.jeu.solde_joueur} jetons", 
+                                  font=('Arial', 12, 'bold'), 
+                                  fg='white', bg='#0d5016')
+        self.label_solde.pack()
+        
+        self.label_mise_totale = tk.Label(frame_info, 
+                                        text="Mise totale: 0 jetons", 
+                                        font=('Arial', 10), 
+                                        fg='white', bg='#0d5016')
+        self.label_mise_totale.pack()
+        
+        # Canvas pour la roue de roulette
+        self.canvas_roue = tk.Canvas(frame_gauche, width=300, height=300, 
+                                   bg='#2E7D32', highlightthickness=0)
+        self.canvas_roue.pack(pady=5)
+        
+        # Message du numéro qui vient de tomber
+        self.label_numero_actuel = tk.Label(frame_gauche, text="", 
+                                           font=('Arial', 14, 'bold'), 
+                                           fg='#FFD700', bg='#0d5016')
+        self.label_numero_actuel.pack(pady=2)
+        
+        # Titre de l'historique
+        label_historique = tk.Label(frame_gauche, text="Historique des numéros :", 
+                                   font=('Arial', 10, 'bold'), 
+                                   fg='white', bg='#0d5016')
+        label_historique.pack(pady=(5, 2))
+        
+        # Canvas pour l'historique des numéros
+        self.canvas_historique = tk.Canvas(frame_gauche, width=280, height=100, 
+                                         bg='#1B5E20', highlightthickness=1, 
+                                         relief='sunken', bd=1)
+        self.canvas_historique.pack(pady=2)
+        
+        # Zone de récapitulatif des gains/pertes
+        label_recap = tk.Label(frame_gauche, text="Récapitulatif :", 
+                              font=('Arial', 10, 'bold'), 
+                              fg='white', bg='#0d5016')
+        label_recap.pack(pady=(5, 2))
+        
+        # Liste défilante du récapitulatif (tour actuel et tours précédents)
+        self.creer_recapitulatif(frame_gauche)
+        yield "colonne de gauche"
+        
+        # Frame droite - Table de paris
+        frame_droite = tk.Frame(frame_principal, bg='#0d5016')
+        frame_droite.pack(side=tk.RIGHT, fill='both', expand=True, padx=(5, 0))
+        
+        # Table de paris - Zone de mise principale
+        self.creer_table_paris(frame_droite)
+        yield "table de paris"
+        
+        # Zone des jetons disponibles (en dessous de la table)
+        label_jetons = tk.Label(frame_droite, text="Jetons disponibles :", 
+                               font=('Arial', 10, 'bold'), 
+                               fg='white', bg='#0d5016')
+        label_jetons.pack(pady=(5, 2))
+        
+        self.frame_jetons = tk.Frame(frame_droite, bg='#0d5016')
+        self.frame_jetons.pack(pady=2)
+        self.plateau_jetons = PlateauJetons(self.frame_jetons, self.commencer_deplacement,
+                                            self.deplacer_jeton, self.terminer_deplacement)
+        
+        # Boutons de contrôle des jetons
+        frame_boutons_jetons = tk.Frame(frame_droite, bg='#0d5016')
+        frame_boutons_jetons.pack(pady=2)
+        
+        self.btn_deselectionner = tk.Button(frame_boutons_jetons, text="Désélectionner", 
+                                           command=self.deselectionner_jeton,
+                                           font=('Arial', 8, 'bold'),
+                                           bg='#4CAF50', fg='#000000',
+                                           padx=8, pady=3,
+                                           relief='raised', bd=2,
+                                           activebackground='#66BB6A',
+                                           activeforeground='#000000')
+        self.btn_deselectionner.pack(side=tk.LEFT, padx=2)
+        
+        self.btn_reinitialiser = tk.Button(frame_boutons_jetons, text="Réinitialiser mises", 
+                                          command=self.reinitialiser_mises,
+                                          font=('Arial', 8, 'bold'),
+                                          bg='#FFCDD2', fg='#000000',
+                                          padx=8, pady=3,
+                                          relief='raised', bd=2,
+                                          activebackground='#FFE0E0',
+                                          activeforeground='#000000')
+        self.btn_reinitialiser.pack(side=tk.LEFT, padx=2)
+        
+        self.btn_repetir = tk.Button(frame_boutons_jetons, text="Répéter la mise", 
+                                    command=self.repetir_mises_precedentes,
+                                    font=('Arial', 8, 'bold'),
+                                    bg='#4CAF50', fg='#000000',
+                                    padx=8, pady=3,
+                                    relief='raised', bd=2,
+                                    activebackground='#66BB6A',
+                                    activeforeground='#000000')
+        self.btn_repetir.pack(side=tk.LEFT, padx=2)
+        
+        # Frame pour les contrôles (en bas)
+        frame_controles = tk.Frame(self.frame_jeu, bg='#0d5016')
+        frame_controles.pack(fill='x', pady=2)
+        
+        # Boutons de contrôle
+        frame_boutons = tk.Frame(frame_controles, bg='#0d5016')
+        frame_boutons.pack(side=tk.RIGHT, padx=5, pady=2)
+        
+        # Mode turbo : plusieurs tours enchaînés sans animation
+        self.creer_controles_turbo(frame_boutons)
+        
+        self.btn_lancer = tk.Button(frame_boutons, text="TOURNER", 
+                                  command=self.lancer_roulette,
+                                  font=('Arial', 10, 'bold'),
+                                  bg='#FF9800', fg='#000000',
+                                  padx=10, pady=5,
+                                  relief='raised', bd=2,
+                                  activebackground='#FFB74D',
+                                  activeforeground='#000000')
+        self.btn_lancer.pack(side=tk.LEFT, padx=3)
+        
+        self.btn_nouvelle_partie = tk.Button(frame_boutons, text="RÉINITIALISER", 
+                                           command=self.nouvelle_partie,
+                                           font=('Arial', 10, 'bold'),
+                                           bg='#FFCDD2', fg='#000000',
+                                           padx=10, pady=5,
+                                           relief='raised', bd=2,
+                                           activebackground='#FFE0E0',
+                                           activeforeground='#000000')
+        self.btn_nouvelle_partie.pack(side=tk.LEFT, padx=3)
+        
+        # Affichage des résultats
+        self.label_resultat = tk.Label(frame_droite, 
+                                     text="Placez vos paris !", 
+                                     font=('Arial', 10, 'bold'), 
+                                     fg='#ffd700', bg='#0d5016')
+        self.label_resultat.pack(pady=2)
+        yield "jetons et boutons"
+        
+        # Créer les jetons et la roue
+        self.creer_jetons_disponibles()
+        self.dessiner_roue()
+        self.dessiner_historique()
+        yield "roue et historique"
+    
+    def retour_au_hub(self):
+        """Retourne au hub principal"""
+        # L'instance est conservée par le hub : terminer le tour en cours pour que ses gains
+        # soient comptés avant l'affichage du solde dans le hub
+        if self.animation_en_cours and self.animation is not None:
+            self.animation.arreter()
+        
+        # Réinitialiser le message de résultat
+        if hasattr(self, 'label_resultat'):
+            self.label_resultat.config(text="Placez vos paris !")
+        
+        # Le portefeuille est partagé : le hub n'a qu'à afficher le nouveau solde
+        self.hub_parent.mettre_a_jour_affichage_solde()
+        self.hub_parent.retour_au_hub()
+    
+    def rendre_paris_non_joues(self):
+        """Rend au portefeuille les paris posés sur la table mais pas encore joués, puis les retire"""
+        if self.animation_en_cours or not self.jeu.paris_actuels:
+            return
+        self.jeu.rembourser_paris()
+        self.jeu.paris_actuels = []
+        self.jetons_places = []
+        self.effacer_paris_visuels()
+        self.rafraichissement.marquer('affichage', 'jetons')
+    
+    def reprendre(self):
+        """Reprend la table telle qu'elle a été laissée"""
+        # Le solde a pu changer dans un autre jeu : réafficher ce qui en dépend
+        self.rafraichissement.marquer('affichage', 'jetons')
+    
+    def nouvelle_partie(self):
+        """Commence une nouvelle partie complète (version modifiée)"""
+        # Empêcher la réinitialisation pendant l'animation
+        if self.animation_en_cours:
+            self.label_resultat.config(text="❌ Impossible de réinitialiser pendant que la roue tourne !")
+            return
+        
+        # Rembourser tous les paris avant de commencer une nouvelle partie
+        self.jeu.rembourser_paris()
+        
+        # Si le joueur n'a plus d'argent, afficher un message
+        if self.jeu.solde_joueur <= 0:
+            self.label_resultat.config(text="💸 Vous n'avez plus de jetons ! Retournez au hub pour réinitialiser votre solde.")
+            return
+        
+        # Commencer une nouvelle partie
+        self.jeu.nouvelle_partie()
+        self.jetons_places = []
+        self.jeton_selectionne = None
+        self.effacer_paris_visuels()
+        self.mettre_a_jour_affichage()
+        self.creer_jetons_disponibles()
+        self.label_resultat.config(text="Sélectionnez un jeton et cliquez sur la table pour parier !")
+
+class RouletteAvecSolde(Roulette):
+    """Jeu Roulette modifié pour utiliser le portefeuille du hub"""
+    
+    def __init__(self, portefeuille, statistiques=None):
+        super().__init__(statistiques, portefeuille)  # Utiliser le portefeuille partagé
@@ -0,0 +1,242 @@
+import tkinter as tk
+from typing import Callable, Dict
+
+from Rendu import Pixels
+
+# Valeurs des jetons proposés dans les deux jeux
+VALEURS_JETONS = [5, 10, 25, 50, 100, 500]
+
+# Couleurs authentiques des jetons de casino, partagées par tous les jeux
+DESIGNS_JETONS = {
+    5: {
+        'couleur_centre': '#FFFFFF',
+        'couleur_inner': '#4A90E2',  # Bleu
+        'couleur_outer': '#E8F4FD',
+        'couleur_texte': '#000000',
+        'couleur_texte_inner': '#FFFFFF',
+        'symbole': '●'
+    },
+    10: {
+        'couleur_centre': '#FFD700',  # Jaune
+        'couleur_inner': '#DC143C',  # Rouge
+        'couleur_outer': '#FFF8DC',
+        'couleur_texte': '#000000',
+        'couleur_texte_inner': '#FFFFFF',
+        'symbole': '●'
+    },
+    25: {
+        'couleur_centre': '#32CD32',  # Vert
+        'couleur_inner': '#87CEEB',  # Bleu clair
+        'couleur_outer': '#F0FFF0',
+        'couleur_texte': '#000000',
+        'couleur_texte_inner': '#000000',
+        'symbole': '●'
+    },
+    50: {
+        'couleur_centre': '#4169E1',  # Bleu royal
+        'couleur_inner': '#DC143C',  # Rouge
+        'couleur_outer': '#E6F3FF',
+        'couleur_texte': '#FFFFFF',
+        'couleur_texte_inner': '#FFFFFF',
+        'symbole': '●'
+    },
+    100: {
+        'couleur_centre': '#000000',  # Noir
+        'couleur_inner': '#FFD700',  # Jaune
+        'couleur_outer': '#F5F5F5',
+        'couleur_texte': '#FFFFFF',
+        'couleur_texte_inner': '#000000',
+        'symbole': '●'
+    },
+    500: {
+        'couleur_centre': '#191970',  # Bleu marine
+        'couleur_inner': '#FFFFFF',  # Blanc
+        'couleur_outer': '#E6F3FF',
+        'couleur_texte': '#FFFFFF',
+        'couleur_texte_inner': '#000000',
+        'symbole': '●'
+    }
+}
+
+def rasteriser_jeton(valeur: int, taille: int) -> Pixels:
+    """Dessine pixel par pixel un jeton réaliste avec des cercles concentriques"""
+    design = DESIGNS_JETONS.get(valeur, DESIGNS_JETONS[5])  # Repli sur le jeton de 5
+    echelle = taille / 60
+    centre = taille / 2
+    pixels = Pixels(taille, taille)
+    
+    # Cercle extérieur (bordure), bande intérieure, puis cercle central
+    pixels.cercle_plein(centre, centre, 25 * echelle, design['couleur_outer'], '#C0C0C0', max(1, 2 * echelle))
+    pixels.cercle_plein(centre, centre, 20 * echelle, design['couleur_inner'], '#A0A0A0')
+    pixels.cercle_plein(centre, centre, 12 * echelle, design['couleur_centre'], '#808080')
+    
+    # Valeur au centre, à la plus grande échelle qui tient dans le cercle central,
+    # et textes "CASINO" / "POKER" dans la bande s'il y a la place
+    texte = str(valeur)
+    largeur_disponible = 2 * 12 * echelle - 4
+    echelle_texte = max(1, taille // 30)
+    while echelle_texte > 1 and Pixels.largeur_texte(texte, echelle_texte) > largeur_disponible:
+        echelle_texte -= 1
+    pixels.texte(centre, centre, texte, design['couleur_texte'], echelle_texte)
+    if taille >= 60:
+        pixels.texte(centre, centre - 15 * echelle, "CASINO", design['couleur_texte_inner'])
+        pixels.texte(centre, centre + 15 * echelle, "POKER", design['couleur_texte_inner'])
+    return pixels
+
+class CacheJetons:
+    """Images des jetons, dessinées une seule fois par (valeur, taille)
+    
+    Un cache par fenêtre Tk : dans le hub, le blackjack et la roulette partagent les mêmes images.
+    """
+    
+    _caches = {}
+    
+    @classmethod
+    def pour(cls, widget) -> 'CacheJetons':
+        """Retourne le cache de la fenêtre qui contient le widget"""
+        racine = widget._root()
+        cache = cls._caches.get(racine)
+        if cache is None:
+            cache = cls._caches[racine] = cls(racine)
+        return cache
+    
+    def __init__(self, racine):
+        self.racine = racine
+        self.images = {}  # (valeur, taille) -> PhotoImage ; la référence garde l'image en vie
+    
+    def image(self, valeur: int, taille: int = 60) -> tk.PhotoImage:
+        """Retourne l'image d'un jeton, en la dessinant au premier appel"""
+        cle = (valeur, taille)
+        image = self.images.get(cle)
+        if image is None:
+            image = self.images[cle] = rasteriser_jeton(valeur, taille).vers_photo(self.racine)
+        return image
+
+class PlateauJetons:
+    """Plateau des jetons disponibles, construit une seule fois
+    
+    Quand le solde change, seuls le texte "max N" et l'état actif/inactif de chaque
+    jeton sont mis à jour. Les clics sur un jeton inactif sont ignorés.
+    """
+    
+    def __init__(self, parent, sur_clic: Callable, sur_deplacement: Callable = None,
+                 sur_relache: Callable = None, fond: str = '#0d5016'):
+        self.fond = fond
+        self.sur_clic = sur_clic
+        self.sur_deplacement = sur_deplacement
+        self.sur_relache = sur_relache
+        
+        self.actif = True  # Plateau verrouillé pendant une main, par exemple
+        self.solde = 0
+        self.jetons = {}  # valeur -> {'canvas', 'texte_max', 'voile', 'quantite_max', 'disponible'}
+        
+        for valeur in VALEURS_JETONS:
+            canvas = tk.Canvas(parent, width=60, height=60,
+                             bg=fond, highlightthickness=0)
+            canvas.pack(side=tk.LEFT, padx=3, pady=3)
+            canvas.create_image(30, 30, image=CacheJetons.pour(canvas).image(valeur, 60))
+            
+            # Indicateur de quantité et voile des jetons inaccessibles, modifiés ensuite sur place
+            texte_max = canvas.create_text(30, 50, text="", font=('Arial', 3), fill='#666666')
+            voile = canvas.create_oval(5, 5, 55, 55, fill=fond, outline='',
+                                       stipple='gray50', state='hidden')
+            
+            canvas.bind('<Button-1>', lambda e, v=valeur: self._clic(e, v))
+            canvas.bind('<B1-Motion>', self._deplacement)
+            canvas.bind('<ButtonRelease-1>', self._relache)
+            
+            self.jetons[valeur] = {'canvas': canvas, 'texte_max': texte_max, 'voile': voile,
+                                   'quantite_max': None, 'disponible': None}
+    
+    def mettre_a_jour(self, solde: int):
+        """Met à jour les quantités et l'état des jetons pour un nouveau solde"""
+        self.solde = solde
+        for valeur, jeton in self.jetons.items():
+            quantite_max = solde // valeur
+            if quantite_max != jeton['quantite_max']:
+                jeton['quantite_max'] = quantite_max
+                texte = f"max {quantite_max}" if quantite_max > 1 else ""
+                jeton['canvas'].itemconfig(jeton['texte_max'], text=texte)
+            self._appliquer_etat(jeton, self.actif and quantite_max > 0)
+    
+    def activer(self, actif: bool):
+        """Active ou désactive l'ensemble du plateau"""
+        self.actif = actif
+        for valeur, jeton in self.jetons.items():
+            self._appliquer_etat(jeton, actif and self.solde >= valeur)
+    
+    def _appliquer_etat(self, jeton, disponible: bool):
+        """Affiche un jeton comme disponible ou non, seulement si son état change"""
+        if disponible == jeton['disponible']:
+            return
+        jeton['disponible'] = disponible
+        jeton['canvas'].itemconfig(jeton['voile'], state='hidden' if disponible else 'normal')
+        jeton['canvas'].config(cursor='hand2' if disponible else '')
+    
+    def _clic(self, event, valeur):
+        if self.jetons[valeur]['disponible']:
+            self.sur_clic(event, valeur)
+    
+    def _deplacement(self, event):
+        if self.sur_deplacement is not None:
+            self.sur_deplacement(event)
+    
+    def _relache(self, event):
+        # Le jeton reste en place : on lui rend sa couleur de fond
+        event.widget.configure(bg=self.fond)
+        if self.sur_relache is not None:
+            self.sur_relache(event)
+
+class PilesMise:
+    """Piles des jetons misés, une par valeur, construites une seule fois
+    
+    afficher() compare le nombre de jetons voulu à celui déjà affiché : seules les
+    piles qui changent sont touchées (texte "×n", affichage ou retrait de la pile).
+    """
+    
+    def __init__(self, parent, sur_retrait: Callable[[int], None], fond: str = '#2E7D32'):
+        self.frame = tk.Frame(parent, bg=fond)  # Affiché seulement quand la mise n'est pas vide
+        tk.Label(self.frame, text="Cliquez sur un jeton pour le retirer:", 
+                font=('Arial', 8, 'bold'), 
+                fg='white', bg=fond).pack(pady=2)
+        
+        self.nb_piles_affichees = 0
+        self.piles = {}  # valeur -> {'canvas', 'texte_quantite', 'quantite'}
+        cache_jetons = CacheJetons.pour(parent)
+        for valeur in VALEURS_JETONS:
+            canvas = tk.Canvas(self.frame, width=40, height=40,
+                             bg=fond, highlightthickness=0, cursor='hand2')
+            canvas.create_image(20, 20, image=cache_jetons.image(valeur, 40))
+            
+            # Indicateur de quantité (rouge pour indiquer qu'on peut cliquer) et indicateur de clic
+            texte_quantite = canvas.create_text(20, 32, text="", 
+                                                font=('Arial', 3, 'bold'), fill='#FF0000')
+            canvas.create_text(20, 35, text="CLIC", 
+                             font=('Arial', 2, 'bold'), fill='#FF0000')
+            
+            canvas.bind('<Button-1>', lambda e, v=valeur: sur_retrait(v))
+            self.piles[valeur] = {'canvas': canvas, 'texte_quantite': texte_quantite, 'quantite': 0}
+    
+    def afficher(self, compteur: Dict[int, int]):
+        """Met à jour les piles d'après le nombre de jetons misés par valeur"""
+        for valeur, pile in self.piles.items():
+            quantite = compteur.get(valeur, 0)
+            if quantite != pile['quantite']:
+                self._mettre_a_jour_pile(pile, quantite)
+    
+    def _mettre_a_jour_pile(self, pile, quantite: int):
+        """Met à jour une seule pile"""
+        if quantite and not pile['quantite']:
+            # Les piles apparaissent dans l'ordre où leur premier jeton a été misé
+            pile['canvas'].pack(side=tk.LEFT, padx=2, pady=2)
+            self.nb_piles_affichees += 1
+            if self.nb_piles_affichees == 1:
+                self.frame.pack(pady=5)
+        elif not quantite and pile['quantite']:
+            pile['canvas'].pack_forget()
+            self.nb_piles_affichees -= 1
+            if self.nb_piles_affichees == 0:
+                self.frame.pack_forget()
+        
+        pile['canvas'].itemconfig(pile['texte_quantite'], text=f"×{quantite}" if quantite > 1 else "")
+        pile['quantite'] = quantite
@@ -0,0 +1,257 @@
+import logging
+import os
+import time
+from typing import Callable, Iterator
+
+# Journal des mesures de performance (cadence des animations, temps de rendu...) :
+# silencieux par défaut, affiché dans la console si la variable CASINO_MESURES est définie
+journal_mesures = logging.getLogger("casino.mesures")
+
+def activer_mesures_si_demande():
+    """Affiche le journal des mesures dans la console si CASINO_MESURES est défini"""
+    if os.environ.get('CASINO_MESURES'):
+        logging.basicConfig(format="%(message)s")
+        journal_mesures.setLevel(logging.INFO)
+
+class CompteurImages:
+    """Mesure l'intervalle entre les images d'une animation pour vérifier la cadence tenue
+    
+    Mesure aussi le temps passé à dessiner chaque image, à comparer au budget d'une image (1 / fps).
+    """
+    
+    def __init__(self, fps_cible: float = 20):
+        self.fps_cible = fps_cible
+        self.reinitialiser()
+    
+    def reinitialiser(self):
+        """Remet les compteurs à zéro (début d'une nouvelle animation)"""
+        self.nb_images = 0
+        self.duree_totale = 0.0
+        self.duree_max = 0.0
+        self.images_lentes = 0
+        self.instant_precedent = None
+        self.nb_rendus = 0
+        self.rendu_total = 0.0
+        self.rendu_max = 0.0
+        self.rendus_hors_budget = 0
+    
+    def image(self, duree_rendu: float = None):
+        """Enregistre l'affichage d'une image, avec le temps passé à la dessiner s'il est connu"""
+        maintenant = time.perf_counter()
+        if duree_rendu is not None:
+            self.nb_rendus += 1
+            self.rendu_total += duree_rendu
+            if duree_rendu > self.rendu_max:
+                self.rendu_max = duree_rendu
+            if duree_rendu > 1.0 / self.fps_cible:
+                self.rendus_hors_budget += 1
+        if self.instant_precedent is not None:
+            duree = maintenant - self.instant_precedent
+            self.nb_images += 1
+            self.duree_totale += duree
+            if duree > self.duree_max:
+                self.duree_max = duree
+            # Une image est lente si elle dépasse de moitié la durée visée
+            if duree > 1.5 / self.fps_cible:
+                self.images_lentes += 1
+        self.instant_precedent = maintenant
+    
+    def fps_moyen(self) -> float:
+        """Retourne la cadence moyenne mesurée"""
+        if self.duree_totale == 0:
+            return 0.0
+        return self.nb_images / self.duree_totale
+    
+    def rendu_moyen(self) -> float:
+        """Retourne le temps de dessin moyen d'une image, en secondes"""
+        if self.nb_rendus == 0:
+            return 0.0
+        return self.rendu_total / self.nb_rendus
+    
+    def rapport(self) -> str:
+        """Résumé lisible des mesures"""
+        texte = (f"{self.nb_images} images, {self.fps_moyen():.1f} FPS (cible {self.fps_cible}), "
+                 f"pire image {self.duree_max * 1000:.0f} ms, {self.images_lentes} images lentes")
+        if self.nb_rendus:
+            texte += (f", rendu moyen {self.rendu_moyen() * 1000:.1f} ms, pire rendu {self.rendu_max * 1000:.1f} ms "
+                      f"(budget {1000 / self.fps_cible:.0f} ms, {self.rendus_hors_budget} hors budget)")
+        return texte
+
+class PlanificateurAnimation:
+    """Animation pilotée par le temps écoulé (time.monotonic) plutôt que par le nombre d'images
+    
+    À chaque image, la progression (de 0 à 1) est calculée à partir du temps réel : une image
+    lente ne rallonge pas l'animation, les images en retard sont simplement sautées.
+    Réutilisable pour toute animation Tk (roulette, distribution des cartes...).
+    """
+    
+    def __init__(self, widget, duree: float, sur_image: Callable[[float], None],
+                 sur_fin: Callable[[], None] = None, fps: float = 30,
+                 compteur: CompteurImages = None):
+        self.widget = widget  # N'importe quel widget Tk, pour after()/after_cancel()
+        self.duree = duree
+        self.sur_image = sur_image
+        self.sur_fin = sur_fin
+        self.fps = fps
+        self.compteur = compteur
+        
+        self.debut = None
+        self.en_cours = False
+        self.images_sautees = 0
+        self._rappel = None
+    
+    def demarrer(self):
+        """Démarre l'animation"""
+        self.debut = time.monotonic()
+        self.en_cours = True
+        self.images_sautees = 0
+        if self.compteur is not None:
+            self.compteur.fps_cible = self.fps
+            self.compteur.reinitialiser()
+        self._image()
+    
+    def _image(self):
+        """Affiche l'image correspondant au temps écoulé puis programme la suivante"""
+        self._rappel = None
+        if not self.en_cours:
+            return
+        
+        ecoule = time.monotonic() - self.debut
+        progression = min(1.0, ecoule / self.duree) if self.duree > 0 else 1.0
+        debut_rendu = time.perf_counter()
+        self.sur_image(progression)
+        if self.compteur is not None:
+            self.compteur.image(time.perf_counter() - debut_rendu)
+        
+        if progression >= 1.0:
+            self._terminer()
+            return
+        
+        # Viser la prochaine échéance de la grille d'images ; si on est en retard,
+        # les échéances déjà passées sont abandonnées
+        periode = 1.0 / self.fps
+        index_image = int(ecoule / periode) + 1
+        maintenant = time.monotonic() - self.debut
+        index_suivant = max(index_image, int(maintenant / periode) + 1)
+        self.images_sautees += index_suivant - index_image
+        delai_ms = max(1, int((index_suivant * periode - maintenant) * 1000))
+        self._rappel = self.widget.after(delai_ms, self._image)
+    
+    def _terminer(self):
+        """Marque la fin de l'animation et prévient l'appelant"""
+        self.en_cours = False
+        if self.sur_fin is not None:
+            self.sur_fin()
+    
+    def arreter(self, aller_a_la_fin: bool = True):
+        """Interrompt l'animation, en affichant éventuellement directement la dernière image"""
+        if not self.en_cours:
+            return
+        if self._rappel is not None:
+            self.widget.after_cancel(self._rappel)
+            self._rappel = None
+        if aller_a_la_fin:
+            self.sur_image(1.0)
+            self._terminer()
+        else:
+            self.en_cours = False
+
+class PlanificateurRafraichissement:
+    """Regroupe les rafraîchissements de l'interface en un seul passage par tour de boucle Tk
+    
+    Les gestionnaires d'événements marquent seulement les zones à redessiner ; chaque zone
+    marquée est redessinée une seule fois, au prochain passage à vide (after_idle), dans
+    l'ordre où les zones ont été enregistrées.
+    """
+    
+    def __init__(self, widget):
+        self.widget = widget  # N'importe quel widget Tk, pour after_idle()/after_cancel()
+        self.zones = {}  # nom -> fonction de dessin, dans l'ordre d'enregistrement
+        self.zones_sales = set()
+        self.nb_demandes = 0
+        self.nb_dessins = 0
+        self._rappel = None
+    
+    def enregistrer(self, nom: str, dessiner: Callable[[], None]):
+        """Déclare une zone de l'écran et la fonction qui la redessine"""
+        self.zones[nom] = dessiner
+    
+    def marquer(self, *noms: str):
+        """Marque des zones à redessiner au prochain passage à vide"""
+        self.zones_sales.update(noms)
+        self.nb_demandes += len(noms)
+        if self._rappel is None:
+            self._rappel = self.widget.after_idle(self._passage_a_vide)
+    
+    def _passage_a_vide(self):
+        """Rappel programmé par after_idle"""
+        self._rappel = None
+        self.executer()
+    
+    def executer(self):
+        """Redessine immédiatement les zones marquées (par exemple avant une action qui en dépend)"""
+        if self._rappel is not None:
+            self.widget.after_cancel(self._rappel)
+            self._rappel = None
+        zones_sales, self.zones_sales = self.zones_sales, set()
+        for nom, dessiner in self.zones.items():
+            if nom in zones_sales:
+                dessiner()
+                self.nb_dessins += 1
+    
+    def rapport(self) -> str:
+        """Résumé lisible du nombre de redessins évités"""
+        return f"{self.nb_demandes} demandes, {self.nb_dessins} redessins"
+
+class ConstructionDifferee:
+    """Exécute une construction découpée en étapes pendant les passages à vide de la boucle Tk
+    
+    Les étapes sont fournies par un générateur : le code entre deux yield forme une étape,
+    exécutée dans son propre rappel after_idle pour que l'interface reste réactive entre deux
+    étapes. Chaque yield donne le nom de l'étape qui vient de se terminer ; sa durée est journalisée.
+    """
+    
+    def __init__(self, widget, nom: str, etapes: Iterator[str]):
+        self.widget = widget  # N'importe quel widget Tk, pour after_idle()/after_cancel()
+        self.nom = nom
+        self.etapes = etapes
+        self.terminee = False
+        self.duree_totale = 0.0
+        self.derniere_etape = None  # Nom de la dernière étape exécutée
+        self._rappel = None
+    
+    def demarrer(self):
+        """Programme la première étape au prochain passage à vide"""
+        if not self.terminee and self._rappel is None:
+            self._rappel = self.widget.after_idle(self._etape)
+    
+    def _etape(self):
+        """Exécute une étape puis programme la suivante"""
+        self._rappel = None
+        if self.executer_etape():
+            self._rappel = self.widget.after_idle(self._etape)
+    
+    def executer_etape(self) -> bool:
+        """Exécute une seule étape ; retourne False quand la construction est terminée"""
+        if self.terminee:
+            return False
+        debut = time.perf_counter()
+        try:
+            etape = next(self.etapes)
+        except StopIteration:
+            self.terminee = True
+            journal_mesures.info("%s : construction terminée en %.0f ms", self.nom, self.duree_totale * 1000)
+            return False
+        duree = time.perf_counter() - debut
+        self.duree_totale += duree
+        self.derniere_etape = etape
+        journal_mesures.info("%s - %s : %.1f ms", self.nom, etape, duree * 1000)
+        return True
+    
+    def terminer(self):
+        """Exécute immédiatement les étapes restantes (par exemple quand l'écran est demandé)"""
+        if self._rappel is not None:
+            self.widget.after_cancel(self._rappel)
+            self._rappel = None
+        while self.executer_etape():
+            pass
@@ -0,0 +1,80 @@
+import threading
+
+SOLDE_INITIAL = 1000
+
+class Portefeuille:
+    """Solde du joueur, partagé par le hub et les jeux
+
+    Chaque opération est atomique (protégée par un verrou) : un débit qui dépasse le solde
+    est refusé en entier, jamais appliqué à moitié. La réserve contient les jetons posés dans
+    une zone de mise mais pas encore joués ; ils ne font plus partie du solde disponible.
+    """
+
+    def __init__(self, solde: int = SOLDE_INITIAL):
+        self._verrou = threading.Lock()
+        self._solde = solde
+        self._reserve = 0
+
+    @property
+    def solde(self) -> int:
+        """Solde disponible (hors réserve)"""
+        return self._solde
+
+    @property
+    def reserve(self) -> int:
+        """Montant réservé par des mises pas encore jouées"""
+        return self._reserve
+
+    def debiter(self, montant: int) -> bool:
+        """Retire un montant du solde. Retourne False (sans rien changer) si le solde ne suffit pas"""
+        if montant < 0:
+            return False
+        with self._verrou:
+            if montant > self._solde:
+                return False
+            self._solde -= montant
+            return True
+
+    def crediter(self, montant: int):
+        """Ajoute un montant (gain ou remboursement) au solde"""
+        if montant < 0:
+            raise ValueError(f"Montant négatif: {montant}")
+        with self._verrou:
+            self._solde += montant
+
+    def reserver(self, montant: int) -> bool:
+        """Met un montant de côté pour une mise. Retourne False si le solde ne suffit pas"""
+        if montant < 0:
+            return False
+        with self._verrou:
+            if montant > self._solde:
+                return False
+            self._solde -= montant
+            self._reserve += montant
+            return True
+
+    def liberer(self, montant: int):
+        """Rend au solde un montant réservé (jeton retiré de la mise)"""
+        with self._verrou:
+            self._verifier_reserve(montant)
+            self._reserve -= montant
+            self._solde += montant
+
+    def engager(self, montant: int):
+        """Joue un montant réservé : il quitte la réserve sans revenir au solde"""
+        with self._verrou:
+            self._verifier_reserve(montant)
+            self._reserve -= montant
+
+    def _verifier_reserve(self, montant: int):
+        """Refuse un montant négatif ou supérieur à la réserve (à appeler sous le verrou)"""
+        if montant < 0:
+            raise ValueError(f"Montant négatif: {montant}")
+        if montant > self._reserve:
+            raise ValueError(f"Montant {montant} supérieur à la réserve ({self._reserve})")
+
+    def reinitialiser(self, solde: int = SOLDE_INITIAL):
+        """Remet le solde à une valeur donnée (nouveau départ) et vide la réserve"""
+        with self._verrou:
+            self._solde = solde
+            self._reserve = 0
@@ -0,0 +1,125 @@
+import tkinter as tk
+from typing import List
+
+# Police bitmap de 5 pixels de haut (1 = pixel allumé), agrandie par un facteur entier
+POLICE = {
+    '0': ["111", "101", "101", "101", "111"],
+    '1': ["010", "110", "010", "010", "111"],
+    '2': ["111", "001", "111", "100", "111"],
+    '3': ["111", "001", "111", "001", "111"],
+    '4': ["101", "101", "111", "001", "001"],
+    '5': ["111", "100", "111", "001", "111"],
+    '6': ["111", "100", "111", "101", "111"],
+    '7': ["111", "001", "001", "010", "010"],
+    '8': ["111", "101", "111", "101", "111"],
+    '9': ["111", "101", "111", "001", "111"],
+    '$': ["011", "110", "010", "011", "110"],
+    'A': ["010", "101", "111", "101", "101"],
+    'C': ["011", "100", "100", "100", "011"],
+    'E': ["111", "100", "110", "100", "111"],
+    'I': ["111", "010", "010", "010", "111"],
+    'J': ["001", "001", "001", "101", "010"],
+    'K': ["101", "101", "110", "101", "101"],
+    'N': ["101", "111", "111", "101", "101"],
+    'O': ["010", "101", "101", "101", "010"],
+    'P': ["110", "101", "110", "100", "100"],
+    'Q': ["010", "101", "101", "110", "011"],
+    'R': ["110", "101", "110", "101", "101"],
+    'S': ["011", "100", "010", "001", "110"],
+    ' ': ["000", "000", "000", "000", "000"],
+    # Couleurs des cartes, sur 5 pixels de large
+    '♠': ["00100", "01110", "11111", "00100", "01110"],
+    '♥': ["01010", "11111", "11111", "01110", "00100"],
+    '♦': ["00100", "01110", "11111", "01110", "00100"],
+    '♣': ["01110", "01110", "11111", "00100", "01110"],
+}
+
+class Pixels:
+    """Tampon de pixels dessiné en Python puis converti une seule fois en PhotoImage Tk
+    
+    Les pixels valent None (transparent) ou une couleur '#RRGGBB'.
+    """
+    
+    def __init__(self, largeur: int, hauteur: int):
+        self.largeur = largeur
+        self.hauteur = hauteur
+        self.lignes = [[None] * largeur for _ in range(hauteur)]
+    
+    def disque(self, cx: float, cy: float, rayon: float, couleur: str):
+        """Remplit un disque"""
+        rayon2 = rayon * rayon
+        y_min = max(0, int(cy - rayon))
+        y_max = min(self.hauteur - 1, int(cy + rayon) + 1)
+        for y in range(y_min, y_max + 1):
+            dy = y + 0.5 - cy
+            reste = rayon2 - dy * dy
+            if reste < 0:
+                continue
+            demi = reste ** 0.5
+            x_min = max(0, int(round(cx - demi)))
+            x_max = min(self.largeur, int(round(cx + demi)))
+            ligne = self.lignes[y]
+            for x in range(x_min, x_max):
+                ligne[x] = couleur
+    
+    def cercle_plein(self, cx: float, cy: float, rayon: float, fond: str, contour: str, epaisseur: float = 1):
+        """Disque avec un contour, comme create_oval(fill=..., outline=..., width=...)"""
+        self.disque(cx, cy, rayon, contour)
+        self.disque(cx, cy, rayon - epaisseur, fond)
+    
+    def rectangle(self, x1: int, y1: int, x2: int, y2: int, couleur: str):
+        """Remplit un rectangle (x2 et y2 exclus)"""
+        for y in range(max(0, y1), min(self.hauteur, y2)):
+            ligne = self.lignes[y]
+            for x in range(max(0, x1), min(self.largeur, x2)):
+                ligne[x] = couleur
+    
+    def rectangle_arrondi(self, x1: int, y1: int, x2: int, y2: int, rayon: int, couleur: str):
+        """Remplit un rectangle aux coins arrondis (x2 et y2 exclus)"""
+        self.rectangle(x1 + rayon, y1, x2 - rayon, y2, couleur)
+        self.rectangle(x1, y1 + rayon, x2, y2 - rayon, couleur)
+        for cx, cy in ((x1 + rayon, y1 + rayon), (x2 - rayon, y1 + rayon),
+                       (x1 + rayon, y2 - rayon), (x2 - rayon, y2 - rayon)):
+            self.disque(cx, cy, rayon, couleur)
+    
+    @staticmethod
+    def largeur_texte(texte: str, echelle: int = 1) -> int:
+        """Largeur en pixels d'un texte écrit avec la police bitmap"""
+        if not texte:
+            return 0
+        largeur = sum(len(POLICE.get(caractere, POLICE[' '])[0]) + 1 for caractere in texte) - 1
+        return largeur * echelle
+    
+    def texte(self, cx: float, cy: float, texte: str, couleur: str, echelle: int = 1):
+        """Écrit un texte centré en (cx, cy) avec la police bitmap"""
+        x = int(round(cx - self.largeur_texte(texte, echelle) / 2))
+        y0 = int(round(cy - 5 * echelle / 2))
+        for caractere in texte:
+            glyphe = POLICE.get(caractere, POLICE[' '])
+            for j, rangee in enumerate(glyphe):
+                for i, pixel in enumerate(rangee):
+                    if pixel == '1':
+                        self.rectangle(x + i * echelle, y0 + j * echelle,
+                                       x + (i + 1) * echelle, y0 + (j + 1) * echelle, couleur)
+            x += (len(glyphe[0]) + 1) * echelle
+    
+    def segments(self, y: int) -> List[tuple]:
+        """Retourne les suites de pixels opaques d'une ligne : (x de départ, couleurs)"""
+        resultat = []
+        debut = None
+        ligne = self.lignes[y]
+        for x, couleur in enumerate(ligne + [None]):
+            if couleur is not None and debut is None:
+                debut = x
+            elif couleur is None and debut is not None:
+                resultat.append((debut, ligne[debut:x]))
+                debut = None
+        return resultat
+    
+    def vers_photo(self, maitre=None) -> tk.PhotoImage:
+        """Convertit le tampon en PhotoImage ; les pixels None restent transparents"""
+        photo = tk.PhotoImage(master=maitre, width=self.largeur, height=self.hauteur)
+        for y in range(self.hauteur):
+            for x, couleurs in self.segments(y):
+                photo.put("{" + " ".join(couleurs) + "}", to=(x, y))
+        return photo
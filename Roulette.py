@@ -3,8 +3,21 @@ from tkinter import ttk, messagebox
 import random
 import math
 import time
+from collections import deque
 from typing import List, Dict, Tuple
 
+from Jetons import PlateauJetons
+from Planificateur import (CompteurImages, PlanificateurAnimation, PlanificateurRafraichissement,
+                           activer_mesures_si_demande, journal_mesures)
+from Portefeuille import Portefeuille
+
+# Couleurs de la roulette européenne
+NOMBRES_ROUGES = [1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36]
+NOMBRES_NOIRS = [2, 4, 6, 8, 10, 11, 13, 15, 17, 20, 22, 24, 26, 28, 29, 31, 33, 35]
+
+# Disposition réelle des numéros sur une roulette européenne (dans l'ordre)
+NUMEROS_ORDRE = [0, 32, 15, 19, 4, 21, 2, 25, 17, 34, 6, 27, 13, 36, 11, 30, 8, 23, 10, 5, 24, 16, 33, 1, 20, 14, 31, 9, 22, 18, 29, 7, 28, 12, 35, 3, 26]
+
 class Jeton:
     """Représente un jeton de casino (repris du blackjack)"""
     def __init__(self, valeur: int):
@@ -25,39 +38,361 @@ class Pari:
         self.valeur_jeton = valeur_jeton  # Valeur du jeton (doit être fournie)
         self.montant_total = self.valeur_jeton * jetons
 
+class ReglementRoulette:
+    """Règlement d'un tour : détail par pari et par groupe de paris, calculé une seule fois
+    
+    Chaque ligne (et chaque groupe) donne la mise, le gain, le multiplicateur et les
+    numéros couverts. Les paris sur des chiffres sont regroupés en gagnants et perdants,
+    les autres paris par type.
+    """
+    def __init__(self, numero: int):
+        self.numero = numero
+        self.lignes = []   # Une ligne par pari, dans l'ordre de placement
+        self.groupes = []  # Paris regroupés, dans l'ordre de première apparition
+        self.mise_totale = 0
+        self.gains_totaux = 0
+        self._index_groupes = {}
+    
+    @property
+    def net(self) -> int:
+        """Gain net du tour (gains moins mises)"""
+        return self.gains_totaux - self.mise_totale
+    
+    def ajouter(self, pari: Pari, gagnant: bool, multiplicateur: int, couverture: frozenset):
+        """Ajoute le résultat d'un pari au règlement"""
+        gain = pari.montant_total * multiplicateur if gagnant else 0
+        self.lignes.append({
+            'pari': pari,
+            'mise': pari.montant_total,
+            'gain': gain,
+            'multiplicateur': multiplicateur,
+            'gagnant': gagnant,
+            'couverture': couverture
+        })
+        self.mise_totale += pari.montant_total
+        self.gains_totaux += gain
+        
+        cle = ('nombre', gagnant) if pari.type_pari == 'nombre' else (pari.type_pari, None)
+        groupe = self._index_groupes.get(cle)
+        if groupe is None:
+            groupe = {
+                'type_pari': pari.type_pari,
+                'pari': pari,  # Premier pari du groupe, pour le nom affiché
+                'mise': 0,
+                'gain': 0,
+                'jetons': 0,
+                'multiplicateur': multiplicateur,
+                'gagnant': gagnant,
+                'chiffres': set() if pari.type_pari == 'nombre' else None,
+                'couverture': set()
+            }
+            self._index_groupes[cle] = groupe
+            self.groupes.append(groupe)
+        
+        groupe['mise'] += pari.montant_total
+        groupe['gain'] += gain
+        groupe['jetons'] += pari.jetons
+        groupe['couverture'] |= couverture
+        if groupe['chiffres'] is not None:
+            groupe['chiffres'].add(pari.valeur)
+
+class StatistiquesRoulette:
+    """Statistiques long terme de la roulette, mises à jour en O(1) à chaque tirage"""
+    
+    CATEGORIES = ('couleur', 'douzaine', 'colonne')
+    
+    # Catégories de chaque numéro, précalculées une fois pour toutes
+    # (couleur, douzaine, colonne) ; le 0 forme sa propre catégorie
+    CATEGORIES_NUMEROS = [('vert', 0, 0)] + [
+        ('rouge' if numero in NOMBRES_ROUGES else 'noir',
+         (numero - 1) // 12 + 1,
+         (numero - 1) % 3 + 1)
+        for numero in range(1, 37)
+    ]
+    
+    def __init__(self, taille_historique: int = 20):
+        self.total_tirages = 0
+        
+        # Tableaux de taille fixe indexés par numéro
+        self.frequences = [0] * 37
+        self.derniere_sortie = [-1] * 37  # Index du dernier tirage de chaque numéro
+        
+        # Tampon circulaire des derniers numéros (bande affichée par l'interface)
+        self.derniers = deque(maxlen=taille_historique)
+        
+        # Série en cours par catégorie : [valeur, longueur]
+        self.series = {categorie: [None, 0] for categorie in self.CATEGORIES}
+        # Plus longue série observée par catégorie et par valeur
+        self.series_max = {categorie: {} for categorie in self.CATEGORIES}
+        
+        # Bilan des tours réglés et derniers règlements
+        self.tours_regles = 0
+        self.mise_totale = 0
+        self.gains_totaux = 0
+        self.reglements = deque(maxlen=taille_historique)
+    
+    def enregistrer(self, numero: int):
+        """Enregistre un tirage"""
+        self.frequences[numero] += 1
+        self.derniere_sortie[numero] = self.total_tirages
+        self.total_tirages += 1
+        self.derniers.append(numero)
+        
+        for categorie, valeur in zip(self.CATEGORIES, self.CATEGORIES_NUMEROS[numero]):
+            serie = self.series[categorie]
+            if serie[0] == valeur:
+                serie[1] += 1
+            else:
+                serie[0] = valeur
+                serie[1] = 1
+            if serie[1] > self.series_max[categorie].get(valeur, 0):
+                self.series_max[categorie][valeur] = serie[1]
+    
+    def enregistrer_reglement(self, reglement: ReglementRoulette):
+        """Enregistre le règlement d'un tour"""
+        self.tours_regles += 1
+        self.mise_totale += reglement.mise_totale
+        self.gains_totaux += reglement.gains_totaux
+        self.reglements.append(reglement)
+    
+    @property
+    def net(self) -> int:
+        """Bilan net de tous les tours réglés"""
+        return self.gains_totaux - self.mise_totale
+    
+    def ecart(self, numero: int) -> int:
+        """Retourne le nombre de tirages depuis la dernière sortie du numéro"""
+        if self.derniere_sortie[numero] < 0:
+            return self.total_tirages
+        return self.total_tirages - 1 - self.derniere_sortie[numero]
+    
+    def frequence(self, numero: int) -> float:
+        """Retourne la fréquence de sortie du numéro"""
+        if self.total_tirages == 0:
+            return 0.0
+        return self.frequences[numero] / self.total_tirages
+    
+    def serie_actuelle(self, categorie: str) -> Tuple[object, int]:
+        """Retourne la série en cours pour une catégorie (valeur, longueur)"""
+        valeur, longueur = self.series[categorie]
+        return valeur, longueur
+    
+    def serie_max(self, categorie: str, valeur) -> int:
+        """Retourne la plus longue série observée pour une valeur d'une catégorie"""
+        return self.series_max[categorie].get(valeur, 0)
+    
+    def numeros_chauds(self, nombre: int = 5) -> List[int]:
+        """Retourne les numéros les plus sortis"""
+        if self.total_tirages == 0:
+            return []
+        return sorted(range(37), key=lambda n: (-self.frequences[n], self.ecart(n)))[:nombre]
+    
+    def numeros_froids(self, nombre: int = 5) -> List[int]:
+        """Retourne les numéros absents depuis le plus longtemps"""
+        if self.total_tirages == 0:
+            return []
+        return sorted(range(37), key=lambda n: (-self.ecart(n), self.frequences[n]))[:nombre]
+    
+    def derniers_numeros(self, nombre: int = None) -> List[int]:
+        """Retourne les derniers numéros tirés, du plus ancien au plus récent"""
+        if nombre is None or nombre >= len(self.derniers):
+            return list(self.derniers)
+        return list(self.derniers)[-nombre:]
+
+class GeometrieRoue:
+    """Géométrie de la roue calculée une seule fois par rayon
+    
+    Contient les polygones des secteurs et l'ancre de chaque numéro, et fait référence
+    pour la correspondance angle -> case utilisée pour désigner le numéro gagnant.
+    """
+    
+    ANGLE_PAR_SECTEUR = 360 / 37
+    NUMEROS_ORDRE = NUMEROS_ORDRE
+    INDEX_SECTEURS = {numero: i for i, numero in enumerate(NUMEROS_ORDRE)}
+    
+    # Cosinus et sinus de chaque degré entier, partagés par toutes les géométries
+    COSINUS = [math.cos(math.radians(angle)) for angle in range(361)]
+    SINUS = [math.sin(math.radians(angle)) for angle in range(361)]
+    
+    _cache = {}
+    
+    @classmethod
+    def pour(cls, centre_x: float, centre_y: float, rayon_exterieur: float, rayon_interieur: float) -> 'GeometrieRoue':
+        """Retourne la géométrie pour ces dimensions, en la calculant à la première demande"""
+        cle = (centre_x, centre_y, rayon_exterieur, rayon_interieur)
+        geometrie = cls._cache.get(cle)
+        if geometrie is None:
+            geometrie = cls(*cle)
+            cls._cache[cle] = geometrie
+        return geometrie
+    
+    @classmethod
+    def numero_pour_angle(cls, angle: float) -> int:
+        """Retourne le numéro du secteur situé sous l'angle donné (en degrés)"""
+        index = int((angle % 360) / cls.ANGLE_PAR_SECTEUR)
+        return cls.NUMEROS_ORDRE[min(index, 36)]
+    
+    @classmethod
+    def debut_secteur(cls, numero: int) -> float:
+        """Retourne l'angle de début du secteur d'un numéro (en degrés)"""
+        return cls.INDEX_SECTEURS[numero] * cls.ANGLE_PAR_SECTEUR
+    
+    @staticmethod
+    def couleur(numero: int) -> str:
+        """Retourne la couleur d'affichage d'un secteur"""
+        if numero == 0:
+            return '#00AA00'  # Vert pour le 0
+        elif numero in NOMBRES_ROUGES:
+            return '#CC0000'  # Rouge
+        return '#000000'  # Noir
+    
+    def __init__(self, centre_x: float, centre_y: float, rayon_exterieur: float, rayon_interieur: float):
+        self.centre_x = centre_x
+        self.centre_y = centre_y
+        self.rayon_exterieur = rayon_exterieur
+        self.rayon_interieur = rayon_interieur
+        
+        # Un secteur par case, dans l'ordre de la roue : (numero, couleur, points, ancre du texte)
+        self.secteurs = []
+        for i, numero in enumerate(self.NUMEROS_ORDRE):
+            angle_debut = i * self.ANGLE_PAR_SECTEUR
+            angle_fin = (i + 1) * self.ANGLE_PAR_SECTEUR
+            points = self.calculer_polygone(angle_debut, angle_fin)
+            ancre = self.point((angle_debut + angle_fin) / 2, (rayon_exterieur + rayon_interieur) / 2)
+            self.secteurs.append((numero, self.couleur(numero), points, ancre))
+    
+    def point(self, angle: float, rayon: float) -> Tuple[float, float]:
+        """Retourne le point situé à un angle (en degrés) et un rayon donnés"""
+        angle_rad = math.radians(angle)
+        return (self.centre_x + rayon * math.cos(angle_rad),
+                self.centre_y + rayon * math.sin(angle_rad))
+    
+    def calculer_polygone(self, angle_debut: float, angle_fin: float) -> List[float]:
+        """Calcule les sommets d'un secteur (forme de trapèze avec arc extérieur)"""
+        points = []
+        points.extend(self.point(angle_debut, self.rayon_interieur))
+        points.extend(self.point(angle_debut, self.rayon_exterieur))
+        
+        # Arc extérieur, degré par degré à partir des tables trigonométriques
+        for angle in range(int(angle_debut), int(angle_fin) + 1):
+            points.extend([self.centre_x + self.rayon_exterieur * self.COSINUS[angle],
+                           self.centre_y + self.rayon_exterieur * self.SINUS[angle]])
+        
+        points.extend(self.point(angle_fin, self.rayon_exterieur))
+        points.extend(self.point(angle_fin, self.rayon_interieur))
+        return points
+
+class MoteurRoue:
+    """Roue sans interface : le numéro est tiré d'abord, l'angle d'arrêt en découle"""
+    
+    ANGLE_PAR_SECTEUR = GeometrieRoue.ANGLE_PAR_SECTEUR
+    
+    def __init__(self, generateur: random.Random = None):
+        self.generateur = generateur if generateur is not None else random.Random()
+        self.numeros_ordre = GeometrieRoue.NUMEROS_ORDRE
+    
+    def tirer(self) -> int:
+        """Tire un numéro gagnant"""
+        return self.numeros_ordre[self.generateur.randrange(37)]
+    
+    def numero_pour_angle(self, angle: float) -> int:
+        """Retourne le numéro du secteur situé sous l'angle donné (en degrés)"""
+        return GeometrieRoue.numero_pour_angle(angle)
+    
+    def angle_pour_numero(self, numero: int, tours_min: float = 3, tours_max: float = 6) -> float:
+        """Calcule un angle d'arrêt (tours supplémentaires compris) tombant dans le secteur du numéro"""
+        debut_secteur = GeometrieRoue.debut_secteur(numero)
+        # Garder la boule à distance des séparations entre secteurs
+        marge = self.ANGLE_PAR_SECTEUR * 0.15
+        decalage = self.generateur.uniform(marge, self.ANGLE_PAR_SECTEUR - marge)
+        tours_extra = self.generateur.uniform(tours_min, tours_max) * 360
+        return tours_extra - tours_extra % 360 + debut_secteur + decalage
+
 class Roulette:
     """Classe principale du jeu de roulette"""
     
-    def __init__(self):
+    # Multiplicateurs de gain par type de pari
+    MULTIPLICATEURS = {
+        'rouge': 2,
+        'noir': 2,
+        'pair': 2,
+        'impair': 2,
+        'manque': 2,
+        'passe': 2,
+        'nombre': 36,  # Pari sur un nombre spécifique
+        'douzaine1': 3,
+        'douzaine2': 3,
+        'douzaine3': 3,
+        'colonne1': 3,
+        'colonne2': 3,
+        'colonne3': 3
+    }
+    
+    def __init__(self, statistiques: StatistiquesRoulette = None, portefeuille: Portefeuille = None):
         # Nombres de la roulette européenne (0-36)
         self.nombres = list(range(37))  # 0 à 36
-        self.nombres_rouges = [1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36]
-        self.nombres_noirs = [2, 4, 6, 8, 10, 11, 13, 15, 17, 20, 22, 24, 26, 28, 29, 31, 33, 35]
+        self.nombres_rouges = NOMBRES_ROUGES
+        self.nombres_noirs = NOMBRES_NOIRS
         
-        # Solde et paris
-        self.solde_joueur = 1000
+        # Solde (éventuellement partagé avec d'autres jeux, par exemple par le hub) et paris
+        self.portefeuille = portefeuille if portefeuille is not None else Portefeuille()
         self.paris_actuels = []
         self.paris_precedents = []  # Stocke les paris de la partie précédente
         self.numero_gagnant = None
         self.partie_en_cours = False
+        self.dernier_reglement = None  # Règlement du dernier tour terminé
         
-        # Historique des numéros
-        self.historique = []
+        # Statistiques long terme (peuvent être partagées, par exemple par le hub)
+        self.statistiques = statistiques if statistiques is not None else StatistiquesRoulette()
+        
+        # Moteur de la roue, indépendant de toute animation
+        self.moteur = MoteurRoue()
+    
+    @property
+    def solde_joueur(self) -> int:
+        """Solde disponible du joueur, lu dans le portefeuille"""
+        return self.portefeuille.solde
+    
+    @property
+    def historique(self) -> List[int]:
+        """Derniers numéros tirés (20 au maximum)"""
+        return list(self.statistiques.derniers)
     
     def placer_pari(self, type_pari: str, valeur_pari: int, valeur_jeton: int, position: Tuple[int, int] = None) -> bool:
         """Place un pari. Retourne True si le pari est valide"""
         montant_total = valeur_jeton * 1  # 1 jeton
         
-        if montant_total > self.solde_joueur:
+        if not self.partie_en_cours:
+            return False
+        
+        # Un pari sur un nombre doit viser une case de la roue (0 à 36)
+        if type_pari == 'nombre' and valeur_pari not in range(37):
             return False
         
-        if not self.partie_en_cours:
+        # Débit atomique : refusé si le solde ne suffit pas
+        if not self.portefeuille.debiter(montant_total):
             return False
         
         # Créer le pari avec la valeur du pari et le montant du jeton
         pari = Pari(type_pari, valeur_pari, 1, position, valeur_jeton)
         self.paris_actuels.append(pari)
-        self.solde_joueur -= montant_total
+        return True
+    
+    def placer_paris(self, lot: List[Pari]) -> bool:
+        """Place un lot de paris de façon atomique. Retourne True si tout le lot est accepté
+        
+        Le solde est vérifié une seule fois pour le total du lot : soit tous les paris
+        sont placés, soit aucun.
+        """
+        if not self.partie_en_cours:
+            return False
+        
+        lot = list(lot)
+        montant_total = sum(pari.montant_total for pari in lot)
+        if montant_total <= 0 or not self.portefeuille.debiter(montant_total):
+            return False
+        
+        self.paris_actuels.extend(lot)
         return True
     
     def lancer_roulette(self) -> int:
@@ -65,25 +400,24 @@ class Roulette:
         if not self.partie_en_cours:
             return None
         
-        self.numero_gagnant = random.choice(self.nombres)
-        self.historique.append(self.numero_gagnant)
-        
-        # Garder seulement les 20 derniers numéros
-        if len(self.historique) > 20:
-            self.historique = self.historique[-20:]
+        self.numero_gagnant = self.moteur.tirer()
+        self.statistiques.enregistrer(self.numero_gagnant)
         
         return self.numero_gagnant
     
     def calculer_gains(self) -> int:
         """Calcule les gains totaux selon les paris et le numéro gagnant"""
-        gains_totaux = 0
-        
+        return self.regler().gains_totaux
+    
+    def regler(self) -> ReglementRoulette:
+        """Évalue chaque pari une seule fois et retourne le règlement détaillé du tour"""
+        reglement = ReglementRoulette(self.numero_gagnant)
         for pari in self.paris_actuels:
-            if self.verifier_pari_gagnant(pari):
-                multiplicateur = self.get_multiplicateur(pari.type_pari)
-                gains_totaux += pari.montant_total * multiplicateur
-        
-        return gains_totaux
+            valeur = pari.valeur if pari.type_pari == 'nombre' else None
+            reglement.ajouter(pari, self.verifier_pari_gagnant(pari),
+                              self.get_multiplicateur(pari.type_pari),
+                              COUVERTURE_PARIS.get((pari.type_pari, valeur), frozenset()))
+        return reglement
     
     def verifier_pari_gagnant(self, pari: Pari) -> bool:
         """Vérifie si un pari est gagnant"""
@@ -120,22 +454,54 @@ class Roulette:
     
     def get_multiplicateur(self, type_pari: str) -> int:
         """Retourne le multiplicateur de gain selon le type de pari"""
-        multiplicateurs = {
-            'rouge': 2,
-            'noir': 2,
-            'pair': 2,
-            'impair': 2,
-            'manque': 2,
-            'passe': 2,
-            'nombre': 36,  # Pari sur un nombre spécifique
-            'douzaine1': 3,
-            'douzaine2': 3,
-            'douzaine3': 3,
-            'colonne1': 3,
-            'colonne2': 3,
-            'colonne3': 3
+        return self.MULTIPLICATEURS.get(type_pari, 1)
+    
+    def jouer_tours(self, nb_tours: int) -> Dict:
+        """Enchaîne plusieurs tours avec la disposition de paris actuelle, sans animation
+        
+        Retourne les résultats cumulés. La série s'arrête si le solde ne permet plus
+        de reposer la disposition. La dernière partie est terminée comme terminer_partie.
+        """
+        if not self.partie_en_cours or not self.paris_actuels or nb_tours <= 0:
+            return None
+        
+        disposition = list(self.paris_actuels)
+        resultats = {
+            'tours': 0,
+            'mise_totale': 0,
+            'gains_totaux': 0,
+            'tours_gagnants': 0,
+            'meilleur_gain': None,  # Meilleur net d'un tour (négatif si tous les tours perdent)
+            'dernier_numero': None
         }
-        return multiplicateurs.get(type_pari, 1)
+        
+        for tour in range(nb_tours):
+            if tour > 0:
+                self.nouvelle_partie()
+                if not self.placer_paris(disposition):
+                    self.partie_en_cours = False
+                    break
+            
+            mise = sum(pari.montant_total for pari in self.paris_actuels)
+            numero = self.lancer_roulette()
+            gains = self.terminer_partie()
+            
+            resultats['tours'] += 1
+            resultats['mise_totale'] += mise
+            resultats['gains_totaux'] += gains
+            resultats['dernier_numero'] = numero
+            if gains > mise:
+                resultats['tours_gagnants'] += 1
+            if resultats['meilleur_gain'] is None or gains - mise > resultats['meilleur_gain']:
+                resultats['meilleur_gain'] = gains - mise
+        
+        return resultats
+    
+    def rembourser_paris(self):
+        """Rend au portefeuille le montant des paris en cours (ils restent sur la table)"""
+        montant_total = sum(pari.montant_total for pari in self.paris_actuels)
+        if montant_total:
+            self.portefeuille.crediter(montant_total)
     
     def nouvelle_partie(self):
         """Commence une nouvelle partie"""
@@ -146,8 +512,11 @@ class Roulette:
     def terminer_partie(self):
         """Termine la partie actuelle"""
         if self.numero_gagnant is not None:
-            gains = self.calculer_gains()
-            self.solde_joueur += gains
+            # Règlement unique du tour, réutilisé par l'affichage et les statistiques
+            self.dernier_reglement = self.regler()
+            self.statistiques.enregistrer_reglement(self.dernier_reglement)
+            gains = self.dernier_reglement.gains_totaux
+            self.portefeuille.crediter(gains)
             # Sauvegarder les paris actuels avant de les effacer
             self.paris_precedents = self.paris_actuels.copy()
             self.paris_actuels = []
@@ -160,27 +529,331 @@ class Roulette:
         if not self.paris_precedents or not self.partie_en_cours:
             return False
         
-        # Vérifier si le joueur a assez d'argent pour tous les paris
-        montant_total = sum(pari.montant_total for pari in self.paris_precedents)
-        if montant_total > self.solde_joueur:
+        # Les paris ne sont jamais modifiés une fois placés : on peut les reposer tels quels
+        return self.placer_paris(self.paris_precedents)
+
+def construire_paris_gagnants() -> List[Dict[Tuple[str, int], int]]:
+    """Précalcule, pour chaque numéro, les paris gagnants et leur multiplicateur
+    
+    Les clés sont (type_pari, valeur), la valeur valant None sauf pour les paris sur un nombre.
+    """
+    jeu = Roulette()
+    table = []
+    for numero in jeu.nombres:
+        jeu.numero_gagnant = numero
+        gagnants = {('nombre', numero): jeu.get_multiplicateur('nombre')}
+        for type_pari in jeu.MULTIPLICATEURS:
+            if type_pari != 'nombre' and jeu.verifier_pari_gagnant(Pari(type_pari, None, 1, None, 1)):
+                gagnants[(type_pari, None)] = jeu.get_multiplicateur(type_pari)
+        table.append(gagnants)
+    return table
+
+PARIS_GAGNANTS = construire_paris_gagnants()
+
+def construire_couverture_paris() -> Dict[Tuple[str, int], frozenset]:
+    """Déduit de la table des paris gagnants les numéros couverts par chaque pari"""
+    couverture = {}
+    for numero, gagnants in enumerate(PARIS_GAGNANTS):
+        for cle in gagnants:
+            couverture.setdefault(cle, set()).add(numero)
+    return {cle: frozenset(numeros) for cle, numeros in couverture.items()}
+
+COUVERTURE_PARIS = construire_couverture_paris()
+
+class SiegeRoulette:
+    """Place d'un joueur à une table de roulette partagée"""
+    def __init__(self, nom: str, solde: int):
+        self.nom = nom
+        self.solde = solde
+        self.mises = {}  # (type_pari, valeur) -> montant misé
+        self.mise_totale = 0
+
+class TableRoulette:
+    """Table partagée : une seule roue, les paris de tous les joueurs réglés en une passe"""
+    
+    def __init__(self, moteur: MoteurRoue = None, statistiques: StatistiquesRoulette = None):
+        self.moteur = moteur if moteur is not None else MoteurRoue()
+        self.statistiques = statistiques if statistiques is not None else StatistiquesRoulette()
+        self.sieges = {}  # nom -> SiegeRoulette
+        self.numero_gagnant = None
+    
+    def ajouter_joueur(self, nom: str, solde: int) -> SiegeRoulette:
+        """Installe un joueur à la table"""
+        if nom in self.sieges:
+            raise ValueError(f"Le joueur {nom} est déjà à la table")
+        siege = SiegeRoulette(nom, solde)
+        self.sieges[nom] = siege
+        return siege
+    
+    def retirer_joueur(self, nom: str) -> int:
+        """Retire un joueur de la table (ses mises en cours sont remboursées) et retourne son solde"""
+        siege = self.sieges.pop(nom)
+        return siege.solde + siege.mise_totale
+    
+    def placer_pari(self, nom: str, type_pari: str, valeur: int, montant: int) -> bool:
+        """Ajoute une mise au registre d'un joueur. Retourne True si la mise est valide"""
+        siege = self.sieges.get(nom)
+        if siege is None or montant <= 0 or montant > siege.solde:
+            return False
+        if type_pari not in Roulette.MULTIPLICATEURS:
+            return False
+        # Un pari sur un nombre doit viser une case de la roue (0 à 36)
+        if type_pari == 'nombre' and valeur not in range(37):
             return False
         
-        # Placer tous les paris précédents
-        for pari in self.paris_precedents:
-            # Calculer la vraie valeur du jeton (montant total / nombre de jetons)
-            vraie_valeur_jeton = pari.montant_total // pari.jetons
-            if not self.placer_pari(pari.type_pari, pari.valeur, vraie_valeur_jeton, pari.position):
-                # Si un pari échoue, annuler tous les paris déjà placés
-                for pari_place in self.paris_actuels:
-                    self.solde_joueur += pari_place.montant_total
-                self.paris_actuels = []
-                return False
-        
+        cle = (type_pari, valeur if type_pari == 'nombre' else None)
+        siege.mises[cle] = siege.mises.get(cle, 0) + montant
+        siege.mise_totale += montant
+        siege.solde -= montant
         return True
+    
+    def lancer(self) -> int:
+        """Tire le numéro gagnant pour toute la table"""
+        self.numero_gagnant = self.moteur.tirer()
+        self.statistiques.enregistrer(self.numero_gagnant)
+        return self.numero_gagnant
+    
+    def regler(self, numero: int = None) -> Dict[str, Dict[str, int]]:
+        """Règle les paris de tous les joueurs contre un seul numéro
+        
+        Seuls les quelques paris gagnants du numéro sont consultés dans chaque registre :
+        le coût par joueur ne dépend pas du nombre de mises qu'il a posées.
+        Retourne un rapport par joueur (mise, gains, net, solde).
+        """
+        if numero is None:
+            numero = self.numero_gagnant
+        if numero is None:
+            raise ValueError("Aucun numéro à régler")
+        
+        gagnants = PARIS_GAGNANTS[numero]
+        rapports = {}
+        for nom, siege in self.sieges.items():
+            if not siege.mise_totale:
+                continue
+            
+            mises = siege.mises
+            gains = 0
+            for cle, multiplicateur in gagnants.items():
+                montant = mises.get(cle)
+                if montant:
+                    gains += montant * multiplicateur
+            
+            rapports[nom] = {
+                'numero': numero,
+                'mise': siege.mise_totale,
+                'gains': gains,
+                'net': gains - siege.mise_totale,
+                'solde': siege.solde + gains
+            }
+            siege.solde += gains
+            siege.mises = {}
+            siege.mise_totale = 0
+        
+        return rapports
+
+class ZoneTable:
+    """Zone rectangulaire de la table de paris, associée à un pari"""
+    def __init__(self, x1: int, y1: int, x2: int, y2: int, type_pari: str, valeur: int,
+                 texte: str, couleur: str, taille_police: int = 12):
+        self.x1, self.y1, self.x2, self.y2 = x1, y1, x2, y2
+        self.type_pari = type_pari
+        self.valeur = valeur
+        self.texte = texte
+        self.couleur = couleur
+        self.taille_police = taille_police
+    
+    @property
+    def centre(self) -> Tuple[int, int]:
+        """Centre de la zone"""
+        return ((self.x1 + self.x2) // 2, (self.y1 + self.y2) // 2)
+    
+    def contient(self, x: float, y: float) -> bool:
+        """Indique si le point est dans la zone"""
+        return self.x1 <= x < self.x2 and self.y1 <= y < self.y2
+
+def construire_disposition_table() -> List[ZoneTable]:
+    """Construit la disposition de la table de paris (source unique pour le dessin et les clics)"""
+    zones = []
+    start_x = 50
+    start_y = 50
+    cell_width = 35
+    cell_height = 45
+    
+    # Le 0 (en haut, largeur de 12 cellules)
+    zones.append(ZoneTable(start_x, start_y, start_x + 12 * cell_width, start_y + cell_height,
+                           'nombre', 0, "0", '#00AA00', 14))
+    
+    # Grille 3x12 des nombres 1-36, organisation traditionnelle des rangées :
+    # Rangée 1: 1, 4, 7, 10, 13, 16, 19, 22, 25, 28, 31, 34
+    # Rangée 2: 2, 5, 8, 11, 14, 17, 20, 23, 26, 29, 32, 35
+    # Rangée 3: 3, 6, 9, 12, 15, 18, 21, 24, 27, 30, 33, 36
+    grille_y = start_y + cell_height
+    for row in range(3):
+        for col in range(12):
+            numero = 1 + col * 3 + row
+            x = start_x + col * cell_width
+            y = grille_y + row * cell_height
+            couleur = '#FF0000' if numero in NOMBRES_ROUGES else '#000000'
+            zones.append(ZoneTable(x, y, x + cell_width, y + cell_height,
+                                   'nombre', numero, str(numero), couleur, 12))
+    
+    # Colonnes "2to1" à droite de la grille, une par rangée
+    colonnes_x = start_x + 12 * cell_width
+    for row in range(3):
+        y = grille_y + row * cell_height
+        zones.append(ZoneTable(colonnes_x, y, colonnes_x + 60, y + cell_height,
+                               f"colonne{row + 1}", None, "2to1", '#2E7D32', 12))
+    
+    # Douzaines sous la grille, chacune couvrant 4 colonnes de nombres
+    douzaines_y = grille_y + 3 * cell_height + 5
+    for i, texte in enumerate(["1-12", "13-24", "25-36"]):
+        x = start_x + i * 4 * cell_width
+        zones.append(ZoneTable(x, douzaines_y, x + 4 * cell_width, douzaines_y + 40,
+                               f"douzaine{i + 1}", None, texte, '#2E7D32', 12))
+    
+    # Paris simples en bas
+    simples_y = douzaines_y + 50
+    paris = [
+        ("1-18", "manque", '#2E7D32'),
+        ("Even", "pair", '#2E7D32'),
+        ("Red", "rouge", '#FF0000'),
+        ("Black", "noir", '#000000'),
+        ("Odd", "impair", '#2E7D32'),
+        ("19-36", "passe", '#2E7D32')
+    ]
+    for i, (texte, type_pari, couleur) in enumerate(paris):
+        x = start_x + i * 90
+        zones.append(ZoneTable(x, simples_y, x + 90, simples_y + 60,
+                               type_pari, None, texte, couleur, 14))
+    
+    return zones
+
+DISPOSITION_TABLE = construire_disposition_table()
+
+class GrilleClics:
+    """Grille grossière associant chaque cellule du canvas à une zone de pari
+    
+    Construite une fois à partir de la disposition : un clic se résout par une simple
+    lecture de tableau, quel que soit le nombre de zones.
+    """
+    
+    def __init__(self, zones: List[ZoneTable], largeur: int, hauteur: int, taille_cellule: int = 5):
+        self.zones = zones
+        self.taille_cellule = taille_cellule
+        self.nb_colonnes = largeur // taille_cellule + 1
+        self.nb_lignes = hauteur // taille_cellule + 1
+        self.cellules = [-1] * (self.nb_colonnes * self.nb_lignes)
+        
+        # Une cellule appartient à la zone qui contient son centre
+        demi = taille_cellule / 2
+        for index, zone in enumerate(zones):
+            for cy in range(int(zone.y1 // taille_cellule), int(zone.y2 // taille_cellule) + 1):
+                for cx in range(int(zone.x1 // taille_cellule), int(zone.x2 // taille_cellule) + 1):
+                    if (cx < self.nb_colonnes and cy < self.nb_lignes and
+                            zone.contient(cx * taille_cellule + demi, cy * taille_cellule + demi)):
+                        self.cellules[cy * self.nb_colonnes + cx] = index
+    
+    def zone_a(self, x: float, y: float) -> ZoneTable:
+        """Retourne la zone située sous le point, ou None"""
+        cx = int(x // self.taille_cellule)
+        cy = int(y // self.taille_cellule)
+        if not (0 <= cx < self.nb_colonnes and 0 <= cy < self.nb_lignes):
+            return None
+        index = self.cellules[cy * self.nb_colonnes + cx]
+        return self.zones[index] if index >= 0 else None
+
+class ListeVirtuelle:
+    """Liste défilante de lignes de texte sur un canvas, avec un nombre fixe d'éléments
+    
+    Seules les lignes visibles sont dessinées, par un pool d'éléments texte créés une
+    fois pour toutes : le coût d'un rafraîchissement ne dépend pas du nombre de lignes.
+    Les lignes les plus anciennes sont oubliées au-delà de max_lignes.
+    """
+    def __init__(self, parent, largeur: int, hauteur: int, hauteur_ligne: int = 20,
+                 max_lignes: int = 5000, texte_vide: str = "Aucun pari"):
+        self.hauteur_ligne = hauteur_ligne
+        self.lignes = deque(maxlen=max_lignes)  # (texte, couleur), la plus récente en tête
+        self.premiere = 0  # Index de la première ligne visible
+        self.nb_visibles = max(1, hauteur // hauteur_ligne)
+        
+        self.frame = tk.Frame(parent, bg='#0d5016')
+        self.canvas = tk.Canvas(self.frame, width=largeur, height=hauteur, 
+                              bg='#1B5E20', highlightthickness=1, 
+                              relief='sunken', bd=1)
+        self.canvas.pack(side=tk.LEFT)
+        self.barre = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.defiler)
+        self.barre.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Pool d'éléments réutilisés pour toutes les lignes
+        self.elements = [self.canvas.create_text(10, hauteur_ligne // 2 + i * hauteur_ligne,
+                                                 text="", font=('Arial', 9), anchor='w')
+                         for i in range(self.nb_visibles)]
+        self.element_vide = self.canvas.create_text(largeur // 2, hauteur // 2, text=texte_vide,
+                                                    font=('Arial', 10), fill='#888888')
+        
+        # Défilement à la molette (Windows/macOS puis Linux)
+        self.canvas.bind('<MouseWheel>', lambda e: self.defiler('scroll', -1 if e.delta > 0 else 1, 'units'))
+        self.canvas.bind('<Button-4>', lambda e: self.defiler('scroll', -1, 'units'))
+        self.canvas.bind('<Button-5>', lambda e: self.defiler('scroll', 1, 'units'))
+        
+        self.rafraichir()
+    
+    def pack(self, **options):
+        """Place la liste dans son parent"""
+        self.frame.pack(**options)
+    
+    def ajouter_bloc(self, lignes: List[Tuple[str, str]]):
+        """Ajoute un bloc de lignes en tête de liste et revient en haut"""
+        self.lignes.extendleft(reversed(lignes))
+        self.premiere = 0
+        self.rafraichir()
+    
+    def vider(self):
+        """Supprime toutes les lignes"""
+        self.lignes.clear()
+        self.premiere = 0
+        self.rafraichir()
+    
+    def defiler(self, action, quantite, unite=None):
+        """Fait défiler la liste (protocole de commande d'une Scrollbar)"""
+        total = len(self.lignes)
+        if action == 'moveto':
+            premiere = int(float(quantite) * total)
+        else:
+            pas = self.nb_visibles if unite == 'pages' else 1
+            premiere = self.premiere + int(quantite) * pas
+        premiere = max(0, min(premiere, total - self.nb_visibles))
+        if premiere != self.premiere:
+            self.premiere = premiere
+            self.rafraichir()
+    
+    def rafraichir(self):
+        """Redessine les lignes visibles en réutilisant le pool d'éléments"""
+        total = len(self.lignes)
+        for i, element in enumerate(self.elements):
+            index = self.premiere + i
+            if index < total:
+                texte, couleur = self.lignes[index]
+                self.canvas.itemconfig(element, text=texte, fill=couleur, state='normal')
+            else:
+                self.canvas.itemconfig(element, state='hidden')
+        self.canvas.itemconfig(self.element_vide, state='hidden' if total else 'normal')
+        
+        if total > self.nb_visibles:
+            self.barre.set(self.premiere / total, (self.premiere + self.nb_visibles) / total)
+        else:
+            self.barre.set(0, 1)
 
 class InterfaceRoulette:
     """Interface graphique du jeu de roulette"""
     
+    # Nombre de positions précédentes de la boule affichées en traînée (0 = pas de traînée)
+    LONGUEUR_TRAINEE = 0
+    
+    # Durée de la rotation (en secondes) et cadence visée, modifiables par instance
+    DUREE_ROTATION = 5.0
+    FPS_ANIMATION = 30
+    
     def __init__(self):
         self.jeu = Roulette()
         self.root = tk.Tk()
@@ -193,17 +866,35 @@ class InterfaceRoulette:
         self.animation_en_cours = False
         self.angle_rotation = 0
         self.angle_final = 0
-        self.temps_animation = 0
+        self.animation = None
+        self.compteur_images = CompteurImages(self.FPS_ANIMATION)
+        self.rapport_images = None  # Mesures de la dernière animation de la roue
         
         # Variables pour les jetons
         self.jetons_places = []
         self.jeton_en_cours_deplacement = None
         self.jeton_selectionne = None
-        self.paris_visuels = []  # Pour afficher les jetons placés
+        self.piles_jetons = {}  # Piles de jetons affichées, par case de la table
         
+        self.creer_rafraichissement()
         self.creer_interface()
         self.nouvelle_partie()
     
+    def creer_rafraichissement(self):
+        """Prépare le rafraîchissement différé du solde et des mises, des jetons et du message"""
+        self.message_en_attente = None
+        self.rafraichissement = PlanificateurRafraichissement(self.root)
+        self.rafraichissement.enregistrer('affichage', self.mettre_a_jour_affichage)
+        self.rafraichissement.enregistrer('jetons', self.creer_jetons_disponibles)
+        # Le message passe en dernier pour ne pas être écrasé par mettre_a_jour_affichage
+        self.rafraichissement.enregistrer('message', self.afficher_message_en_attente)
+    
+    def afficher_message_en_attente(self):
+        """Affiche le dernier message demandé par un gestionnaire d'événement"""
+        if self.message_en_attente is not None:
+            self.label_resultat.config(text=self.message_en_attente)
+            self.message_en_attente = None
+    
     def creer_interface(self):
         """Crée l'interface utilisateur"""
         # Titre
@@ -265,11 +956,8 @@ class InterfaceRoulette:
                               fg='white', bg='#0d5016')
         label_recap.pack(pady=(5, 2))
         
-        # Canvas pour le récapitulatif
-        self.canvas_recap = tk.Canvas(frame_gauche, width=280, height=100, 
-                                    bg='#1B5E20', highlightthickness=1, 
-                                    relief='sunken', bd=1)
-        self.canvas_recap.pack(pady=2)
+        # Liste défilante du récapitulatif (tour actuel et tours précédents)
+        self.creer_recapitulatif(frame_gauche)
         
         # Frame droite - Table de paris
         frame_droite = tk.Frame(frame_principal, bg='#0d5016')
@@ -286,6 +974,8 @@ class InterfaceRoulette:
         
         self.frame_jetons = tk.Frame(frame_droite, bg='#0d5016')
         self.frame_jetons.pack(pady=2)
+        self.plateau_jetons = PlateauJetons(self.frame_jetons, self.commencer_deplacement,
+                                            self.deplacer_jeton, self.terminer_deplacement)
         
         # Boutons de contrôle des jetons
         frame_boutons_jetons = tk.Frame(frame_droite, bg='#0d5016')
@@ -329,6 +1019,9 @@ class InterfaceRoulette:
         frame_boutons = tk.Frame(frame_controles, bg='#0d5016')
         frame_boutons.pack(side=tk.RIGHT, padx=5, pady=2)
         
+        # Mode turbo : plusieurs tours enchaînés sans animation
+        self.creer_controles_turbo(frame_boutons)
+        
         self.btn_lancer = tk.Button(frame_boutons, text="TOURNER", 
                                   command=self.lancer_roulette,
                                   font=('Arial', 10, 'bold'),
@@ -372,7 +1065,8 @@ class InterfaceRoulette:
                                     bg='#1B5E20', highlightthickness=0)
         self.canvas_table.pack(expand=True)
         
-        # Dessiner la table de paris
+        # Dessiner la table de paris et préparer la résolution des clics à partir de la même disposition
+        self.grille_clics = GrilleClics(DISPOSITION_TABLE, 600, 400)
         self.dessiner_table_paris()
         
         # Lier les événements de clic
@@ -383,29 +1077,32 @@ class InterfaceRoulette:
         if not self.jeton_selectionne:
             return
         
-        x, y = event.x, event.y
+        # Le résultat est déjà connu pendant l'animation : plus de mises possibles
+        if self.animation_en_cours:
+            self.label_resultat.config(text="❌ Les jeux sont faits, attendez la fin du tour !")
+            return
         
-        # Déterminer le type de pari selon la position
-        type_pari, valeur = self.determiner_type_pari(x, y)
+        # Déterminer la case visée : le jeton est posé au centre de la case
+        zone = self.grille_clics.zone_a(event.x, event.y)
         
-        if type_pari:
+        if zone:
+            type_pari, valeur = zone.type_pari, zone.valeur
+            x, y = zone.centre
+            
             # Placer le pari
             if self.jeu.placer_pari(type_pari, valeur, self.jeton_selectionne, (x, y)):
                 
-                # Ajouter le jeton visuel
-                self.ajouter_jeton_visuel(x, y, self.jeton_selectionne)
-                self.mettre_a_jour_affichage()
-                self.creer_jetons_disponibles()
+                # Ajouter le jeton visuel ; le reste de l'écran est redessiné une fois par tour de boucle
+                pile = self.ajouter_jeton_visuel(x, y, self.jeton_selectionne)
                 
-                # Calculer le total des paris de ce type
-                total_paris_type = sum(pari.montant_total for pari in self.jeu.paris_actuels 
-                                     if pari.type_pari == type_pari)
                 if type_pari == 'nombre':
-                    self.label_resultat.config(text=f"Pari placé: chiffre {valeur} - Total: {total_paris_type} jetons")
+                    self.message_en_attente = f"Pari placé: chiffre {valeur} - Total: {pile['total']} jetons"
                 else:
-                    self.label_resultat.config(text=f"Pari placé: {type_pari} - Total: {total_paris_type} jetons")
+                    self.message_en_attente = f"Pari placé: {type_pari} - Total: {pile['total']} jetons"
+                self.rafraichissement.marquer('affichage', 'jetons', 'message')
             else:
-                self.label_resultat.config(text="❌ Pas assez de jetons !")
+                self.message_en_attente = "❌ Pas assez de jetons !"
+                self.rafraichissement.marquer('message')
         
         # Le jeton reste sélectionné pour permettre de placer plusieurs paris
     
@@ -422,13 +1119,12 @@ class InterfaceRoulette:
             return
         
         # Rembourser tous les paris
-        for pari in self.jeu.paris_actuels:
-            self.jeu.solde_joueur += pari.montant_total
+        self.jeu.rembourser_paris()
         
         # Vider la liste des paris
         self.jeu.paris_actuels = []
         
-        # Effacer tous les jetons visuels (redessine automatiquement la table)
+        # Effacer tous les jetons visuels (la table reste en place)
         self.effacer_paris_visuels()
         
         # Mettre à jour l'affichage
@@ -472,10 +1168,8 @@ class InterfaceRoulette:
     
     def afficher_paris_visuels(self):
         """Affiche visuellement tous les paris actuels sur la table"""
-        # Effacer d'abord tous les paris visuels existants
-        self.effacer_paris_visuels()
-        
-        # Afficher chaque pari
+        # Calculer les piles attendues, case par case
+        cibles = {}
         for pari in self.jeu.paris_actuels:
             if pari.position:
                 # Utiliser valeur_jeton si disponible, sinon calculer à partir du montant
@@ -483,141 +1177,59 @@ class InterfaceRoulette:
                     valeur_afficher = pari.valeur_jeton
                 else:
                     valeur_afficher = pari.montant_total // pari.jetons
-                self.ajouter_jeton_visuel(pari.position[0], pari.position[1], valeur_afficher)
+                cle, centre = self.cle_pile(pari.position[0], pari.position[1])
+                cible = cibles.setdefault(cle, [centre, 0, 0])
+                cible[1] += 1
+                cible[2] += valeur_afficher
+        
+        # Ne toucher que les piles qui changent : les autres restent telles quelles
+        for cle in list(self.piles_jetons):
+            if cle not in cibles:
+                self.retirer_pile(cle)
+        for cle, (centre, nombre, total) in cibles.items():
+            pile = self.piles_jetons.get(cle)
+            if pile is None:
+                pile = self.creer_pile(cle, centre[0], centre[1])
+            elif pile['nombre'] == nombre and pile['total'] == total:
+                continue
+            pile['nombre'] = nombre
+            pile['total'] = total
+            self.dessiner_pile(pile)
     
-    def regrouper_paris_identiques(self, paris):
-        """Regroupe les paris par type, en séparant les chiffres des autres types"""
-        paris_groupes = {}
-        
-        for pari in paris:
-            # Pour les paris sur des chiffres, grouper tous les chiffres ensemble
-            if pari.type_pari == 'nombre':
-                cle = 'nombres'  # Clé unique pour tous les chiffres
-            else:
-                # Pour les autres types de paris, garder le regroupement par type
-                cle = pari.type_pari
-            
-            if cle not in paris_groupes:
-                paris_groupes[cle] = {
-                    'type_pari': pari.type_pari,
-                    'valeur': pari.valeur if pari.type_pari != 'nombre' else None,
-                    'montant_total': 0,
-                    'jetons_total': 0,
-                    'position': pari.position,
-                    'chiffres': set() if pari.type_pari == 'nombre' else None
-                }
-            
-            # Additionner les montants et jetons
-            paris_groupes[cle]['montant_total'] += pari.montant_total
-            paris_groupes[cle]['jetons_total'] += pari.jetons
-            
-            # Pour les chiffres, collecter tous les chiffres misés
-            if pari.type_pari == 'nombre':
-                paris_groupes[cle]['chiffres'].add(pari.valeur)
-        
-        return list(paris_groupes.values())
+    def creer_recapitulatif(self, parent_frame):
+        """Crée la liste défilante du récapitulatif des gains et pertes"""
+        self.liste_recap = ListeVirtuelle(parent_frame, 264, 100)
+        self.liste_recap.pack(pady=2)
+        self.canvas_recap = self.liste_recap.canvas
     
-    def generer_recapitulatif(self, paris_avant_lancer, numero_gagnant):
-        """Génère le récapitulatif des gains et pertes"""
-        self.canvas_recap.delete("all")
-        
-        if not paris_avant_lancer:
-            self.canvas_recap.create_text(140, 60, text="Aucun pari", 
-                                        font=('Arial', 10), fill='#888888')
+    def generer_recapitulatif(self, reglement):
+        """Ajoute en tête du récapitulatif les gains et pertes du tour, à partir de son règlement"""
+        if reglement is None:
             return
         
-        # Calculer les dimensions
-        y_position = 5
-        
-        # Regrouper les paris identiques
-        paris_groupes = self.regrouper_paris_identiques(paris_avant_lancer)
+        net = reglement.net
+        lignes = [(f"🎯 Numéro {reglement.numero} - Bilan: {'+' if net >= 0 else ''}{net} jetons", '#FFD700')]
+        if not reglement.groupes:
+            lignes.append(("Aucun pari", '#888888'))
         
-        numero_gagnant = self.jeu.numero_gagnant
-        ligne_height = 20
-        
-        for pari_groupe in paris_groupes:
-            # Gestion spéciale pour les paris sur des chiffres
-            if pari_groupe['type_pari'] == 'nombre':
-                # Vérifier si au moins un chiffre est gagnant
-                chiffres_gagnants = []
-                chiffres_perdants = []
-                
-                for chiffre in pari_groupe['chiffres']:
-                    # Vérifier directement si le chiffre correspond au numéro gagnant
-                    est_gagnant = (chiffre == numero_gagnant)
-                    if est_gagnant:
-                        chiffres_gagnants.append(chiffre)
-                    else:
-                        chiffres_perdants.append(chiffre)
-                
-                # Afficher les gains
-                if chiffres_gagnants:
-                    multiplicateur = self.jeu.get_multiplicateur('nombre')
-                    # Calculer le montant gagnant correctement pour chaque chiffre gagnant
-                    montant_gagnant = 0
-                    for chiffre in chiffres_gagnants:
-                        montant_chiffre = sum(pari.montant_total for pari in paris_avant_lancer 
-                                            if pari.type_pari == 'nombre' and pari.valeur == chiffre)
-                        montant_gagnant += montant_chiffre
-                    
-                    gain = montant_gagnant * multiplicateur
-                    chiffres_str = ','.join(map(str, sorted(chiffres_gagnants)))
-                    message = f"✅ Tu as gagné {gain} jetons sur les chiffres {chiffres_str} (mise: {montant_gagnant} x {multiplicateur})"
-                    self.canvas_recap.create_text(10, y_position, text=message, 
-                                                font=('Arial', 9), fill='#00FF00', anchor='w')
-                    y_position += ligne_height
-                
-                # Afficher les pertes
-                if chiffres_perdants:
-                    # Calculer le montant perdu correctement pour chaque chiffre perdant
-                    montant_perdant = 0
-                    for chiffre in chiffres_perdants:
-                        montant_chiffre = sum(pari.montant_total for pari in paris_avant_lancer 
-                                            if pari.type_pari == 'nombre' and pari.valeur == chiffre)
-                        montant_perdant += montant_chiffre
-                    
-                    chiffres_str = ','.join(map(str, sorted(chiffres_perdants)))
-                    message = f"❌ Tu as perdu {montant_perdant} jetons sur les chiffres {chiffres_str}"
-                    self.canvas_recap.create_text(10, y_position, text=message, 
-                                                font=('Arial', 9), fill='#FF0000', anchor='w')
-                    y_position += ligne_height
+        for groupe in reglement.groupes:
+            if groupe['type_pari'] == 'nombre':
+                chiffres_str = ','.join(map(str, sorted(groupe['chiffres'])))
+                if groupe['gagnant']:
+                    message = f"✅ Tu as gagné {groupe['gain']} jetons sur les chiffres {chiffres_str} (mise: {groupe['mise']} x {groupe['multiplicateur']})"
+                else:
+                    message = f"❌ Tu as perdu {groupe['mise']} jetons sur les chiffres {chiffres_str}"
             else:
-                # Gestion normale pour les autres types de paris
-                # Calculer la valeur du jeton à partir du montant total et du nombre de jetons
-                valeur_jeton = pari_groupe['montant_total'] // pari_groupe['jetons_total']
-                pari_temp = Pari(pari_groupe['type_pari'], pari_groupe['valeur'], 
-                               pari_groupe['jetons_total'], pari_groupe['position'], valeur_jeton)
-                
-                # Définir temporairement le numéro gagnant pour la vérification
-                self.jeu.numero_gagnant = numero_gagnant
-                est_gagnant = self.jeu.verifier_pari_gagnant(pari_temp)
-                
-                # Formater le nom du pari
-                nom_pari = self.formater_nom_pari(pari_temp)
-                
-                if est_gagnant:
-                    multiplicateur = self.jeu.get_multiplicateur(pari_groupe['type_pari'])
-                    gain = pari_groupe['montant_total'] * multiplicateur
-                    couleur = '#00FF00'  # Vert pour les gains
-                    if pari_groupe['jetons_total'] > 1:
-                        message = f"✅ Tu as gagné {gain} jetons sur {nom_pari} ({pari_groupe['jetons_total']} jetons)"
-                    else:
-                        message = f"✅ Tu as gagné {gain} jetons sur {nom_pari}"
+                nom_pari = self.formater_nom_pari(groupe['pari'])
+                detail_jetons = f" ({groupe['jetons']} jetons)" if groupe['jetons'] > 1 else ""
+                if groupe['gagnant']:
+                    message = f"✅ Tu as gagné {groupe['gain']} jetons sur {nom_pari}{detail_jetons}"
                 else:
-                    couleur = '#FF0000'  # Rouge pour les pertes
-                    if pari_groupe['jetons_total'] > 1:
-                        message = f"❌ Tu as perdu {pari_groupe['montant_total']} jetons sur {nom_pari} ({pari_groupe['jetons_total']} jetons)"
-                    else:
-                        message = f"❌ Tu as perdu {pari_groupe['montant_total']} jetons sur {nom_pari}"
-                
-                # Afficher le message
-                self.canvas_recap.create_text(10, y_position, text=message, 
-                                            font=('Arial', 9), fill=couleur, anchor='w')
-                y_position += ligne_height
+                    message = f"❌ Tu as perdu {groupe['mise']} jetons sur {nom_pari}{detail_jetons}"
             
-            # Si on dépasse la hauteur du canvas, arrêter
-            if y_position > 85:
-                break
+            lignes.append((message, '#00FF00' if groupe['gagnant'] else '#FF0000'))
+        
+        self.liste_recap.ajouter_bloc(lignes)
     
     def formater_nom_pari(self, pari):
         """Formate le nom du pari pour l'affichage"""
@@ -652,69 +1264,68 @@ class InterfaceRoulette:
     
     def determiner_type_pari(self, x, y):
         """Détermine le type de pari selon la position du clic"""
-        # Zone du 0 (largeur de 12 cellules)
-        if 50 <= x <= 470 and 50 <= y <= 95:
-            return "nombre", 0
-        
-        # Grille des nombres 1-36 (disposition horizontale : 3 rangées de 12)
-        if 50 <= x <= 470 and 95 <= y <= 230:
-            col = (x - 50) // 35
-            row = (y - 95) // 45
-            if 0 <= col <= 11 and 0 <= row <= 2:
-                # Organisation traditionnelle de la roulette :
-                # Rangée 1: 1, 4, 7, 10, 13, 16, 19, 22, 25, 28, 31, 34
-                # Rangée 2: 2, 5, 8, 11, 14, 17, 20, 23, 26, 29, 32, 35  
-                # Rangée 3: 3, 6, 9, 12, 15, 18, 21, 24, 27, 30, 33, 36
-                numero = 1 + col * 3 + row
-                return "nombre", numero
-        
-        # Paris simples (en bas, disposition horizontale)
-        if 50 <= x <= 590 and 250 <= y <= 310:
-            index = (x - 50) // 90
-            paris = ["manque", "pair", "rouge", "noir", "impair", "passe"]
-            if 0 <= index < len(paris):
-                return paris[index], None
-        
-        # Douzaines (à droite des colonnes "2to1")
-        if 470 <= x <= 550 and 95 <= y <= 230:
-            index = (y - 95) // 45
-            douzaines = ["douzaine1", "douzaine2", "douzaine3"]
-            if 0 <= index < len(douzaines):
-                return douzaines[index], None
-        
-        # Colonnes "2to1" (à droite de la grille)
-        if 470 <= x <= 530 and 95 <= y <= 230:
-            col_index = (y - 95) // 45
-            if 0 <= col_index <= 2:
-                return f"colonne{col_index + 1}", None
-        
-        return None, None
+        zone = self.grille_clics.zone_a(x, y)
+        if zone is None:
+            return None, None
+        return zone.type_pari, zone.valeur
+    
+    def cle_pile(self, x, y):
+        """Retourne la case de la table (et son centre) où s'empilent les jetons posés en (x, y)"""
+        zone = self.grille_clics.zone_a(x, y)
+        if zone is None:
+            # Hors de toute zone : case de 20 pixels
+            return (x // 20, y // 20), (x, y)
+        return (zone.type_pari, zone.valeur), zone.centre
     
     def ajouter_jeton_visuel(self, x, y, valeur):
-        """Ajoute un jeton visuel sur la table"""
-        # Compter les jetons déjà placés à cette position
-        jetons_ici = 0
-        for pari in self.jeu.paris_actuels:
-            if pari.position and abs(pari.position[0] - x) < 20 and abs(pari.position[1] - y) < 20:
-                jetons_ici += 1
-        
-        # Calculer la position du jeton (empilage)
-        offset_x = (jetons_ici % 3) * 6 - 6  # 3 jetons par rangée
-        offset_y = (jetons_ici // 3) * 6 - 6  # Empilage vertical
-        
-        # Dessiner un petit cercle pour représenter le jeton
-        jeton_id = self.canvas_table.create_oval(x - 8 + offset_x, y - 8 + offset_y, 
-                                    x + 8 + offset_x, y + 8 + offset_y, 
-                                    fill='#FFD700', outline='#000000', width=2, tags="jeton")
-        texte_id = self.canvas_table.create_text(x + offset_x, y + offset_y, text=str(valeur), 
-                                    font=('Arial', 6, 'bold'), fill='#000000', tags="jeton")
-        
-        # Stocker les IDs pour pouvoir les supprimer
-        self.paris_visuels.append((jeton_id, texte_id))
+        """Ajoute un jeton visuel sur la table et retourne la pile mise à jour"""
+        cle, (x, y) = self.cle_pile(x, y)
+        pile = self.piles_jetons.get(cle)
+        if pile is None:
+            pile = self.creer_pile(cle, x, y)
+        
+        pile['nombre'] += 1
+        pile['total'] += valeur
+        self.dessiner_pile(pile)
+        return pile
+    
+    def creer_pile(self, cle, x, y):
+        """Crée les éléments d'une pile vide, une fois pour toutes, au-dessus de la table"""
+        ombre_id = self.canvas_table.create_oval(x - 8, y - 6, x + 12, y + 14,
+                                               fill='#B8860B', outline='#000000', width=1,
+                                               state='hidden', tags="jeton")
+        jeton_id = self.canvas_table.create_oval(x - 10, y - 10, x + 10, y + 10, 
+                                               fill='#FFD700', outline='#000000', width=2, tags="jeton")
+        texte_id = self.canvas_table.create_text(x, y, text="", 
+                                               font=('Arial', 6, 'bold'), fill='#000000', tags="jeton")
+        compteur_id = self.canvas_table.create_text(x + 12, y - 10, text="", anchor='w',
+                                                  font=('Arial', 7, 'bold'), fill='#FFFFFF',
+                                                  state='hidden', tags="jeton")
+        pile = {'nombre': 0, 'total': 0, 'ids': (ombre_id, jeton_id, texte_id, compteur_id)}
+        self.piles_jetons[cle] = pile
+        return pile
+    
+    def dessiner_pile(self, pile):
+        """Met à jour l'affichage d'une pile (montant total et nombre de jetons)"""
+        ombre_id, jeton_id, texte_id, compteur_id = pile['ids']
+        self.canvas_table.itemconfig(texte_id, text=str(pile['total']))
+        if pile['nombre'] > 1:
+            self.canvas_table.itemconfig(ombre_id, state='normal')
+            self.canvas_table.itemconfig(compteur_id, text=f"×{pile['nombre']}", state='normal')
+        else:
+            self.canvas_table.itemconfig(ombre_id, state='hidden')
+            self.canvas_table.itemconfig(compteur_id, state='hidden')
+    
+    def retirer_pile(self, cle):
+        """Supprime une pile de la table"""
+        pile = self.piles_jetons.pop(cle, None)
+        if pile is not None:
+            for item_id in pile['ids']:
+                self.canvas_table.delete(item_id)
     
     def dessiner_table_paris(self):
-        """Dessine la table de paris de roulette complète"""
-        self.canvas_table.delete("all")
+        """Dessine la table de paris de roulette complète (couche de fond, sous les jetons)"""
+        self.canvas_table.delete("table")
         
         # Dimensions de la table (ajustées au canvas)
         table_width = 600
@@ -722,229 +1333,23 @@ class InterfaceRoulette:
         
         # Dessiner le fond vert de la table
         self.canvas_table.create_rectangle(0, 0, table_width, table_height, 
-                                         fill='#1B5E20', outline='#000000', width=2)
-        
-        # Zone des nombres (grille 3x12 + 0) - en haut à gauche
-        self.dessiner_grille_nombres()
-        
-        # Zone des colonnes (à droite de la grille)
-        self.dessiner_colonnes()
-        
-        # Zone des paris simples (en bas, disposition horizontale)
-        self.dessiner_paris_simples()
-        
-        # Zone des douzaines (en bas, après les paris simples)
-        self.dessiner_douzaines()
-    
-    def dessiner_grille_nombres(self):
-        """Dessine la grille des nombres 1-36 + 0 en disposition horizontale"""
-        # Position de la grille (centrée et plus grande)
-        start_x = 50
-        start_y = 50
-        cell_width = 35  # Plus larges pour une meilleure visibilité
-        cell_height = 45  # Plus hautes pour une meilleure visibilité
-        
-        # Dessiner le 0 (en haut, largeur de 12 cellules)
-        zero_x = start_x
-        zero_y = start_y
-        zero_width = 12 * cell_width  # Largeur de 12 cellules
-        self.canvas_table.create_rectangle(zero_x, zero_y, zero_x + zero_width, zero_y + cell_height,
-                                         fill='#00AA00', outline='#000000', width=1)
-        self.canvas_table.create_text(zero_x + zero_width//2, zero_y + cell_height//2, 
-                                    text="0", font=('Arial', 14, 'bold'), fill='white')
-        
-        # Dessiner la grille 3x12 des nombres 1-36 (disposition horizontale)
-        nombres_rouges = [1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36]
-        
-        # Organisation traditionnelle des rangées de roulette :
-        # Rangée 1: 1, 4, 7, 10, 13, 16, 19, 22, 25, 28, 31, 34
-        # Rangée 2: 2, 5, 8, 11, 14, 17, 20, 23, 26, 29, 32, 35  
-        # Rangée 3: 3, 6, 9, 12, 15, 18, 21, 24, 27, 30, 33, 36
-        for row in range(3):
-            for col in range(12):
-                numero = 1 + col * 3 + row  # Calcul pour l'organisation traditionnelle
-                x = start_x + col * cell_width
-                y = start_y + cell_height + row * cell_height  # Commencer directement après le 0
-                
-                # Couleur selon le numéro
-                if numero in nombres_rouges:
-                    couleur = '#FF0000'  # Rouge
-                else:
-                    couleur = '#000000'  # Noir
-                
-                # Dessiner la cellule
-                self.canvas_table.create_rectangle(x, y, x + cell_width, y + cell_height,
-                                                 fill=couleur, outline='#000000', width=1)
-                
-                # Texte du numéro
-                couleur_texte = 'white' if couleur == '#000000' else 'white'
-                self.canvas_table.create_text(x + cell_width//2, y + cell_height//2, 
-                                            text=str(numero), font=('Arial', 12, 'bold'), 
-                                            fill=couleur_texte)
-    
-    
-    def dessiner_paris_simples(self):
-        """Dessine les zones de paris simples (rouge, noir, pair, impair, etc.)"""
-        start_x = 50  # Centré avec la grille
-        start_y = 250  # En bas de la grille des nombres
-        cell_width = 90  # Plus larges
-        cell_height = 60  # Plus hautes
-        
-        # Paris simples
-        paris = [
-            ("1-18", "manque"),
-            ("Even", "pair"),
-            ("Red", "rouge"),
-            ("Black", "noir"),
-            ("Odd", "impair"),
-            ("19-36", "passe")
-        ]
-        
-        for i, (texte, type_pari) in enumerate(paris):
-            x = start_x + i * cell_width
-            y = start_y
-            
-            # Couleur de fond selon le type
-            if type_pari == "rouge":
-                couleur_fond = '#FF0000'
-            elif type_pari == "noir":
-                couleur_fond = '#000000'
-            else:
-                couleur_fond = '#2E7D32'
-            
-            # Dessiner la zone de pari
-            self.canvas_table.create_rectangle(x, y, x + cell_width, y + cell_height,
-                                             fill=couleur_fond, outline='#000000', width=1)
-            
-            # Texte
-            couleur_texte = 'white'
-            self.canvas_table.create_text(x + cell_width//2, y + cell_height//2, 
-                                        text=texte, font=('Arial', 14, 'bold'), 
-                                        fill=couleur_texte)
-    
-    def dessiner_douzaines(self):
-        """Dessine les zones de paris sur douzaines"""
-        start_x = 470  # À droite des colonnes "2to1" (50 + 12*35 = 470)
-        start_y = 95   # Alignées avec les colonnes (50 + 45 = 95)
-        cell_width = 80  # Plus larges
-        cell_height = 45  # Plus hautes
-        
-        douzaines = [
-            ("1-12", "douzaine1"),
-            ("13-24", "douzaine2"),
-            ("25-36", "douzaine3")
-        ]
-        
-        for i, (texte, type_pari) in enumerate(douzaines):
-            x = start_x
-            y = start_y + i * cell_height  # Verticalement alignées
-            
-            # Dessiner la zone de pari
-            self.canvas_table.create_rectangle(x, y, x + cell_width, y + cell_height,
-                                             fill='#2E7D32', outline='#000000', width=1)
-            
-            # Texte
-            self.canvas_table.create_text(x + cell_width//2, y + cell_height//2, 
-                                        text=texte, font=('Arial', 12, 'bold'), 
-                                        fill='white')
-    
-    def dessiner_colonnes(self):
-        """Dessine les zones de paris sur colonnes"""
-        start_x = 470  # À droite de la grille des nombres (50 + 12*35 = 470)
-        start_y = 95  # Commencer après le 0 (50 + 45 = 95)
-        cell_width = 60  # Plus larges
-        cell_height = 45  # Plus hautes
-        
-        # 3 colonnes "2to1" - une pour chaque rangée
-        for col in range(3):
-            x = start_x
-            y = start_y + col * cell_height  # Une par rangée
-            
-            # Dessiner la zone de pari (hauteur d'une rangée)
-            self.canvas_table.create_rectangle(x, y, x + cell_width, y + cell_height,
-                                             fill='#2E7D32', outline='#000000', width=1)
-            
-            # Texte "2to1" centré
-            self.canvas_table.create_text(x + cell_width//2, y + cell_height//2, 
-                                        text="2to1", font=('Arial', 12, 'bold'), 
-                                        fill='white')
+                                         fill='#1B5E20', outline='#000000', width=2, tags="table")
+        
+        # Dessiner chaque zone de pari (nombres, colonnes, douzaines, paris simples)
+        for zone in DISPOSITION_TABLE:
+            self.canvas_table.create_rectangle(zone.x1, zone.y1, zone.x2, zone.y2,
+                                             fill=zone.couleur, outline='#000000', width=1, tags="table")
+            x_texte, y_texte = zone.centre
+            self.canvas_table.create_text(x_texte, y_texte, text=zone.texte, 
+                                        font=('Arial', zone.taille_police, 'bold'), 
+                                        fill='white', tags="table")
+        
+        # Les jetons éventuellement présents restent au-dessus de la table
+        self.canvas_table.tag_lower("table")
     
     def creer_jetons_disponibles(self):
-        """Crée les jetons disponibles (repris du blackjack)"""
-        # Effacer les jetons existants
-        for widget in self.frame_jetons.winfo_children():
-            widget.destroy()
-        
-        # Créer des jetons de différentes valeurs
-        valeurs_jetons = [5, 10, 25, 50, 100, 500]
-        
-        # Designs des jetons (même que le blackjack)
-        designs_jetons = {
-            5: {'couleur_centre': '#FFFFFF', 'couleur_inner': '#4A90E2', 'couleur_outer': '#E8F4FD', 'couleur_texte': '#000000', 'couleur_texte_inner': '#FFFFFF'},
-            10: {'couleur_centre': '#FFD700', 'couleur_inner': '#DC143C', 'couleur_outer': '#FFF8DC', 'couleur_texte': '#000000', 'couleur_texte_inner': '#FFFFFF'},
-            25: {'couleur_centre': '#32CD32', 'couleur_inner': '#87CEEB', 'couleur_outer': '#F0FFF0', 'couleur_texte': '#000000', 'couleur_texte_inner': '#000000'},
-            50: {'couleur_centre': '#4169E1', 'couleur_inner': '#DC143C', 'couleur_outer': '#E6F3FF', 'couleur_texte': '#FFFFFF', 'couleur_texte_inner': '#FFFFFF'},
-            100: {'couleur_centre': '#000000', 'couleur_inner': '#FFD700', 'couleur_outer': '#F5F5F5', 'couleur_texte': '#FFFFFF', 'couleur_texte_inner': '#000000'},
-            500: {'couleur_centre': '#191970', 'couleur_inner': '#FFFFFF', 'couleur_outer': '#E6F3FF', 'couleur_texte': '#FFFFFF', 'couleur_texte_inner': '#000000'}
-        }
-        
-        for valeur in valeurs_jetons:
-            if self.jeu.solde_joueur >= valeur:
-                quantite_max = self.jeu.solde_joueur // valeur
-                
-                design = designs_jetons[valeur]
-                
-                # Créer un canvas pour le jeton
-                canvas = tk.Canvas(self.frame_jetons, 
-                                 width=60, height=60,
-                                 bg='#0d5016', highlightthickness=0)
-                canvas.pack(side=tk.LEFT, padx=3, pady=3)
-                
-                # Dessiner le jeton
-                self.dessiner_jeton(canvas, valeur, design, quantite_max)
-                
-                # Lier les événements de drag & drop
-                canvas.bind('<Button-1>', lambda e, v=valeur: self.commencer_deplacement(e, v))
-                canvas.bind('<B1-Motion>', self.deplacer_jeton)
-                canvas.bind('<ButtonRelease-1>', self.terminer_deplacement)
-    
-    def dessiner_jeton(self, canvas, valeur, design, quantite_max):
-        """Dessine un jeton réaliste"""
-        # Cercle extérieur
-        canvas.create_oval(5, 5, 55, 55, 
-                          fill=design['couleur_outer'], 
-                          outline='#C0C0C0', width=2)
-        
-        # Cercle intérieur
-        canvas.create_oval(10, 10, 50, 50, 
-                          fill=design['couleur_inner'], 
-                          outline='#A0A0A0', width=1)
-        
-        # Cercle central
-        canvas.create_oval(18, 18, 42, 42, 
-                          fill=design['couleur_centre'], 
-                          outline='#808080', width=1)
-        
-        # Texte de la valeur
-        canvas.create_text(30, 30, text=f"${valeur}", 
-                          font=('Arial', 8, 'bold'),
-                          fill=design['couleur_texte'])
-        
-        # Texte "CASINO"
-        canvas.create_text(30, 20, text="CASINO", 
-                          font=('Arial', 4, 'bold'),
-                          fill=design['couleur_texte_inner'])
-        
-        # Texte "POKER"
-        canvas.create_text(30, 40, text="POKER", 
-                          font=('Arial', 4, 'bold'),
-                          fill=design['couleur_texte_inner'])
-        
-        # Indicateur de quantité
-        if quantite_max > 1:
-            canvas.create_text(30, 50, text=f"max {quantite_max}", 
-                              font=('Arial', 3),
-                              fill='#666666')
+        """Met à jour le plateau de jetons disponibles selon le solde"""
+        self.plateau_jetons.mettre_a_jour(self.jeu.solde_joueur)
     
     def dessiner_roue(self):
         """Dessine la roue de roulette réaliste"""
@@ -960,27 +1365,14 @@ class InterfaceRoulette:
                                    centre_x + rayon_exterieur, centre_y + rayon_exterieur,
                                    fill='#1B5E20', outline='#000000', width=2)
         
-        # Disposition réelle des numéros sur une roulette européenne (dans l'ordre)
-        numeros_ordre = [0, 32, 15, 19, 4, 21, 2, 25, 17, 34, 6, 27, 13, 36, 11, 30, 8, 23, 10, 5, 24, 16, 33, 1, 20, 14, 31, 9, 22, 18, 29, 7, 28, 12, 35, 3, 26]
+        # Dessiner les secteurs à partir de la géométrie précalculée (37 secteurs, 0-36)
+        geometrie = GeometrieRoue.pour(centre_x, centre_y, rayon_exterieur - 5, rayon_interieur + 5)
         
-        # Dessiner les secteurs
-        angle_par_secteur = 360 / 37  # 37 secteurs (0-36)
-        
-        for i, numero in enumerate(numeros_ordre):
-            angle_debut = i * angle_par_secteur
-            angle_fin = (i + 1) * angle_par_secteur
-            
-            # Couleur du secteur selon la roulette européenne
-            if numero == 0:
-                couleur = '#00AA00'  # Vert pour le 0
-            elif numero in [1, 3, 5, 7, 9, 12, 14, 16, 18, 19, 21, 23, 25, 27, 30, 32, 34, 36]:
-                couleur = '#CC0000'  # Rouge
-            else:
-                couleur = '#000000'  # Noir
-            
-            # Dessiner le secteur
-            self.dessiner_secteur_realiste(centre_x, centre_y, rayon_exterieur - 5, rayon_interieur + 5, 
-                                angle_debut, angle_fin, couleur, numero)
+        for numero, couleur, points, (x_num, y_num) in geometrie.secteurs:
+            self.canvas_roue.create_polygon(points, fill=couleur, outline='#000000', width=1)
+            self.canvas_roue.create_text(x_num, y_num, text=str(numero), 
+                                       font=('Arial', 8, 'bold'),
+                                       fill='#FFFFFF')
         
         # Dessiner le centre (cercle blanc)
         self.canvas_roue.create_oval(centre_x - rayon_interieur, centre_y - rayon_interieur, 
@@ -994,15 +1386,15 @@ class InterfaceRoulette:
         """Dessine l'historique des numéros tombés"""
         self.canvas_historique.delete("all")
         
-        if not self.jeu.historique:
+        # Afficher les 12 derniers numéros (2 rangées de 6)
+        derniers_numeros = self.jeu.statistiques.derniers_numeros(12)
+        
+        if not derniers_numeros:
             # Afficher un message si aucun historique
             self.canvas_historique.create_text(140, 50, text="Aucun numéro encore", 
                                              font=('Arial', 10), fill='#888888')
             return
         
-        # Afficher les 12 derniers numéros (2 rangées de 6)
-        derniers_numeros = self.jeu.historique[-12:] if len(self.jeu.historique) >= 12 else self.jeu.historique
-        
         # Dimensions des cellules
         cell_width = 40
         cell_height = 30
@@ -1037,67 +1429,26 @@ class InterfaceRoulette:
                                              text=str(numero), font=('Arial', 10, 'bold'), 
                                              fill=couleur_texte)
     
-    def dessiner_secteur_realiste(self, centre_x, centre_y, rayon_exterieur, rayon_interieur, angle_debut, angle_fin, couleur, numero):
-        """Dessine un secteur réaliste de la roue"""
-        # Convertir les angles en radians
-        angle_debut_rad = math.radians(angle_debut)
-        angle_fin_rad = math.radians(angle_fin)
-        
-        # Points du secteur (forme de trapèze)
-        points = []
-        
-        # Point intérieur de début
-        x1 = centre_x + rayon_interieur * math.cos(angle_debut_rad)
-        y1 = centre_y + rayon_interieur * math.sin(angle_debut_rad)
-        points.extend([x1, y1])
-        
-        # Point extérieur de début
-        x2 = centre_x + rayon_exterieur * math.cos(angle_debut_rad)
-        y2 = centre_y + rayon_exterieur * math.sin(angle_debut_rad)
-        points.extend([x2, y2])
-        
-        # Arc extérieur
-        for angle in range(int(angle_debut), int(angle_fin) + 1):
-            angle_rad = math.radians(angle)
-            x = centre_x + rayon_exterieur * math.cos(angle_rad)
-            y = centre_y + rayon_exterieur * math.sin(angle_rad)
-            points.extend([x, y])
-        
-        # Point extérieur de fin
-        x3 = centre_x + rayon_exterieur * math.cos(angle_fin_rad)
-        y3 = centre_y + rayon_exterieur * math.sin(angle_fin_rad)
-        points.extend([x3, y3])
-        
-        # Point intérieur de fin
-        x4 = centre_x + rayon_interieur * math.cos(angle_fin_rad)
-        y4 = centre_y + rayon_interieur * math.sin(angle_fin_rad)
-        points.extend([x4, y4])
-        
-        # Dessiner le secteur
-        self.canvas_roue.create_polygon(points, fill=couleur, outline='#000000', width=1)
-        
-        # Dessiner le numéro
-        angle_milieu = (angle_debut + angle_fin) / 2
-        angle_milieu_rad = math.radians(angle_milieu)
-        rayon_texte = (rayon_exterieur + rayon_interieur) / 2
-        x_num = centre_x + rayon_texte * math.cos(angle_milieu_rad)
-        y_num = centre_y + rayon_texte * math.sin(angle_milieu_rad)
-        
-        couleur_texte = '#FFFFFF'
-        self.canvas_roue.create_text(x_num, y_num, text=str(numero), 
-                                   font=('Arial', 8, 'bold'),
-                                   fill=couleur_texte)
-    
     def dessiner_boule(self, centre_x, centre_y):
         """Dessine la boule de roulette"""
         # Position de la boule (au centre pour commencer)
         self.boule_x = centre_x
         self.boule_y = centre_y
         
-        # Dessiner la boule (cercle blanc avec bordure)
-        self.canvas_roue.create_oval(self.boule_x - 6, self.boule_y - 6, 
-                                   self.boule_x + 6, self.boule_y + 6,
-                                   fill='#FFFFFF', outline='#000000', width=1, tags="boule")
+        # Traînée optionnelle : quelques points qui suivent la boule, cachés au repos
+        self.trainee_ids = []
+        self.positions_trainee = deque(maxlen=self.LONGUEUR_TRAINEE)
+        for i in range(self.LONGUEUR_TRAINEE):
+            rayon = 5 - i * 4 / self.LONGUEUR_TRAINEE
+            self.trainee_ids.append(self.canvas_roue.create_oval(
+                self.boule_x - rayon, self.boule_y - rayon,
+                self.boule_x + rayon, self.boule_y + rayon,
+                fill='#BBBBBB', outline='', state='hidden', tags="trainee"))
+        
+        # Dessiner la boule (cercle blanc avec bordure) : un seul objet, déplacé ensuite
+        self.boule_id = self.canvas_roue.create_oval(self.boule_x - 6, self.boule_y - 6, 
+                                                   self.boule_x + 6, self.boule_y + 6,
+                                                   fill='#FFFFFF', outline='#000000', width=1, tags="boule")
     
     def dessiner_secteur(self, centre_x, centre_y, rayon, angle_debut, angle_fin, couleur, numero):
         """Dessine un secteur de la roue"""
@@ -1190,6 +1541,9 @@ class InterfaceRoulette:
     
     def lancer_roulette(self):
         """Lance la roulette avec animation"""
+        # Appliquer les rafraîchissements en attente avant que le tour ne modifie l'écran
+        self.rafraichissement.executer()
+        
         if not self.jeu.partie_en_cours:
             self.label_resultat.config(text="❌ Aucune partie en cours !")
             return
@@ -1205,44 +1559,107 @@ class InterfaceRoulette:
         self.btn_lancer.config(state=tk.DISABLED)
         self.btn_repetir.config(state=tk.DISABLED)
         
-        # Calculer un angle final aléatoire (sans choisir le numéro à l'avance)
-        tours_extra = random.uniform(3, 6) * 360
-        angle_aleatoire = random.uniform(0, 360)
-        self.angle_final = tours_extra + angle_aleatoire
+        # Le moteur décide du numéro, l'animation se contente de le rejouer
+        numero_gagnant = self.jeu.lancer_roulette()
+        self.angle_final = self.jeu.moteur.angle_pour_numero(numero_gagnant)
+        
+        # Lancer l'animation, pilotée par le temps écoulé et non par le nombre d'images
+        self.positions_trainee.clear()
+        self.canvas_roue.itemconfig("trainee", state='normal')
+        self.animation = PlanificateurAnimation(self.root, self.DUREE_ROTATION, self.animer_roue,
+                                                self.finir_lancer, fps=self.FPS_ANIMATION,
+                                                compteur=self.compteur_images)
+        self.animation.demarrer()
+    
+    def creer_controles_turbo(self, parent_frame):
+        """Crée le sélecteur du nombre de tours et le bouton du mode turbo"""
+        self.var_tours_turbo = tk.IntVar(value=100)
+        self.spin_tours_turbo = tk.Spinbox(parent_frame, from_=1, to=10000, increment=10,
+                                          textvariable=self.var_tours_turbo,
+                                          font=('Arial', 10, 'bold'), width=6)
+        self.spin_tours_turbo.pack(side=tk.LEFT, padx=3)
+        
+        self.btn_turbo = tk.Button(parent_frame, text="⚡ TURBO", 
+                                 command=self.lancer_turbo,
+                                 font=('Arial', 10, 'bold'),
+                                 bg='#FFEB3B', fg='#000000',
+                                 padx=10, pady=5,
+                                 relief='raised', bd=2,
+                                 activebackground='#FFF176',
+                                 activeforeground='#000000')
+        self.btn_turbo.pack(side=tk.LEFT, padx=3)
+    
+    def lancer_turbo(self):
+        """Joue plusieurs tours d'affilée avec les mêmes paris, sans animation"""
+        if self.animation_en_cours:
+            return
+        
+        self.rafraichissement.executer()
+        
+        if not self.jeu.partie_en_cours:
+            self.label_resultat.config(text="❌ Aucune partie en cours !")
+            return
+        
+        if not self.jeu.paris_actuels:
+            self.label_resultat.config(text="❌ Placez des paris avant de lancer !")
+            return
+        
+        try:
+            nb_tours = int(self.var_tours_turbo.get())
+        except (tk.TclError, ValueError):
+            nb_tours = 0
+        if nb_tours <= 0:
+            self.label_resultat.config(text="❌ Nombre de tours invalide !")
+            return
         
-        self.temps_animation = 0
+        # Tous les tours sont réglés par le moteur, l'interface n'est rafraîchie qu'une fois
+        resultats = self.jeu.jouer_tours(nb_tours)
         
-        # Lancer l'animation
-        self.animer_roue()
+        numero = resultats['dernier_numero']
+        couleur_numero = "rouge" if numero in self.jeu.nombres_rouges else "noir" if numero in self.jeu.nombres_noirs else "vert"
+        self.label_numero_actuel.config(text=f"🎯 Dernier numéro: {numero} ({couleur_numero})")
+        
+        # Poser la boule sur le dernier numéro tombé
+        self.animer_boule(self.jeu.moteur.angle_pour_numero(numero), 1.0)
+        
+        self.afficher_recapitulatif_turbo(resultats)
+        
+        self.effacer_paris_visuels()
+        self.jeu.nouvelle_partie()
+        self.mettre_a_jour_affichage()
+        self.dessiner_historique()
+        self.creer_jetons_disponibles()
+        
+        net = resultats['gains_totaux'] - resultats['mise_totale']
+        signe = '+' if net >= 0 else ''
+        self.label_resultat.config(text=f"⚡ {resultats['tours']} tours joués - Net: {signe}{net} jetons")
     
-    def animer_roue(self):
-        """Anime la rotation de la boule"""
-        if self.temps_animation == 0:
-            # Dessiner la roue une seule fois au début
-            self.dessiner_roue()
+    def afficher_recapitulatif_turbo(self, resultats):
+        """Ajoute au récapitulatif le bilan cumulé d'une série de tours turbo"""
+        net = resultats['gains_totaux'] - resultats['mise_totale']
+        meilleur = resultats['meilleur_gain']
+        lignes = [
+            (f"⚡ {resultats['tours']} tours - {resultats['tours_gagnants']} gagnants", '#FFD700'),
+            (f"Total misé: {resultats['mise_totale']} jetons", 'white'),
+            (f"Total gagné: {resultats['gains_totaux']} jetons", 'white'),
+            (f"Bilan: {'+' if net >= 0 else ''}{net} jetons (meilleur tour: {'+' if meilleur >= 0 else ''}{meilleur})",
+             '#00FF00' if net >= 0 else '#FF0000')
+        ]
+        self.liste_recap.ajouter_bloc(lignes)
+    
+    def animer_roue(self, progression):
+        """Anime la rotation de la boule (progression de 0 à 1 selon le temps écoulé)"""
+        ease_progress = 1 - (1 - progression) ** 3  # Easing out cubic
+        angle_actuel = self.angle_final * ease_progress
         
-        if self.temps_animation < 100:  # 100 frames d'animation
-            # Calculer l'angle actuel avec easing
-            progress = self.temps_animation / 100.0
-            ease_progress = 1 - (1 - progress) ** 3  # Easing out cubic
-            
-            angle_actuel = self.angle_final * ease_progress
-            
-            # Faire tourner la boule autour de la roue
-            self.animer_boule(angle_actuel)
-            
-            self.temps_animation += 1
-            self.root.after(50, self.animer_roue)  # 20 FPS
-        else:
-            # Animation terminée
-            self.finir_lancer()
+        # Faire tourner la boule autour de la roue
+        self.animer_boule(angle_actuel, progression)
     
-    def animer_boule(self, angle):
+    def animer_boule(self, angle, progress):
         """Anime la boule qui tourne autour de la roue"""
         centre_x, centre_y = 150, 150
         
-        # Calculer le rayon de l'orbite (la boule se rapproche du centre en ralentissant)
-        progress = self.temps_animation / 100.0
+        # Le rayon de l'orbite dépend de la progression (la boule se rapproche du centre en ralentissant)
         
         # Utiliser l'angle calculé normalement pour toute l'animation
         angle_rad = math.radians(angle)
@@ -1260,53 +1677,34 @@ class InterfaceRoulette:
             phase_finale = (progress - 0.9) / 0.1
             rayon_orbite = 80 * 0.7 * 0.5 + (20 * (1 - phase_finale))  # Entre 28 et 48 pixels du centre
         
+        # La traînée reprend les positions précédentes de la boule
+        if self.trainee_ids:
+            self.positions_trainee.appendleft((self.boule_x, self.boule_y))
+            for i, (x, y) in enumerate(self.positions_trainee):
+                rayon = 5 - i * 4 / len(self.trainee_ids)
+                self.canvas_roue.coords(self.trainee_ids[i], x - rayon, y - rayon, x + rayon, y + rayon)
+        
         # Calculer la position de la boule
         self.boule_x = centre_x + rayon_orbite * math.cos(angle_rad)
         self.boule_y = centre_y + rayon_orbite * math.sin(angle_rad)
         
-        # Effacer seulement la boule précédente
-        self.canvas_roue.delete("boule")
-        
-        # Dessiner la nouvelle position de la boule
-        self.canvas_roue.create_oval(self.boule_x - 6, self.boule_y - 6, 
-                                   self.boule_x + 6, self.boule_y + 6,
-                                   fill='#FFFFFF', outline='#000000', width=1, tags="boule")
+        # Déplacer la boule existante (pas de suppression/recréation à chaque image)
+        self.canvas_roue.coords(self.boule_id, self.boule_x - 6, self.boule_y - 6, 
+                              self.boule_x + 6, self.boule_y + 6)
     
     
     def finir_lancer(self):
         """Termine le lancement de la roulette"""
-        # Sauvegarder les paris avant de les effacer pour le récapitulatif
-        paris_avant_lancer = self.jeu.paris_actuels.copy()
-        
-        # Déterminer le numéro gagnant basé sur l'angle final réel
-        angle_final_reel = self.angle_final % 360  # Normaliser l'angle entre 0 et 360
-        
-        # Disposition réelle des numéros sur une roulette européenne
-        numeros_ordre = [0, 32, 15, 19, 4, 21, 2, 25, 17, 34, 6, 27, 13, 36, 11, 30, 8, 23, 10, 5, 24, 16, 33, 1, 20, 14, 31, 9, 22, 18, 29, 7, 28, 12, 35, 3, 26]
-        
-        # Calculer quel secteur correspond à l'angle final
-        angle_par_secteur = 360 / 37
-        index_secteur = int(angle_final_reel / angle_par_secteur)
-        
-        # S'assurer que l'index est dans la plage valide
-        if index_secteur >= len(numeros_ordre):
-            index_secteur = len(numeros_ordre) - 1
-        
-        numero_gagnant = numeros_ordre[index_secteur]
-        
-        # Définir le numéro gagnant dans le jeu
-        self.jeu.numero_gagnant = numero_gagnant
-        
-        # Ajouter le numéro à l'historique
-        self.jeu.historique.append(numero_gagnant)
-        
-        # Garder seulement les 20 derniers numéros
-        if len(self.jeu.historique) > 20:
-            self.jeu.historique = self.jeu.historique[-20:]
+        # Le numéro a été tiré par le moteur au lancement
+        numero_gagnant = self.jeu.numero_gagnant
         
         # Calculer les gains et terminer la partie
         gains = self.jeu.terminer_partie()
         
+        # Cadence tenue par l'animation de la roue (consultable ici, journalisée si demandé)
+        self.rapport_images = self.compteur_images.rapport()
+        journal_mesures.info("Roue : %s", self.rapport_images)
+        
         # Afficher le numéro qui vient de tomber
         couleur_numero = "rouge" if numero_gagnant in self.jeu.nombres_rouges else "noir" if numero_gagnant in self.jeu.nombres_noirs else "vert"
         self.label_numero_actuel.config(text=f"🎯 Numéro tombé: {numero_gagnant} ({couleur_numero})")
@@ -1318,11 +1716,12 @@ class InterfaceRoulette:
             self.label_resultat.config(text=f"😞 Aucun gain...")
         
         # Générer le récapitulatif des gains/pertes
-        self.generer_recapitulatif(paris_avant_lancer, numero_gagnant)
+        self.generer_recapitulatif(self.jeu.dernier_reglement)
         
         # Réactiver le bouton et arrêter l'animation
         self.btn_lancer.config(state=tk.NORMAL)
         self.animation_en_cours = False
+        self.canvas_roue.itemconfig("trainee", state='hidden')
         
         # Effacer tous les paris visuels de la table
         self.effacer_paris_visuels()
@@ -1344,13 +1743,12 @@ class InterfaceRoulette:
             return
         
         # Rembourser tous les paris avant de commencer une nouvelle partie
-        for pari in self.jeu.paris_actuels:
-            self.jeu.solde_joueur += pari.montant_total
+        self.jeu.rembourser_paris()
         
         # Si le joueur n'a plus d'argent, redémarrer avec 1000 jetons
         if self.jeu.solde_joueur <= 0:
             self.label_resultat.config(text="💸 Vous n'avez plus de jetons !\nRedémarrage avec 1000 jetons.")
-            self.jeu.solde_joueur = 1000
+            self.jeu.portefeuille.reinitialiser()
         
         # Commencer une nouvelle partie
         self.jeu.nouvelle_partie()
@@ -1363,27 +1761,17 @@ class InterfaceRoulette:
     
     def effacer_paris_visuels(self):
         """Efface tous les paris visuels de la table"""
+        # Seuls les jetons sont supprimés : la table, dessinée une fois, reste en place
         if hasattr(self, 'canvas_table'):
-            # Méthode plus robuste : supprimer tous les éléments avec le tag "jeton"
-            self.canvas_table.delete("jeton")
-            self.canvas_table.delete("total")
-            
-            # Supprimer aussi les jetons stockés individuellement
-            for jeton_id, texte_id in self.paris_visuels:
-                try:
-                    self.canvas_table.delete(jeton_id)
-                    self.canvas_table.delete(texte_id)
-                except:
-                    pass  # Ignorer les erreurs si l'élément n'existe plus
-        self.paris_visuels = []
-        
-        # Redessiner la table propre
-        self.dessiner_table_paris()
+            for cle in list(self.piles_jetons):
+                self.retirer_pile(cle)
+        self.piles_jetons = {}
     
     def lancer(self):
         """Lance l'interface du jeu"""
         self.root.mainloop()
 
 if __name__ == "__main__":
+    activer_mesures_si_demande()
     jeu = InterfaceRoulette()
     jeu.lancer()
@@ -0,0 +1,326 @@
+import argparse
+import math
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import List, Tuple
+
+from Roulette import Roulette, Pari
+
+
+class Progression:
+    """Progression de mises de base : mise constante"""
+    nom = "constante"
+
+    def __init__(self, mise_base: int):
+        self.mise_base = mise_base
+        self.reinitialiser()
+
+    def reinitialiser(self):
+        """Revient à la mise de départ"""
+        self.mise_courante = self.mise_base
+
+    def mise(self) -> int:
+        """Retourne la mise souhaitée pour le prochain tour"""
+        return self.mise_courante
+
+    def enregistrer(self, gagne: bool):
+        """Met à jour la progression selon le résultat du tour"""
+        pass
+
+class Martingale(Progression):
+    """Double la mise après chaque perte, revient à la base après un gain"""
+    nom = "martingale"
+
+    def enregistrer(self, gagne: bool):
+        if gagne:
+            self.mise_courante = self.mise_base
+        else:
+            self.mise_courante *= 2
+
+class DAlembert(Progression):
+    """Ajoute une unité après une perte, en retire une après un gain"""
+    nom = "dalembert"
+
+    def enregistrer(self, gagne: bool):
+        if gagne:
+            self.mise_courante = max(self.mise_base, self.mise_courante - self.mise_base)
+        else:
+            self.mise_courante += self.mise_base
+
+class Fibonacci(Progression):
+    """Avance d'un terme de la suite après une perte, recule de deux après un gain"""
+    nom = "fibonacci"
+
+    def reinitialiser(self):
+        self.suite = [1, 1]
+        self.rang = 0
+        self.mise_courante = self.mise_base
+
+    def enregistrer(self, gagne: bool):
+        if gagne:
+            self.rang = max(0, self.rang - 2)
+        else:
+            self.rang += 1
+            if self.rang >= len(self.suite):
+                self.suite.append(self.suite[-1] + self.suite[-2])
+        self.mise_courante = self.suite[self.rang] * self.mise_base
+
+PROGRESSIONS = {
+    'constante': Progression,
+    'martingale': Martingale,
+    'dalembert': DAlembert,
+    'fibonacci': Fibonacci
+}
+
+# Paris à chances simples et douzaines/colonnes (le pari sur un nombre demande une valeur)
+PARIS_SIMULABLES = ['rouge', 'noir', 'pair', 'impair', 'manque', 'passe',
+                    'douzaine1', 'douzaine2', 'douzaine3',
+                    'colonne1', 'colonne2', 'colonne3']
+
+def table_gains(type_pari: str) -> Tuple[List[bool], int]:
+    """Précalcule, pour chaque numéro, si le pari gagne, ainsi que son multiplicateur"""
+    jeu = Roulette()
+    pari = Pari(type_pari, None, 1, None, 1)
+    gagnants = []
+    for numero in jeu.nombres:
+        jeu.numero_gagnant = numero
+        gagnants.append(jeu.verifier_pari_gagnant(pari))
+    return gagnants, jeu.get_multiplicateur(type_pari)
+
+class Histogramme:
+    """Histogramme à nombre de classes fixe (la dernière classe reçoit les débordements)"""
+
+    def __init__(self, borne_max: float, nb_classes: int = 20):
+        self.borne_max = borne_max
+        self.nb_classes = nb_classes
+        self.largeur = borne_max / nb_classes if borne_max > 0 else 1
+        self.effectifs = [0] * (nb_classes + 1)
+
+    def ajouter(self, valeur: float):
+        """Ajoute une observation"""
+        index = int(valeur / self.largeur)
+        if index < 0:
+            index = 0
+        elif index > self.nb_classes:
+            index = self.nb_classes
+        self.effectifs[index] += 1
+
+    def fusionner(self, autre: 'Histogramme'):
+        """Ajoute les effectifs d'un autre histogramme de mêmes bornes"""
+        for i, effectif in enumerate(autre.effectifs):
+            self.effectifs[i] += effectif
+
+    def quantile(self, q: float) -> float:
+        """Estime un quantile à partir des classes (borne haute de la classe atteinte)"""
+        total = sum(self.effectifs)
+        if total == 0:
+            return 0
+        cible = q * total
+        cumul = 0
+        for i, effectif in enumerate(self.effectifs):
+            cumul += effectif
+            if cumul >= cible:
+                return min(self.borne_max, (i + 1) * self.largeur)
+        return self.borne_max
+
+class StatistiqueFlux:
+    """Moyenne, variance, minimum et maximum calculés au fil de l'eau (Welford)"""
+
+    def __init__(self):
+        self.n = 0
+        self.moyenne = 0.0
+        self.m2 = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def ajouter(self, valeur: float):
+        """Ajoute une observation"""
+        self.n += 1
+        delta = valeur - self.moyenne
+        self.moyenne += delta / self.n
+        self.m2 += delta * (valeur - self.moyenne)
+        if self.minimum is None or valeur < self.minimum:
+            self.minimum = valeur
+        if self.maximum is None or valeur > self.maximum:
+            self.maximum = valeur
+
+    def fusionner(self, autre: 'StatistiqueFlux'):
+        """Combine deux séries de statistiques indépendantes"""
+        if autre.n == 0:
+            return
+        if self.n == 0:
+            self.n, self.moyenne, self.m2 = autre.n, autre.moyenne, autre.m2
+            self.minimum, self.maximum = autre.minimum, autre.maximum
+            return
+        n = self.n + autre.n
+        delta = autre.moyenne - self.moyenne
+        self.moyenne += delta * autre.n / n
+        self.m2 += autre.m2 + delta * delta * self.n * autre.n / n
+        self.n = n
+        self.minimum = min(self.minimum, autre.minimum)
+        self.maximum = max(self.maximum, autre.maximum)
+
+    def ecart_type(self) -> float:
+        """Retourne l'écart-type de la série"""
+        return math.sqrt(self.m2 / self.n) if self.n > 1 else 0.0
+
+class AgregatSimulation:
+    """Résultats agrégés d'un ensemble de trajectoires, en mémoire constante"""
+
+    def __init__(self, solde_initial: int, nb_tours_max: int):
+        self.trajectoires = 0
+        self.ruines = 0
+        self.solde_final = StatistiqueFlux()
+        self.temps_ruine = StatistiqueFlux()
+        self.histogramme_solde = Histogramme(solde_initial * 3)
+        self.histogramme_ruine = Histogramme(nb_tours_max)
+
+    def enregistrer(self, solde_final: int, tour_ruine: int = None):
+        """Enregistre le résultat d'une trajectoire"""
+        self.trajectoires += 1
+        self.solde_final.ajouter(solde_final)
+        self.histogramme_solde.ajouter(solde_final)
+        if tour_ruine is not None:
+            self.ruines += 1
+            self.temps_ruine.ajouter(tour_ruine)
+            self.histogramme_ruine.ajouter(tour_ruine)
+
+    def fusionner(self, autre: 'AgregatSimulation'):
+        """Ajoute les résultats d'un autre agrégat"""
+        self.trajectoires += autre.trajectoires
+        self.ruines += autre.ruines
+        self.solde_final.fusionner(autre.solde_final)
+        self.temps_ruine.fusionner(autre.temps_ruine)
+        self.histogramme_solde.fusionner(autre.histogramme_solde)
+        self.histogramme_ruine.fusionner(autre.histogramme_ruine)
+
+    def probabilite_ruine(self) -> float:
+        """Retourne la proportion de trajectoires ruinées"""
+        return self.ruines / self.trajectoires if self.trajectoires else 0.0
+
+def simuler_lot(progression: str, type_pari: str, solde_initial: int, mise_base: int,
+                limite_table: int, nb_tours_max: int, nb_trajectoires: int, graine: int) -> AgregatSimulation:
+    """Simule un lot de trajectoires indépendantes et retourne leur agrégat"""
+    gagnants, multiplicateur = table_gains(type_pari)
+    generateur = random.Random(graine)
+    tirage = generateur.randrange
+    agregat = AgregatSimulation(solde_initial, nb_tours_max)
+    strategie = PROGRESSIONS[progression](mise_base)
+
+    for _ in range(nb_trajectoires):
+        strategie.reinitialiser()
+        solde = solde_initial
+        tour_ruine = None
+
+        for tour in range(1, nb_tours_max + 1):
+            # Le joueur est ruiné s'il ne peut plus poser la mise minimale
+            if solde < mise_base:
+                tour_ruine = tour - 1
+                break
+
+            mise = min(strategie.mise(), limite_table, solde)
+            solde -= mise
+            gagne = gagnants[tirage(37)]
+            if gagne:
+                solde += mise * multiplicateur
+            strategie.enregistrer(gagne)
+        else:
+            if solde < mise_base:
+                tour_ruine = nb_tours_max
+
+        agregat.enregistrer(solde, tour_ruine)
+
+    return agregat
+
+def simuler(progression: str = 'martingale', type_pari: str = 'rouge', solde_initial: int = 1000,
+            mise_base: int = 5, limite_table: int = 500, nb_tours_max: int = 1000,
+            nb_trajectoires: int = 10000, nb_processus: int = None,
+            taille_lot: int = 2000, graine: int = None) -> AgregatSimulation:
+    """Répartit les trajectoires sur un pool de processus et fusionne les résultats au fil de l'eau"""
+    if progression not in PROGRESSIONS:
+        raise ValueError(f"Progression inconnue: {progression}")
+    if type_pari not in PARIS_SIMULABLES:
+        raise ValueError(f"Pari non simulable: {type_pari}")
+
+    if graine is None:
+        graine = random.randrange(2 ** 32)
+
+    def lots():
+        restantes = nb_trajectoires
+        index = 0
+        while restantes > 0:
+            taille = min(taille_lot, restantes)
+            yield (progression, type_pari, solde_initial, mise_base, limite_table,
+                   nb_tours_max, taille, graine + index)
+            restantes -= taille
+            index += 1
+
+    agregat = AgregatSimulation(solde_initial, nb_tours_max)
+    nb_processus = nb_processus or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=nb_processus) as executeur:
+        # Au plus deux lots par processus en vol : la mémoire reste bornée quel que soit
+        # le nombre de trajectoires
+        en_cours = set()
+        for args in lots():
+            if len(en_cours) >= 2 * nb_processus:
+                terminees, en_cours = wait(en_cours, return_when=FIRST_COMPLETED)
+                for future in terminees:
+                    agregat.fusionner(future.result())
+            en_cours.add(executeur.submit(simuler_lot, *args))
+        for future in en_cours:
+            agregat.fusionner(future.result())
+    return agregat
+
+def formater_rapport(agregat: AgregatSimulation, progression: str, type_pari: str,
+                     solde_initial: int) -> str:
+    """Met en forme le rapport de simulation"""
+    lignes = [
+        f"Progression: {progression} sur {type_pari} - solde initial {solde_initial} jetons",
+        f"Trajectoires simulées: {agregat.trajectoires}",
+        f"Probabilité de ruine: {agregat.probabilite_ruine() * 100:.2f}%"
+    ]
+
+    if agregat.ruines:
+        lignes.append(f"Temps de ruine: moyenne {agregat.temps_ruine.moyenne:.1f} tours, "
+                      f"médiane ~{agregat.histogramme_ruine.quantile(0.5):.0f}, "
+                      f"min {agregat.temps_ruine.minimum}, max {agregat.temps_ruine.maximum}")
+
+    solde = agregat.solde_final
+    lignes.append(f"Solde final: moyenne {solde.moyenne:.1f}, écart-type {solde.ecart_type():.1f}, "
+                  f"min {solde.minimum}, max {solde.maximum}")
+
+    # Distribution du solde final
+    histogramme = agregat.histogramme_solde
+    for i, effectif in enumerate(histogramme.effectifs):
+        if effectif == 0:
+            continue
+        debut = i * histogramme.largeur
+        if i == histogramme.nb_classes:
+            intervalle = f">= {debut:.0f}"
+        else:
+            intervalle = f"{debut:.0f}-{debut + histogramme.largeur:.0f}"
+        proportion = effectif / agregat.trajectoires
+        lignes.append(f"  {intervalle:>12} | {'█' * int(proportion * 50):<50} {proportion * 100:.1f}%")
+
+    return '\n'.join(lignes)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulateur de progressions de mises à la roulette")
+    parser.add_argument('--progression', choices=sorted(PROGRESSIONS), default='martingale')
+    parser.add_argument('--pari', choices=PARIS_SIMULABLES, default='rouge')
+    parser.add_argument('--solde', type=int, default=1000, help="Solde de départ (solde_joueur)")
+    parser.add_argument('--mise', type=int, default=5, help="Mise de base")
+    parser.add_argument('--limite', type=int, default=500, help="Limite de la table")
+    parser.add_argument('--tours', type=int, default=1000, help="Nombre maximum de tours par trajectoire")
+    parser.add_argument('--trajectoires', type=int, default=10000)
+    parser.add_argument('--processus', type=int, default=None)
+    parser.add_argument('--graine', type=int, default=None)
+    args = parser.parse_args()
+
+    debut = time.perf_counter()
+    resultat = simuler(args.progression, args.pari, args.solde, args.mise, args.limite,
+                       args.tours, args.trajectoires, args.processus, graine=args.graine)
+    print(formater_rapport(resultat, args.progression, args.pari, args.solde))
+    print(f"Durée: {time.perf_counter() - debut:.2f} s")